@@ -0,0 +1,30 @@
+"""add matakuliah filter indexes
+
+Revision ID: 3b8d0f6c91e4
+Revises: 7c1e9a4b2d30
+Create Date: 2026-10-18 13:27:05.664213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8d0f6c91e4'
+down_revision: Union[str, Sequence[str], None] = '7c1e9a4b2d30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_matakuliah_semester_kode_mk', 'matakuliah', ['semester', 'kode_mk'], unique=False)
+    op.create_index('ix_matakuliah_sks', 'matakuliah', ['sks'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_matakuliah_sks', table_name='matakuliah')
+    op.drop_index('ix_matakuliah_semester_kode_mk', table_name='matakuliah')
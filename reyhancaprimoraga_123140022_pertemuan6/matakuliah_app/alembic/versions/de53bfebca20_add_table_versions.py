@@ -0,0 +1,35 @@
+"""add table_versions
+
+Revision ID: de53bfebca20
+Revises: f479f3e6b70b
+Create Date: 2026-10-18 09:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de53bfebca20'
+down_revision: Union[str, Sequence[str], None] = 'f479f3e6b70b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    table_versions = op.create_table('table_versions',
+    sa.Column('table_name', sa.Text(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name', name=op.f('pk_table_versions'))
+    )
+    op.bulk_insert(table_versions, [
+        {'table_name': 'matakuliah', 'version': 0},
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('table_versions')
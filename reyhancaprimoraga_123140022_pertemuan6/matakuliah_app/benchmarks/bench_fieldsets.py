@@ -0,0 +1,115 @@
+"""
+BENCHMARK - Sparse fieldset (Core select) vs jalur ORM untuk list matakuliah
+
+Membandingkan throughput (baris/detik) tiga cara membangun payload list:
+  1. orm          : query(Matakuliah) -> to_dict() per instance (jalur lama)
+  2. core_all     : Core select semua kolom -> dict(row mapping)
+  3. core_fields  : Core select kode_mk, nama_mk saja (?fields=kode_mk,nama_mk)
+
+Setiap putaran memakai session baru (identity map kosong) seperti request
+sungguhan, dan hasilnya diserialisasi dengan renderers.dumps() agar biaya
+JSON ikut terukur.
+
+Cara Menjalankan (dari direktori project):
+    python benchmarks/bench_fieldsets.py
+    python benchmarks/bench_fieldsets.py --rows 50000 --repeat 10
+"""
+import argparse
+import time
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from matakuliah_app.fieldsets import project, select_columns
+from matakuliah_app.models import Matakuliah
+from matakuliah_app.models.meta import Base
+from matakuliah_app.renderers import dumps
+
+
+FIELDS = ('kode_mk', 'nama_mk')
+
+
+def seed(engine, rows):
+    table = Matakuliah.__table__
+    with engine.begin() as connection:
+        connection.execute(insert(table), [
+            {
+                'kode_mk': f'IF{i:06d}',
+                'nama_mk': f'Matakuliah Benchmark {i}',
+                'sks': i % 4 + 1,
+                'semester': i % 8 + 1,
+            }
+            for i in range(rows)
+        ])
+
+
+def run_orm(session):
+    matakuliahs = session.query(Matakuliah).order_by(Matakuliah.id).all()
+    return [m.to_dict() for m in matakuliahs]
+
+
+def run_core_all(session):
+    table = Matakuliah.__table__
+    result = session.execute(select(table).order_by(table.c.id))
+    return [dict(row) for row in result.mappings()]
+
+
+def run_core_fields(session):
+    table = Matakuliah.__table__
+    result = session.execute(
+        select(*select_columns(table, FIELDS)).order_by(table.c.id)
+    )
+    return [project(row, FIELDS) for row in result.mappings()]
+
+
+CASES = (
+    ('orm', run_orm),
+    ('core_all', run_core_all),
+    ('core_fields', run_core_fields),
+)
+
+
+def measure(session_factory, fn, repeat):
+    best = None
+    for _ in range(repeat):
+        session = session_factory()
+        try:
+            start = time.perf_counter()
+            payload = fn(session)
+            dumps({'data': {'matakuliahs': payload}})
+            elapsed = time.perf_counter() - start
+        finally:
+            session.close()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(payload)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # SQLite in-memory: yang diukur biaya Python (ORM vs Core), bukan I/O
+    engine = create_engine(
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    seed(engine, args.rows)
+    session_factory = sessionmaker(bind=engine)
+
+    print(f"rows={args.rows} repeat={args.repeat} (best of)")
+    baseline = None
+    for name, fn in CASES:
+        elapsed, count = measure(session_factory, fn, args.repeat)
+        rate = count / elapsed
+        baseline = baseline or rate
+        print(f"{name:<12} {elapsed * 1000:9.1f} ms {rate:12,.0f} rows/s "
+              f"{rate / baseline:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,354 @@
+"""
+BENCHMARK - Load test HTTP untuk API matakuliah (waitress + SQLite)
+
+Menjalankan matakuliah_app.main di bawah waitress (proses terpisah, agar
+client load generator tidak berebut GIL dengan server) terhadap database
+SQLite sementara yang sudah di-seed (generate_matakuliah, deterministik
+per --seed), lalu menembakkan request per skenario:
+
+  list    : GET    /api/matakuliah?limit=50
+  detail  : GET    /api/matakuliah/{id}        (id acak dari data seed)
+  create  : POST   /api/matakuliah             (kode_mk unik per request)
+  update  : PUT    /api/matakuliah/{id}        (id acak dari data seed)
+  delete  : DELETE /api/matakuliah/{id}        (menghapus baris hasil create)
+
+Setiap skenario berjalan selama --duration detik dengan --concurrency
+koneksi keep-alive paralel. Hasil per skenario: jumlah request, error
+(status bukan 2xx), req/s, dan latency p50/p95/p99 (ms).
+
+Perbandingan Dengan Baseline:
+  --output menulis hasil sebagai JSON. Dengan --baseline, hasil
+  dibandingkan dengan file JSON sebelumnya; script keluar dengan exit
+  code 1 jika ada skenario yang req/s-nya turun atau p95-nya naik
+  melebihi --tolerance, atau jika ada request yang error.
+
+Cara Menjalankan (dari direktori project):
+    python benchmarks/bench_http.py --output baseline.json
+    # ... ubah kode ...
+    python benchmarks/bench_http.py --baseline baseline.json
+    python benchmarks/bench_http.py --scenarios list,detail --concurrency 16
+    python benchmarks/bench_http.py --set matakuliah.metrics.requests=false
+
+Catatan: hasil hanya sebanding jika dijalankan di mesin yang sama dengan
+parameter yang sama (--rows, --concurrency, --threads, --duration).
+"""
+import argparse
+import http.client
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+from pyramid.paster import get_appsettings
+from sqlalchemy import create_engine, insert
+
+from matakuliah_app.models import Matakuliah
+from matakuliah_app.models.meta import Base
+from matakuliah_app.scripts.generate_matakuliah import generate_matakuliah
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INI = os.path.join(os.path.dirname(HERE), 'production.ini')
+
+SCENARIOS = ('list', 'detail', 'create', 'update', 'delete')
+
+
+def seed(url, rows, seed_value):
+    # dataset sintetis yang sama dengan generate_matakuliah_app_data;
+    # deterministik per --seed sehingga run bisa dibandingkan
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    records = generate_matakuliah(rows, seed_value)
+    with engine.begin() as connection:
+        while True:
+            chunk = list(itertools.islice(records, 10000))
+            if not chunk:
+                break
+            connection.execute(insert(Matakuliah.__table__), chunk)
+    engine.dispose()
+
+
+def serve(ini, url, port, threads, overrides):
+    # Dijalankan di proses anak: app dibuat di sini agar engine / pool
+    # tidak diwarisi dari proses induk
+    import logging
+    import waitress
+
+    from matakuliah_app import main
+
+    # log per request & peringatan antrean waitress (wajar saat concurrency
+    # > threads) akan mendominasi output dan ikut membebani server
+    logging.disable(logging.INFO)
+    logging.getLogger('waitress.queue').setLevel(logging.ERROR)
+    settings = dict(get_appsettings(ini), **overrides)
+    settings['sqlalchemy.url'] = url
+    waitress.serve(main({}, **settings), host='127.0.0.1', port=port,
+                   threads=threads, _quiet=True)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server did not start on port {port}")
+
+
+class Scenario(object):
+    """
+    CLASS - Pembuat request untuk satu skenario
+
+    next_request() mengembalikan (method, path, body) atau None jika
+    skenario kehabisan data (misal delete kehabisan baris hasil create).
+    """
+
+    def __init__(self, name, rows, created):
+        self.name = name
+        self.rows = rows
+        self.created = created          # id hasil skenario create
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+
+    def next_request(self, rng):
+        if self.name == 'list':
+            return 'GET', '/api/matakuliah?limit=50', None
+        if self.name == 'detail':
+            return 'GET', f'/api/matakuliah/{rng.randint(1, self.rows)}', None
+        if self.name == 'create':
+            n = next(self.counter)
+            return 'POST', '/api/matakuliah', {
+                'kode_mk': f'BN{n:07d}', 'nama_mk': f'Benchmark {n}',
+                'sks': 3, 'semester': 1,
+            }
+        if self.name == 'update':
+            return 'PUT', f'/api/matakuliah/{rng.randint(1, self.rows)}', {
+                'sks': rng.randint(1, 6),
+            }
+        with self.lock:
+            if not self.created:
+                return None
+            return 'DELETE', f'/api/matakuliah/{self.created.pop()}', None
+
+    def record(self, status, body):
+        if self.name == 'create' and status == 201:
+            data = json.loads(body)['data']['matakuliah']
+            with self.lock:
+                self.created.append(data['id'])
+
+
+def worker(port, scenario, deadline, seed_value, latencies, errors):
+    rng = random.Random(seed_value)
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    headers = {'Content-Type': 'application/json'}
+    try:
+        while time.perf_counter() < deadline:
+            request = scenario.next_request(rng)
+            if request is None:
+                break
+            method, path, body = request
+            payload = json.dumps(body) if body is not None else None
+            start = time.perf_counter()
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException):
+                errors.append(0)
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+                continue
+            latencies.append(time.perf_counter() - start)
+            if not 200 <= response.status < 300:
+                errors.append(response.status)
+            else:
+                scenario.record(response.status, data)
+    finally:
+        conn.close()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(port, scenario, concurrency, duration, seed_value):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=worker, args=(
+            port, scenario, deadline, seed_value + i, latencies, errors,
+        ))
+        for i in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    HELPER FUNCTION - Bandingkan hasil dengan baseline
+
+    Returns:
+        list: Pesan regresi; kosong jika tidak ada
+    """
+    regressions = []
+    for name, current in results.items():
+        if current['errors']:
+            regressions.append(f"{name}: {current['errors']} failed requests")
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            continue
+        if current['rps'] < previous['rps'] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {current['rps']:.1f} req/s < baseline "
+                f"{previous['rps']:.1f} req/s (-{tolerance:.0%} allowed)"
+            )
+        if current['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']:.2f} ms > baseline "
+                f"{previous['p95_ms']:.2f} ms (+{tolerance:.0%} allowed)"
+            )
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ini', default=DEFAULT_INI,
+                        help='App settings (sqlalchemy.url is overridden)')
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='Seeded matakuliah rows')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Parallel client connections')
+    parser.add_argument('--threads', type=int, default=4,
+                        help='waitress worker threads')
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help='Seconds per scenario')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help='Comma separated subset of: ' + ', '.join(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                        dest='overrides',
+                        help='Override an app setting (repeatable), e.g. '
+                             'matakuliah.metrics.requests=false')
+    parser.add_argument('--output', help='Write results JSON here')
+    parser.add_argument('--baseline', help='Compare against this results JSON')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='Allowed relative regression (default 0.10)')
+    args = parser.parse_args(argv)
+    try:
+        args.overrides = dict(item.split('=', 1) for item in args.overrides)
+    except ValueError:
+        parser.error('--set expects KEY=VALUE')
+    args.scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.sqlite')}"
+        seed(url, args.rows, args.seed)
+
+        port = free_port()
+        server = multiprocessing.Process(
+            target=serve, args=(args.ini, url, port, args.threads, args.overrides),
+            daemon=True,
+        )
+        server.start()
+        try:
+            wait_ready(port)
+            created = []
+            results = {}
+            print(f"rows={args.rows} concurrency={args.concurrency} "
+                  f"threads={args.threads} duration={args.duration}s")
+            print(f"{'scenario':<8} {'requests':>9} {'errors':>7} {'req/s':>9} "
+                  f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+            for name in SCENARIOS:
+                if name not in args.scenarios:
+                    continue
+                scenario = Scenario(name, args.rows, created)
+                result = run_scenario(
+                    port, scenario, args.concurrency, args.duration, args.seed,
+                )
+                results[name] = result
+                print(f"{name:<8} {result['requests']:>9} {result['errors']:>7} "
+                      f"{result['rps']:>9.1f} {result['p50_ms']:>8.2f} "
+                      f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}")
+        finally:
+            server.terminate()
+            server.join()
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'rows': args.rows,
+            'seed': args.seed,
+            'concurrency': args.concurrency,
+            'threads': args.threads,
+            'duration': args.duration,
+            'settings': args.overrides,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('\nREGRESSIONS:', file=sys.stderr)
+            for message in regressions:
+                print(f'  - {message}', file=sys.stderr)
+            return 1
+        print(f"no regressions against {args.baseline} "
+              f"(tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+BENCHMARK - Biaya per request GET: pyramid_tm vs fast path read-only
+
+Dua app dibuat di proses yang sama terhadap database SQLite sementara
+yang sama (di-seed seperti bench_http.py):
+
+  tm       : matakuliah.readonly.routes kosong (setiap GET lewat
+             pyramid_tm + zope.sqlalchemy, BEGIN / COMMIT)
+  readonly : default (GET list / detail memakai session read-only
+             AUTOCOMMIT, lihat models/readonly.py)
+
+Request dikirim langsung ke WSGI app (webtest, tanpa socket) supaya
+noise jaringan / scheduler tidak menutupi selisih beberapa puluh
+mikrodetik. Kedua mode dijalankan bergantian per ronde; hasil: median
+waktu per request (µs) untuk setiap skenario. Cache detail dimatikan
+agar setiap request benar-benar query ke database.
+
+Cara Menjalankan (dari direktori project):
+    python benchmarks/bench_readonly.py
+    python benchmarks/bench_readonly.py --rounds 20 --requests 1000
+"""
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from pyramid.paster import get_appsettings
+import webtest
+
+from bench_http import DEFAULT_INI, seed
+import matakuliah_app
+
+
+MODES = {
+    'tm': {'matakuliah.readonly.routes': ''},
+    'readonly': {},
+}
+
+
+def make_app(ini, url, overrides):
+    settings = dict(get_appsettings(ini), **overrides)
+    settings.update({
+        'sqlalchemy.url': url,
+        'matakuliah.cache.enabled': 'false',
+        'matakuliah.compression.enabled': 'false',
+    })
+    return webtest.TestApp(matakuliah_app.main({}, **settings),
+                           extra_environ={'HTTP_HOST': 'localhost'})
+
+
+def timed(app, paths):
+    started = time.perf_counter()
+    for path in paths:
+        app.get(path, status=200)
+    return (time.perf_counter() - started) / len(paths)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ini', default=DEFAULT_INI,
+                        help='App settings (sqlalchemy.url is overridden)')
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='Seeded matakuliah rows')
+    parser.add_argument('--rounds', type=int, default=10,
+                        help='Alternating rounds per mode (default 10)')
+    parser.add_argument('--requests', type=int, default=500,
+                        help='Requests per scenario per round (default 500)')
+    parser.add_argument('--seed', type=int, default=1)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # log per request akan mendominasi waktu yang diukur
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    scenarios = {
+        'list': ['/api/matakuliah?limit=50'] * args.requests,
+        'detail': [f'/api/matakuliah/{rng.randint(1, args.rows)}'
+                   for _ in range(args.requests)],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.sqlite')}"
+        seed(url, args.rows, args.seed)
+        apps = {mode: make_app(args.ini, url, overrides)
+                for mode, overrides in MODES.items()}
+
+        samples = {(mode, name): [] for mode in MODES for name in scenarios}
+        for app in apps.values():
+            for paths in scenarios.values():
+                timed(app, paths[:50])  # warm up
+        for _ in range(args.rounds):
+            for mode, app in apps.items():
+                for name, paths in scenarios.items():
+                    samples[mode, name].append(timed(app, paths))
+
+    print(f"rows={args.rows} rounds={args.rounds} requests={args.requests}")
+    print(f"{'scenario':<8} {'tm µs':>9} {'readonly µs':>12} {'change':>8}")
+    for name in scenarios:
+        before = statistics.median(samples['tm', name]) * 1e6
+        after = statistics.median(samples['readonly', name]) * 1e6
+        print(f"{name:<8} {before:>9.1f} {after:>12.1f} "
+              f"{(after - before) / before:>+8.1%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
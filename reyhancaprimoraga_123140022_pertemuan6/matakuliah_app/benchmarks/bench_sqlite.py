@@ -0,0 +1,135 @@
+"""
+BENCHMARK - Concurrency baca/tulis SQLite: default vs PRAGMA produksi
+
+Membandingkan dua profil SQLite (models/sqlite.py) di bawah waitress
+dengan beberapa thread, memakai server & skenario dari bench_http.py:
+
+  default : matakuliah.sqlite.pragmas = false (rollback journal,
+            synchronous FULL; default SQLite)
+  tuned   : PRAGMA dari INI (WAL, synchronous NORMAL, mmap, dll)
+
+Setiap profil memakai database baru yang di-seed dengan data yang sama
+(journal_mode WAL tersimpan di file, jadi file tidak boleh dipakai ulang).
+Pembaca (GET /api/matakuliah/{id}) dan penulis (PUT /api/matakuliah/{id})
+berjalan bersamaan selama --duration detik; hasil per profil: req/s,
+p95 latency, dan error (misal "database is locked") untuk baca & tulis.
+
+Cara Menjalankan (dari direktori project):
+    python benchmarks/bench_sqlite.py
+    python benchmarks/bench_sqlite.py --readers 12 --writers 4 --threads 8
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from bench_http import (
+    DEFAULT_INI,
+    Scenario,
+    free_port,
+    percentile,
+    seed,
+    serve,
+    wait_ready,
+    worker,
+)
+
+
+PROFILES = {
+    'default': {'matakuliah.sqlite.pragmas': 'false'},
+    'tuned': {'matakuliah.sqlite.pragmas': 'true'},
+}
+
+
+def summarize(latencies, errors, elapsed):
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+    }
+
+
+def run_mixed(port, args):
+    reads = Scenario('detail', args.rows, [])
+    writes = Scenario('update', args.rows, [])
+    results = {'read': ([], []), 'write': ([], [])}
+    deadline = time.perf_counter() + args.duration
+    threads = []
+    for kind, scenario, count in (('read', reads, args.readers),
+                                  ('write', writes, args.writers)):
+        latencies, errors = results[kind]
+        threads.extend(
+            threading.Thread(target=worker, args=(
+                port, scenario, deadline, args.seed + len(threads) + i,
+                latencies, errors,
+            ))
+            for i in range(count)
+        )
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {kind: summarize(latencies, errors, elapsed)
+            for kind, (latencies, errors) in results.items()}
+
+
+def run_profile(args, overrides):
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.sqlite')}"
+        seed(url, args.rows, args.seed)
+        port = free_port()
+        server = multiprocessing.Process(
+            target=serve, args=(args.ini, url, port, args.threads, overrides),
+            daemon=True,
+        )
+        server.start()
+        try:
+            wait_ready(port)
+            return run_mixed(port, args)
+        finally:
+            server.terminate()
+            server.join()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ini', default=DEFAULT_INI,
+                        help='App settings (sqlalchemy.url is overridden)')
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='Seeded matakuliah rows')
+    parser.add_argument('--readers', type=int, default=6,
+                        help='Parallel reading client connections')
+    parser.add_argument('--writers', type=int, default=2,
+                        help='Parallel writing client connections')
+    parser.add_argument('--threads', type=int, default=4,
+                        help='waitress worker threads')
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help='Seconds per profile')
+    parser.add_argument('--seed', type=int, default=1)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"rows={args.rows} readers={args.readers} writers={args.writers} "
+          f"threads={args.threads} duration={args.duration}s")
+    print(f"{'profile':<8} {'read/s':>9} {'read p95':>9} {'write/s':>9} "
+          f"{'write p95':>10} {'errors':>7}")
+    for name, overrides in PROFILES.items():
+        result = run_profile(args, overrides)
+        read, write = result['read'], result['write']
+        print(f"{name:<8} {read['rps']:>9.1f} {read['p95_ms']:>9.2f} "
+              f"{write['rps']:>9.1f} {write['p95_ms']:>10.2f} "
+              f"{read['errors'] + write['errors']:>7}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+BENCHMARK - Cold start app factory: config.scan() vs view manifest
+
+Setiap run memakai interpreter baru (subprocess), sehingga waktu import
+modul ikut terukur seperti worker yang baru di-spawn. Hasil: median waktu
+total (import + main()) dan median per fase StartupProfiler (startup.py)
+untuk mode "scan" dan "manifest".
+
+Cara Menjalankan (dari direktori project):
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --ini development.ini
+"""
+import argparse
+import os
+import statistics
+import sys
+
+from pyramid.paster import get_appsettings
+
+from matakuliah_app.startup import measure_cold_start
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INI = os.path.join(os.path.dirname(HERE), 'production.ini')
+
+MANIFEST_SPEC = 'matakuliah_app:view_manifest.json'
+
+def summarize(runs):
+    phases = {}
+    for run in runs:
+        for phase in run['profile']['phases']:
+            key = ('  ' * phase['depth']) + phase['name']
+            phases.setdefault(key, []).append(phase['seconds'])
+    return (
+        statistics.median(run['seconds'] for run in runs),
+        {key: statistics.median(values) for key, values in phases.items()},
+    )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ini', default=DEFAULT_INI,
+                        help='App settings (sqlalchemy.url is overridden)')
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Cold starts per mode (default 10)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    base = dict(get_appsettings(args.ini), **{'sqlalchemy.url': 'sqlite://'})
+    base.pop('matakuliah.views.manifest', None)
+    modes = {
+        'scan': base,
+        'manifest': dict(base, **{'matakuliah.views.manifest': MANIFEST_SPEC}),
+    }
+
+    results = {}
+    for mode, settings in modes.items():
+        results[mode] = summarize([measure_cold_start(settings) for _ in range(args.runs)])
+
+    names = list(dict.fromkeys(
+        name for _, phases in results.values() for name in phases
+    ))
+    print(f"median of {args.runs} cold starts (seconds)")
+    print(f"{'phase':<30} {'scan':>9} {'manifest':>9}")
+    for name in names:
+        row = [results[mode][1].get(name) for mode in modes]
+        cells = ''.join(f"{v:>10.3f}" if v is not None else f"{'-':>10}" for v in row)
+        print(f"{name:<30}{cells}")
+    totals = ''.join(f"{results[mode][0]:>10.3f}" for mode in modes)
+    print(f"{'import + main()':<30}{totals}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,76 +5,37 @@ Modul ini menginisialisasi dan mengkonfigurasi aplikasi Pyramid dengan:
   - Database PostgreSQL (SQLAlchemy + Alembic untuk migrasi)
   - Routes (URL routing)
   - Views (handler untuk setiap endpoint)
-  - JSON Renderer (format output API)
+  - JSON Renderer compact + content negotiation (format output API)
+  - Metrics in-process (lihat metrics.py)
+  - Cache detail matakuliah LRU + TTL (lihat cache.py)
+  - Kompresi response gzip / brotli / zstd (lihat compression.py)
+  - Metrics latency per route + endpoint /metrics (lihat instrumentation.py)
   - Jinja2 Template Engine (untuk template HTML)
-  - Automatic scanning decorators (@view_config, @route_config)
+  - Automatic scanning decorators (@view_config, @route_config), atau
+    registrasi view dari manifest yang sudah direkam (lihat startup.py)
 
 Alur Inisialisasi:
   1. Configurator dibuat dengan settings dari file INI
   2. Jinja2 template engine didaftarkan
   3. Routes dan models dikonfigurasi
-  4. JSON renderer custom dengan pretty-printing ditambahkan
+  4. Metrics registry dan JSON renderer compact (renderers.py) ditambahkan
   5. config.scan() mencari semua @view_config decorators
+     (atau view didaftarkan dari matakuliah.views.manifest)
   6. WSGI app dikembalikan
+  Durasi setiap langkah dicatat StartupProfiler dan ditulis ke log.
 
 Kontribusi ke Kriteria Penilaian:
   - Dokumentasi dan Kerapian Kode: Comments lengkap dan terstruktur
 """
 from pyramid.config import Configurator
-import json
 import logging
 
+from .startup import StartupProfiler, load_view_manifest
+
 # Inisialisasi logger untuk modul ini
 log = logging.getLogger(__name__)
 
 
-
-def pretty_json_renderer(info):
-    """
-    FACTORY FUNCTION - Pembuat JSON Renderer dengan format rapi (pretty-printed)
-    
-    Fungsi ini membuat renderer yang mengkonversi data Python menjadi JSON
-    dengan format yang mudah dibaca manusia:
-      - Indentasi 2 spasi
-      - Keys diurutkan alfabetis (konsistensi)
-      - Unicode characters tidak di-escape
-    
-    Args:
-        info (dict): Informasi konfigurasi dari Pyramid
-        
-    Returns:
-        callable: Fungsi renderer yang siap digunakan
-        
-    Contoh Output:
-        {
-          "code": 200,
-          "data": {...},
-          "message": "Success",
-          "success": true,
-          "timestamp": "2025-11-26T..."
-        }
-    """
-    def renderer(value, system):
-        """
-        INNER FUNCTION - Melakukan konversi value ke JSON string
-        
-        Args:
-            value (dict): Data yang akan dikonversi ke JSON
-            system (dict): System values dari Pyramid request
-            
-        Returns:
-            str: JSON string yang sudah diformat rapi
-        """
-        # Konversi dictionary ke JSON dengan formatting
-        return json.dumps(
-            value,
-            indent=2,           # Indentasi 2 spasi untuk readability
-            sort_keys=True,     # Urutkan keys untuk konsistensi
-            ensure_ascii=False  # Izinkan karakter Unicode (e.g. Indonesian chars)
-        )
-    return renderer
-
-
 def main(global_config, **settings):
     """
     MAIN APPLICATION FACTORY - Membuat dan mengkonfigurasi aplikasi Pyramid
@@ -86,8 +47,10 @@ def main(global_config, **settings):
       1. Jinja2 template engine untuk rendering HTML
       2. Routes dari modul routes.py
       3. Database dan Models dari modul models.py
-      4. Custom JSON renderer dengan pretty-printing
-      5. Scanning automatic untuk @view_config decorators
+      4. Metrics registry dan JSON renderer compact
+         (pretty-print hanya jika diminta via ?pretty=1 / Accept header)
+      5. Scanning automatic untuk @view_config decorators, atau
+         registrasi dari manifest jika matakuliah.views.manifest diisi
     
     Args:
         global_config (dict): Konfigurasi global dari INI file
@@ -100,35 +63,80 @@ def main(global_config, **settings):
     Contoh Penggunaan (otomatis oleh pserve):
         pserve development.ini
     """
+    # Catat durasi setiap fase startup (lihat startup.py)
+    startup = StartupProfiler()
+
     # Buat Configurator object dengan settings dari INI file
     # Context manager (with) memastikan cleanup yang proper
-    with Configurator(settings=settings) as config:
+    with startup.phase('configurator'):
+        config = Configurator(settings=settings)
+    config.registry['startup_profiler'] = startup
+
+    with config:
         # Daftarkan Jinja2 sebagai template engine untuk rendering HTML
         # Ini memungkinkan penggunaan template .jinja2 di views
-        config.include('pyramid_jinja2')
+        startup.include(config, 'pyramid_jinja2')
         
         # Include semua routes dari file routes.py
         # Routes mendefinisikan URL pattern dan route names
-        config.include('.routes')
+        startup.include(config, '.routes')
+        
+        # Daftarkan metrics registry (config.registry['metrics'])
+        # Dipakai models (pool), renderer dan komponen lain untuk mencatat
+        # timing; karena itu di-include sebelum .models
+        startup.include(config, '.metrics')
         
         # Include database configuration dan model definitions
         # Setup SQLAlchemy connection dan ORM models
-        config.include('.models')
+        # (sub-fase: engine, mappers)
+        startup.include(config, '.models')
+        
+        # Daftarkan custom JSON renderer (lihat renderers.py)
+        # Semua view dengan renderer='json' menghasilkan JSON compact;
+        # pretty-print hanya jika client memintanya
+        startup.include(config, '.renderers')
+        
+        # Cache read-through in-process untuk GET /api/matakuliah/{id}
+        # (bisa dimatikan dengan matakuliah.cache.enabled = false)
+        startup.include(config, '.cache')
         
-        # Daftarkan custom JSON renderer
-        # Semua view dengan renderer='json' akan menggunakan pretty_json_renderer
-        config.add_renderer('json', pretty_json_renderer)
+        # Tween kompresi response sesuai Accept-Encoding (gzip, dan
+        # brotli / zstd jika library-nya terpasang)
+        startup.include(config, '.compression')
         
-        # PENTING: Scan semua decorators dalam package
-        # Ini mencari dan mendaftarkan:
-        #   - @view_config decorators di views/
-        #   - @route_config decorators jika ada
-        # Tanpa config.scan(), views tidak akan terdeteksi!
-        config.scan()
+        # Tween latency / status / ukuran response per route, dibaca
+        # lewat GET /metrics (format Prometheus)
+        startup.include(config, '.instrumentation')
         
-        # Log informasi bahwa aplikasi sudah terinisialisasi
-        log.info("=== Aplikasi Matakuliah siap dijalankan ===")
+        manifest = settings.get('matakuliah.views.manifest')
+        if manifest:
+            # PRODUCTION: daftarkan view dari manifest hasil scan yang
+            # sudah direkam; hanya modul view yang diimpor
+            with startup.phase('view manifest'):
+                count = load_view_manifest(config, manifest)
+            log.info(f"Registered {count} views from {manifest}")
+        else:
+            # PENTING: Scan semua decorators dalam package
+            # Ini mencari dan mendaftarkan:
+            #   - @view_config decorators di views/
+            #   - @route_config decorators jika ada
+            # Tanpa config.scan() (atau manifest), views tidak akan terdeteksi!
+            with startup.phase('scan'):
+                config.scan()
+        
+        # Semua directive (add_route, add_view, ...) baru dieksekusi
+        # saat commit; eksplisit di sini agar durasinya tercatat
+        with startup.phase('commit'):
+            config.commit()
+    
+    app = config.make_wsgi_app()
+    
+    # Laporan durasi per fase (juga tersedia di registry['startup_profile'])
+    app.registry['startup_profile'] = startup.as_dict()
+    log.info(startup.report())
+    
+    # Log informasi bahwa aplikasi sudah terinisialisasi
+    log.info("=== Aplikasi Matakuliah siap dijalankan ===")
     
     # Return WSGI application object yang siap di-deploy
-    return config.make_wsgi_app()
-
+    return app
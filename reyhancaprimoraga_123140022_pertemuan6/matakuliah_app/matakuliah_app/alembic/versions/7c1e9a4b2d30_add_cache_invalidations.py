@@ -0,0 +1,37 @@
+"""add cache_invalidations
+
+Revision ID: 7c1e9a4b2d30
+Revises: de53bfebca20
+Create Date: 2026-10-18 11:04:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e9a4b2d30'
+down_revision: Union[str, Sequence[str], None] = 'de53bfebca20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cache_invalidations',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('table_name', sa.Text(), nullable=False),
+    sa.Column('key', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_cache_invalidations')),
+    sqlite_autoincrement=True
+    )
+    op.create_index(op.f('ix_cache_invalidations_created_at'), 'cache_invalidations', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_cache_invalidations_created_at'), table_name='cache_invalidations')
+    op.drop_table('cache_invalidations')
@@ -0,0 +1,76 @@
+"""add matakuliah full-text search index
+
+Revision ID: 9e2a4c7d1f58
+Revises: 3b8d0f6c91e4
+Create Date: 2026-10-18 14:52:40.207731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e2a4c7d1f58'
+down_revision: Union[str, Sequence[str], None] = '3b8d0f6c91e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_TRIGGERS = ('matakuliah_fts_ai', 'matakuliah_fts_ad', 'matakuliah_fts_au')
+
+
+def _drop_sqlite_fts():
+    for trigger in SQLITE_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS matakuliah_fts")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # metadata.drop_all() tidak mengenal tabel FTS, jadi bersihkan dulu
+        # sisa instalasi sebelumnya lalu bangun ulang dari isi matakuliah
+        _drop_sqlite_fts()
+        op.execute(
+            "CREATE VIRTUAL TABLE matakuliah_fts USING fts5("
+            "nama_mk, content='matakuliah', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER matakuliah_fts_ai AFTER INSERT ON matakuliah BEGIN "
+            "INSERT INTO matakuliah_fts(rowid, nama_mk) "
+            "VALUES (new.id, new.nama_mk); END"
+        )
+        op.execute(
+            "CREATE TRIGGER matakuliah_fts_ad AFTER DELETE ON matakuliah BEGIN "
+            "INSERT INTO matakuliah_fts(matakuliah_fts, rowid, nama_mk) "
+            "VALUES ('delete', old.id, old.nama_mk); END"
+        )
+        op.execute(
+            "CREATE TRIGGER matakuliah_fts_au AFTER UPDATE OF nama_mk ON matakuliah BEGIN "
+            "INSERT INTO matakuliah_fts(matakuliah_fts, rowid, nama_mk) "
+            "VALUES ('delete', old.id, old.nama_mk); "
+            "INSERT INTO matakuliah_fts(rowid, nama_mk) "
+            "VALUES (new.id, new.nama_mk); END"
+        )
+        op.execute("INSERT INTO matakuliah_fts(matakuliah_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        # Index ekspresi diperbarui otomatis oleh PostgreSQL setiap
+        # INSERT/UPDATE; ekspresi harus sama dengan models/search.py
+        op.create_index(
+            'ix_matakuliah_nama_mk_fts', 'matakuliah',
+            [sa.text("to_tsvector('simple'::regconfig, nama_mk)")],
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _drop_sqlite_fts()
+    elif dialect == 'postgresql':
+        op.drop_index('ix_matakuliah_nama_mk_fts', table_name='matakuliah')
@@ -0,0 +1,196 @@
+"""
+MODUL ASSETS - Static assets dengan URL ber-fingerprint (content hash)
+
+Saat startup, setiap file di direktori static di-hash (SHA-256) SATU KALI.
+`request.static_url()` (misal di layout.jinja2) lalu menghasilkan URL yang
+memuat hash isi file:
+
+    request.static_url('matakuliah_app:static/theme.css')
+    -> http://localhost:6543/static/theme.1f0e3dad9990.css
+
+Karena URL berubah setiap kali isi file berubah, URL ber-fingerprint
+boleh di-cache browser selamanya:
+    Cache-Control: public, max-age=31536000, immutable
+Browser tidak perlu revalidasi (If-Modified-Since / 304) sama sekali.
+
+URL Tanpa Fingerprint:
+  /static/theme.css tetap dilayani static view biasa dengan max-age pendek
+  (default 3600), untuk link lama / file yang ditambahkan setelah startup.
+  Fingerprint lama (isi file sudah berubah) tidak lagi cocok dan
+  menghasilkan 404, bukan isi file baru dengan cache 1 tahun.
+
+Cara Kerja:
+  - ContentHashCacheBuster : cache buster Pyramid (add_cache_buster) yang
+                             mengganti path asli dengan path ber-hash
+  - Route 'static_fingerprinted' (didaftarkan SEBELUM static view) hanya
+    cocok untuk path ber-hash yang dikenal (route predicate), lalu
+    menyajikan file asli dengan header immutable
+
+Konfigurasi INI (opsional):
+    matakuliah.static.max_age = 3600
+    matakuliah.static.fingerprint = true
+"""
+import hashlib
+import logging
+import os
+import posixpath
+
+from pyramid.path import AssetResolver
+from pyramid.security import NO_PERMISSION_REQUIRED
+from pyramid.settings import asbool
+from pyramid.static import static_view
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+STATIC_SPEC = 'matakuliah_app:static/'
+
+# Max-age untuk URL tanpa fingerprint (perilaku lama)
+DEFAULT_MAX_AGE = 3600
+
+# 1 tahun: batas praktis max-age (RFC 9111 menyarankan <= 1 tahun)
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Panjang hash di nama file (hex); 12 digit = 48 bit, cukup untuk
+# membedakan versi file yang sama
+HASH_LENGTH = 12
+
+
+def fingerprint_path(path, digest):
+    """
+    HELPER FUNCTION - Sisipkan hash sebelum ekstensi terakhir
+
+    Contoh:
+        fingerprint_path('css/theme.css', 'abc123') -> 'css/theme.abc123.css'
+        fingerprint_path('LICENSE', 'abc123')       -> 'LICENSE.abc123'
+    """
+    directory, name = posixpath.split(path)
+    stem, ext = posixpath.splitext(name)
+    if not stem:                # dotfile seperti .htaccess
+        stem, ext = name, ''
+    return posixpath.join(directory, f'{stem}.{digest}{ext}')
+
+
+def hash_directory(root):
+    """
+    HELPER FUNCTION - Hitung content hash semua file di `root`
+
+    Args:
+        root (str): Path direktori static di filesystem
+
+    Returns:
+        dict: {path_relatif_posix: hash_hex}
+    """
+    hashes = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            full_path = os.path.join(dirpath, filename)
+            relative = os.path.relpath(full_path, root).replace(os.sep, '/')
+            digest = hashlib.sha256()
+            with open(full_path, 'rb') as f:
+                for block in iter(lambda: f.read(65536), b''):
+                    digest.update(block)
+            hashes[relative] = digest.hexdigest()[:HASH_LENGTH]
+    return hashes
+
+
+class ContentHashCacheBuster(object):
+    """
+    CLASS - Cache buster Pyramid berbasis content hash
+
+    Dipanggil Pyramid saat membuat URL static
+    (ICacheBuster: ``(request, subpath, kw) -> (subpath, kw)``).
+    File yang tidak dikenal (tidak ada saat startup) tidak diubah URL-nya.
+
+    Args:
+        root (str): Path direktori static di filesystem
+    """
+
+    def __init__(self, root):
+        hashes = hash_directory(root)
+        # path asli -> path ber-hash, dan sebaliknya untuk melayani request
+        self.manifest = {
+            path: fingerprint_path(path, digest)
+            for path, digest in hashes.items()
+        }
+        self.originals = {
+            fingerprinted: path for path, fingerprinted in self.manifest.items()
+        }
+
+    def __call__(self, request, subpath, kw):
+        return self.manifest.get(subpath, subpath), kw
+
+
+class FingerprintedAssetPredicate(object):
+    """
+    ROUTE PREDICATE - Cocok hanya untuk path ber-fingerprint yang dikenal
+
+    Path lain jatuh ke route berikutnya (static view biasa).
+    """
+
+    def __init__(self, buster, config):
+        self.buster = buster
+
+    def text(self):
+        return 'fingerprinted_asset'
+
+    phash = text
+
+    def __call__(self, info, request):
+        subpath = '/'.join(info['match'].get('subpath', ()))
+        return subpath in self.buster.originals
+
+
+class FingerprintedStaticView(object):
+    """
+    VIEW - Sajikan file asli untuk URL ber-fingerprint dengan cache immutable
+    """
+
+    def __init__(self, spec, buster):
+        self.buster = buster
+        self.static = static_view(
+            spec, cache_max_age=IMMUTABLE_MAX_AGE, use_subpath=True,
+        )
+
+    def __call__(self, context, request):
+        original = self.buster.originals['/'.join(request.subpath)]
+        request.subpath = tuple(original.split('/'))
+        response = self.static(context, request)
+        response.headers['Cache-Control'] = (
+            f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+        )
+        return response
+
+
+def includeme(config):
+    """
+    Daftarkan static view /static dan (opsional) URL ber-fingerprint.
+
+    Dipanggil dari routes.py; harus sebelum route lain agar route
+    'static_fingerprinted' dicek sebelum static view biasa.
+    """
+    settings = config.get_settings()
+    max_age = int(settings.get('matakuliah.static.max_age', DEFAULT_MAX_AGE))
+
+    if asbool(settings.get('matakuliah.static.fingerprint', True)):
+        root = AssetResolver().resolve(STATIC_SPEC).abspath()
+        buster = ContentHashCacheBuster(root)
+        config.add_route_predicate(
+            'fingerprinted_asset', FingerprintedAssetPredicate
+        )
+        config.add_route(
+            'static_fingerprinted', '/static/*subpath',
+            fingerprinted_asset=buster,
+        )
+        config.add_view(
+            FingerprintedStaticView(STATIC_SPEC, buster),
+            route_name='static_fingerprinted',
+            permission=NO_PERMISSION_REQUIRED,
+        )
+        config.add_cache_buster(STATIC_SPEC, buster)
+        log.info(f"Fingerprinted {len(buster.manifest)} static assets")
+
+    # URL tanpa fingerprint (dan URL generation untuk request.static_url)
+    config.add_static_view('static', STATIC_SPEC, cache_max_age=max_age)
@@ -0,0 +1,238 @@
+"""
+MODUL CACHE - Read-through cache in-process untuk detail Matakuliah
+
+Cache LRU + TTL yang menyimpan hasil `Matakuliah.to_dict()` berdasarkan id.
+Satu instance dibagi oleh semua thread waitress lewat
+`config.registry['matakuliah_cache']`.
+
+Sifat Cache:
+  - Bounded : maksimum `max_entries` item; item paling lama tidak dipakai
+              dibuang lebih dulu (LRU eviction)
+  - TTL     : item kadaluarsa setelah `ttl` detik walaupun tidak di-invalidate
+  - Thread-safe: semua operasi dilindungi satu lock (operasi O(1))
+
+Invalidasi:
+  Cache berlangganan ke invalidation bus (lihat models/invalidation.py).
+  Event hook session memberi tahu bus SETELAH commit berhasil, sehingga
+  request lain tidak sempat mengisi ulang cache dengan data lama yang belum
+  ter-commit; perubahan dari proses lain dibaca bus sebelum request
+  berikutnya membaca cache. Race "baca data lama -> invalidate -> simpan
+  data lama" dicegah dengan nomor generasi: put() diabaikan jika ada
+  invalidasi sejak generasi dibaca.
+
+Konfigurasi INI (opsional):
+    matakuliah.cache.enabled = true
+    matakuliah.cache.max_entries = 1024
+    matakuliah.cache.ttl = 60
+"""
+from collections import OrderedDict
+import logging
+import threading
+import time
+
+from pyramid.settings import asbool
+
+from .metrics import get_metrics
+from .models import Matakuliah
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+# Penanda cache miss (None bisa saja nilai yang valid)
+MISSING = object()
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 60.0
+
+
+class LRUCache(object):
+    """
+    CACHE - LRU bounded dengan TTL per item
+
+    Args:
+        max_entries (int): Jumlah item maksimum
+        ttl (float): Umur item dalam detik
+        clock (callable): Sumber waktu (bisa diganti di test)
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL,
+                 clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._data = OrderedDict()   # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self):
+        """Nomor generasi; naik setiap kali ada invalidasi."""
+        return self._generation
+
+    def get(self, key):
+        """
+        Ambil item dari cache.
+
+        Returns:
+            object: Nilai tersimpan, atau MISSING jika tidak ada / kadaluarsa
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, generation=None):
+        """
+        Simpan item ke cache.
+
+        Args:
+            key: Kunci cache (misal id matakuliah)
+            value: Nilai yang disimpan (JANGAN dimutasi setelah disimpan)
+            generation (int): Generasi saat data dibaca dari database;
+                              put diabaikan jika sudah ada invalidasi sejak itu
+
+        Returns:
+            bool: True jika item tersimpan
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, keys=None):
+        """
+        Hapus item tertentu, atau seluruh cache jika keys None.
+
+        Args:
+            keys (iterable|None): Kunci yang dihapus
+        """
+        with self._lock:
+            self._generation += 1
+            if keys is None:
+                self.invalidations += len(self._data)
+                self._data.clear()
+                return
+            for key in keys:
+                if self._data.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """
+        Returns:
+            dict: Counter hit/miss/eviction/expiration/invalidation + size
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'size': len(self._data),
+            }
+
+
+def get_cache(registry):
+    """
+    HELPER FUNCTION - Ambil cache dari registry
+
+    Returns:
+        LRUCache|None: None jika cache dimatikan lewat INI
+    """
+    if registry is None:
+        return None
+    return registry.get('matakuliah_cache')
+
+
+def cache_key(id):
+    """
+    HELPER FUNCTION - Normalisasi id dari URL menjadi kunci cache
+
+    Returns:
+        int|None: id integer, atau None jika id bukan angka (tidak di-cache)
+    """
+    try:
+        return int(id)
+    except (TypeError, ValueError):
+        return None
+
+
+def _invalidation_subscriber(cache):
+    def invalidate(keys):
+        # Kunci dari bus database berupa string; samakan dengan cache_key()
+        cache.invalidate(None if keys is None else map(cache_key, keys))
+    return invalidate
+
+
+def _cache_collector(cache):
+    def collect():
+        stats = cache.stats()
+        return [
+            ('matakuliah_cache_hits_total', 'counter',
+             'Detail cache hits', {(): stats['hits']}),
+            ('matakuliah_cache_misses_total', 'counter',
+             'Detail cache misses', {(): stats['misses']}),
+            ('matakuliah_cache_evictions_total', 'counter',
+             'Detail cache LRU evictions', {(): stats['evictions']}),
+            ('matakuliah_cache_expirations_total', 'counter',
+             'Detail cache TTL expirations', {(): stats['expirations']}),
+            ('matakuliah_cache_invalidations_total', 'counter',
+             'Detail cache entries removed by invalidation',
+             {(): stats['invalidations']}),
+            ('matakuliah_cache_entries', 'gauge',
+             'Detail cache current size', {(): stats['size']}),
+        ]
+    return collect
+
+
+def includeme(config):
+    """
+    Buat cache detail matakuliah, daftarkan ke invalidation bus dan
+    daftarkan counter-nya ke metrics.
+
+    Aktifkan dengan ``config.include('matakuliah_app.cache')``.
+    """
+    settings = config.get_settings()
+    if not asbool(settings.get('matakuliah.cache.enabled', True)):
+        log.info("Matakuliah detail cache disabled")
+        return
+
+    cache = LRUCache(
+        max_entries=int(settings.get(
+            'matakuliah.cache.max_entries', DEFAULT_MAX_ENTRIES
+        )),
+        ttl=float(settings.get('matakuliah.cache.ttl', DEFAULT_TTL)),
+    )
+    config.registry['matakuliah_cache'] = cache
+
+    bus = config.registry.get('invalidation_bus')
+    if bus is not None:
+        bus.subscribe(Matakuliah.__tablename__, _invalidation_subscriber(cache))
+
+    metrics = get_metrics(config.registry)
+    if metrics is not None:
+        metrics.register_collector(_cache_collector(cache))
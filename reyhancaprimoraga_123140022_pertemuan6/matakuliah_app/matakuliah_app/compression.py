@@ -0,0 +1,365 @@
+"""
+MODUL COMPRESSION - Tween kompresi response (gzip / brotli / zstd)
+
+Tween ini membungkus seluruh aplikasi dan mengompres body response sesuai
+header Accept-Encoding client:
+  - gzip  : selalu tersedia (zlib standard library)
+  - br    : jika package `brotli` terpasang
+  - zstd  : jika package `zstandard` terpasang
+Encoding dipilih berdasarkan q-value client; jika sama, urutan
+`matakuliah.compression.encodings` (preferensi server) yang menentukan.
+
+Response Buffered vs Streaming:
+  - Body yang sudah ada di memori (renderer json, dll) dikompres sekaligus
+  - Body streaming (generator seperti ?stream=1, atau file) dikompres per
+    chunk sambil dikirim, dengan flush setiap chunk agar client bisa
+    memproses data tanpa menunggu stream selesai
+  Body dengan Content-Length < min_size dikirim apa adanya (header gzip
+  dkk. membuat body kecil justru lebih besar)
+
+Response TIDAK dikompres jika:
+  - client tidak mengirim Accept-Encoding / tidak ada encoding yang cocok
+  - response sudah punya Content-Encoding (misal export yang sudah gzip)
+  - Content-Type tidak termasuk daftar `types` (misal gambar / PNG)
+  - status 204 / 206 / 304, request HEAD, atau Cache-Control: no-transform
+
+ETag:
+  Representasi terkompresi berbeda byte-nya, jadi ETag diubah menjadi weak
+  (W/"..."). If-None-Match memakai weak comparison, sehingga conditional
+  GET (lihat conditional.py) tetap menghasilkan 304.
+
+Metrics (lihat metrics.py), label `encoding`:
+  - matakuliah_compression_responses_total    (label tambahan `mode`)
+  - matakuliah_compression_input_bytes_total
+  - matakuliah_compression_output_bytes_total
+  - matakuliah_compression_saved_bytes_total
+  - matakuliah_compression_cpu_seconds_total  (CPU thread, bukan wall time)
+
+Konfigurasi INI (opsional):
+    matakuliah.compression.enabled = true
+    matakuliah.compression.min_size = 1024
+    matakuliah.compression.encodings = zstd br gzip
+    matakuliah.compression.gzip_level = 6
+    matakuliah.compression.br_level = 5
+    matakuliah.compression.zstd_level = 3
+    matakuliah.compression.types = application/json text/csv ...
+"""
+import logging
+import time
+import zlib
+
+from pyramid.settings import asbool, aslist
+
+from .metrics import get_metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - encoder opsional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - encoder opsional
+    zstandard = None
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+DEFAULT_MIN_SIZE = 1024
+
+# Preferensi server jika client memberi q-value yang sama
+DEFAULT_ENCODINGS = ('zstd', 'br', 'gzip')
+
+# Level default: kompromi CPU vs rasio untuk response dinamis
+DEFAULT_LEVELS = {'gzip': 6, 'br': 5, 'zstd': 3}
+
+# Content-Type yang layak dikompres (teks)
+DEFAULT_TYPES = (
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+    'text/css',
+    'text/csv',
+    'text/html',
+    'text/javascript',
+    'text/plain',
+    'text/xml',
+)
+
+# Status yang tidak punya body / tidak boleh diubah body-nya
+_SKIP_STATUS = (204, 206, 304)
+
+
+class _GzipEncoder(object):
+    def __init__(self, level):
+        # wbits=31 -> header & trailer gzip (bukan zlib mentah)
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._obj.compress(data)
+
+    def flush(self):
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._obj.flush()
+
+
+class _BrotliEncoder(object):
+    def __init__(self, level):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._obj.process(data)
+
+    def flush(self):
+        return self._obj.flush()
+
+    def finish(self):
+        return self._obj.finish()
+
+
+class _ZstdEncoder(object):
+    def __init__(self, level):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._obj.compress(data)
+
+    def flush(self):
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._obj.flush()
+
+
+# Nama Content-Encoding -> kelas encoder (hanya yang library-nya terpasang)
+ENCODERS = {'gzip': _GzipEncoder}
+if brotli is not None:
+    ENCODERS['br'] = _BrotliEncoder
+if zstandard is not None:
+    ENCODERS['zstd'] = _ZstdEncoder
+
+
+class CompressionPolicy(object):
+    """
+    CLASS - Settings kompresi yang sudah di-parse + negosiasi encoding
+    """
+
+    def __init__(self, settings):
+        prefix = 'matakuliah.compression.'
+        self.min_size = int(settings.get(prefix + 'min_size', DEFAULT_MIN_SIZE))
+        self.types = frozenset(aslist(settings.get(prefix + 'types', ''))
+                               or DEFAULT_TYPES)
+        wanted = aslist(settings.get(prefix + 'encodings', '')) or DEFAULT_ENCODINGS
+        missing = [name for name in wanted if name not in ENCODERS]
+        if missing:
+            log.warning(f"Compression encodings not available: {', '.join(missing)}")
+        self.encodings = [name for name in wanted if name in ENCODERS]
+        self.levels = {
+            name: int(settings.get(f'{prefix}{name}_level', DEFAULT_LEVELS[name]))
+            for name in self.encodings
+        }
+
+    def negotiate(self, request):
+        """
+        HELPER FUNCTION - Pilih encoding terbaik untuk request ini
+
+        Returns:
+            str|None: Nama encoding, atau None jika tidak ada yang cocok
+        """
+        # Tanpa header, webob menganggap semua encoding diterima; di sini
+        # kompresi hanya dipakai jika client memintanya secara eksplisit
+        if 'Accept-Encoding' not in request.headers or not self.encodings:
+            return None
+        offers = request.accept_encoding.acceptable_offers(self.encodings)
+        return offers[0][0] if offers else None
+
+    def encoder(self, encoding):
+        return ENCODERS[encoding](self.levels[encoding])
+
+    def compressible(self, request, response):
+        """
+        HELPER FUNCTION - Cek apakah response boleh dikompres
+        """
+        if request.method == 'HEAD' or response.status_code in _SKIP_STATUS:
+            return False
+        if response.content_encoding or response.content_type not in self.types:
+            return False
+        cache_control = response.headers.get('Cache-Control', '')
+        return 'no-transform' not in cache_control.lower()
+
+
+class _Stats(object):
+    """
+    HELPER CLASS - Pencatat metrics kompresi untuk satu encoding
+    """
+
+    def __init__(self, metrics, encoding, mode):
+        self.metrics = metrics
+        self.labels = (encoding,)
+        self.mode = mode
+        self.input = 0
+        self.output = 0
+        self.cpu = 0.0
+
+    def record(self):
+        if self.metrics is None:
+            return
+        metrics = self.metrics
+        metrics.counter(
+            'matakuliah_compression_responses_total',
+            'Responses compressed by the compression tween',
+            labelnames=('encoding', 'mode'),
+        ).inc(labels=self.labels + (self.mode,))
+        metrics.counter(
+            'matakuliah_compression_input_bytes_total',
+            'Response bytes before compression',
+            labelnames=('encoding',),
+        ).inc(self.input, labels=self.labels)
+        metrics.counter(
+            'matakuliah_compression_output_bytes_total',
+            'Response bytes after compression',
+            labelnames=('encoding',),
+        ).inc(self.output, labels=self.labels)
+        metrics.counter(
+            'matakuliah_compression_saved_bytes_total',
+            'Bytes saved by compression (input - output)',
+            labelnames=('encoding',),
+        ).inc(self.input - self.output, labels=self.labels)
+        metrics.counter(
+            'matakuliah_compression_cpu_seconds_total',
+            'Thread CPU time spent compressing responses',
+            labelnames=('encoding',),
+        ).inc(self.cpu, labels=self.labels)
+
+
+def _compress_body(encoder, body, stats):
+    started = time.thread_time()
+    data = encoder.compress(body) + encoder.finish()
+    stats.cpu += time.thread_time() - started
+    stats.input += len(body)
+    stats.output += len(data)
+    stats.record()
+    return data
+
+
+def iter_compressed(app_iter, encoder, stats):
+    """
+    GENERATOR - Kompres app_iter streaming chunk demi chunk
+
+    Args:
+        app_iter (iterable): Body asli (bytes per chunk)
+        encoder: Instance encoder (lihat ENCODERS)
+        stats (_Stats): Pencatat metrics, dicatat saat stream selesai
+
+    Yields:
+        bytes: Body terkompresi
+    """
+    try:
+        for chunk in app_iter:
+            if not chunk:
+                continue
+            started = time.thread_time()
+            # flush per chunk: client bisa dekompres data yang sudah
+            # diterima tanpa menunggu stream selesai
+            data = encoder.compress(chunk) + encoder.flush()
+            stats.cpu += time.thread_time() - started
+            stats.input += len(chunk)
+            stats.output += len(data)
+            if data:
+                yield data
+        started = time.thread_time()
+        data = encoder.finish()
+        stats.cpu += time.thread_time() - started
+        stats.output += len(data)
+        yield data
+        stats.record()
+    finally:
+        # client memutus koneksi: tutup generator sumber (dan session-nya)
+        close = getattr(app_iter, 'close', None)
+        if close is not None:
+            close()
+
+
+def _weaken_etag(response):
+    etag, strong = response.etag, response.etag_strong
+    if etag and strong:
+        response.headers['ETag'] = f'W/"{etag}"'
+
+
+def _add_vary(response):
+    vary = response.vary or ()
+    if 'accept-encoding' not in [v.lower() for v in vary]:
+        response.vary = tuple(vary) + ('Accept-Encoding',)
+
+
+def compression_tween_factory(handler, registry):
+    """
+    TWEEN FACTORY - Kompres response sesuai Accept-Encoding
+
+    Didaftarkan oleh includeme() di posisi paling luar (dekat INGRESS),
+    sehingga response dari exception view juga ikut dikompres.
+    """
+    policy = CompressionPolicy(registry.settings)
+    log.info(f"Response compression enabled: {', '.join(policy.encodings)} "
+             f"(min_size={policy.min_size})")
+
+    def compression_tween(request):
+        response = handler(request)
+
+        encoding = policy.negotiate(request)
+        if encoding is None:
+            return response
+        if response.status_code == 304:
+            # 304 untuk representasi terkompresi: ETag harus sama
+            # dengan yang disimpan client (weak)
+            _weaken_etag(response)
+            return response
+        if not policy.compressible(request, response):
+            return response
+
+        # representasi bergantung Accept-Encoding, termasuk saat akhirnya
+        # tidak dikompres karena terlalu kecil
+        _add_vary(response)
+        _weaken_etag(response)
+        length = response.content_length
+        if length is not None and length < policy.min_size:
+            return response
+
+        metrics = get_metrics(registry)
+        if isinstance(response.app_iter, (list, tuple)):
+            # BUFFERED: body sudah lengkap di memori (renderer json, dll)
+            stats = _Stats(metrics, encoding, 'buffered')
+            response.body = _compress_body(
+                policy.encoder(encoding), response.body, stats
+            )
+        else:
+            # STREAMING: generator / file, kompres sambil dikirim
+            # (tanpa Content-Length -> chunked transfer)
+            stats = _Stats(metrics, encoding, 'streaming')
+            response.app_iter = iter_compressed(
+                response.app_iter, policy.encoder(encoding), stats
+            )
+            response.content_length = None
+        response.content_encoding = encoding
+        return response
+
+    return compression_tween
+
+
+def includeme(config):
+    """
+    Daftarkan tween kompresi response.
+
+    Aktifkan dengan ``config.include('matakuliah_app.compression')``;
+    matikan lewat setting ``matakuliah.compression.enabled = false``.
+    """
+    settings = config.get_settings()
+    if not asbool(settings.get('matakuliah.compression.enabled', True)):
+        log.info("Response compression disabled")
+        return
+    config.add_tween('matakuliah_app.compression.compression_tween_factory')
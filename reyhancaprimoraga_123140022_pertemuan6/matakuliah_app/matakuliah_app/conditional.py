@@ -0,0 +1,78 @@
+"""
+MODUL CONDITIONAL GET - ETag & If-None-Match untuk resource API
+
+ETag dihitung dari counter versi tabel (lihat models/table_version.py)
+ditambah URL lengkap dan format output, sehingga:
+  - ETag berubah TEPAT ketika ada commit yang mengubah tabel
+  - Representasi berbeda (query string berbeda, pretty vs compact)
+    mendapat ETag berbeda (strong ETag per representasi)
+
+Alur di view GET:
+    etag = resource_etag(request, Matakuliah.__tablename__)
+    not_modified = not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified          # 304: tanpa ORM, tanpa renderer
+    ...
+    set_etag(request.response, etag)  # 200: sertakan ETag di response
+
+Biaya pengecekan hanya satu SELECT primary-key ke tabel table_versions.
+"""
+import hashlib
+
+from pyramid.httpexceptions import HTTPNotModified
+
+from .models import get_table_version
+from .renderers import wants_pretty
+
+
+# Client boleh menyimpan response, tapi wajib revalidasi (If-None-Match)
+# sebelum memakainya karena data bisa berubah kapan saja
+CACHE_CONTROL = 'no-cache'
+
+
+def resource_etag(request, table_name):
+    """
+    HELPER FUNCTION - Hitung strong ETag untuk request GET saat ini
+
+    Args:
+        request: Pyramid request
+        table_name (str): Tabel sumber data resource
+
+    Returns:
+        str: Nilai ETag tanpa tanda kutip
+    """
+    version = get_table_version(request.dbsession, table_name)
+    key = '|'.join([
+        table_name,
+        str(version),
+        request.path_qs,
+        'pretty' if wants_pretty(request) else 'compact',
+    ])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:32]
+
+
+def set_etag(response, etag):
+    """
+    HELPER FUNCTION - Pasang header ETag & Cache-Control ke response
+    """
+    response.etag = etag
+    response.headers['Cache-Control'] = CACHE_CONTROL
+
+
+def not_modified_response(request, etag):
+    """
+    HELPER FUNCTION - Buat response 304 jika If-None-Match cocok
+
+    Args:
+        request: Pyramid request
+        etag (str): ETag resource saat ini
+
+    Returns:
+        HTTPNotModified|None: Response 304, atau None jika client belum
+                              punya versi terbaru (view lanjut seperti biasa)
+    """
+    if etag not in request.if_none_match:
+        return None
+    response = HTTPNotModified()
+    set_etag(response, etag)
+    return response
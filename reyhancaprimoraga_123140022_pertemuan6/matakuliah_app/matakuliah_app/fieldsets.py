@@ -0,0 +1,87 @@
+"""
+MODUL FIELDSETS - Sparse fieldset (?fields=) tanpa hydrate object ORM
+
+Client yang hanya butuh sebagian kolom (misal dropdown: kode_mk + nama_mk)
+mengirim `?fields=kode_mk,nama_mk`. View lalu membuat Core `select()` yang
+hanya berisi kolom tersebut dan menserialisasi row mapping langsung,
+sehingga tidak ada biaya:
+  - membuat instance ORM + InstanceState per baris
+  - registrasi ke identity map session
+  - Matakuliah.to_dict() per baris
+
+Contoh:
+    >>> parse_fields('kode_mk,nama_mk', Matakuliah.__table__)
+    ('kode_mk', 'nama_mk')
+    >>> parse_fields(None, Matakuliah.__table__)  # semua kolom (jalur ORM)
+"""
+
+
+class FieldsetError(ValueError):
+    """
+    EXCEPTION - Parameter `fields` berisi kolom yang tidak dikenal / kosong
+    """
+
+
+def parse_fields(value, table):
+    """
+    HELPER FUNCTION - Validasi parameter `fields`
+
+    Args:
+        value (str|None): Daftar kolom dipisah koma
+        table (Table): Tabel sumber (misal Matakuliah.__table__)
+
+    Returns:
+        tuple|None: Nama kolom sesuai urutan permintaan (tanpa duplikat),
+                    atau None jika `fields` tidak dikirim
+
+    Raises:
+        FieldsetError: Jika ada kolom yang tidak dikenal atau daftar kosong
+    """
+    if value is None:
+        return None
+    fields = []
+    for name in value.split(','):
+        name = name.strip()
+        if name and name not in fields:
+            fields.append(name)
+    if not fields:
+        raise FieldsetError("fields must list at least one field")
+
+    unknown = [name for name in fields if name not in table.c]
+    if unknown:
+        raise FieldsetError(
+            f"Unknown field: {', '.join(unknown)} "
+            f"(available: {', '.join(table.c.keys())})"
+        )
+    return tuple(fields)
+
+
+def select_columns(table, fields, required=()):
+    """
+    HELPER FUNCTION - Kolom untuk Core select()
+
+    Args:
+        table (Table): Tabel sumber
+        fields (tuple): Kolom yang diminta client
+        required (iterable): Kolom tambahan yang dibutuhkan server
+                             (misal id & kolom sort untuk cursor)
+
+    Returns:
+        list: Objek Column, kolom diminta lebih dulu
+    """
+    names = list(fields) + [name for name in required if name not in fields]
+    return [table.c[name] for name in names]
+
+
+def project(row, fields):
+    """
+    HELPER FUNCTION - Ambil hanya kolom yang diminta dari satu row
+
+    Args:
+        row (Mapping): Row mapping hasil query Core (atau dict dari cache)
+        fields (tuple): Kolom yang diminta client
+
+    Returns:
+        dict: {nama_kolom: nilai}
+    """
+    return {name: row[name] for name in fields}
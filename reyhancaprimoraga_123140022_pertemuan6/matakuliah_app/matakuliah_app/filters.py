@@ -0,0 +1,184 @@
+"""
+MODUL FILTER - Konversi parameter filter & sort client menjadi klausa SQL
+
+Filter dipakai oleh GET /api/matakuliah (query string) dan endpoint bulk
+(PATCH/DELETE /api/matakuliah/_bulk, body JSON) untuk memilih baris secara
+set-based, tanpa memuat object ORM.
+
+Filter yang didukung:
+  - semester       : integer, semester == nilai
+  - sks            : integer, sks == nilai
+  - sks_min        : integer, sks >= nilai
+  - sks_max        : integer, sks <= nilai
+  - kode_mk_prefix : string, kode_mk diawali nilai
+
+Semua filter didukung index (lihat Matakuliah.__table_args__):
+  - semester (+ kode_mk_prefix / sort kode_mk) -> ix_matakuliah_semester_kode_mk
+  - kode_mk_prefix -> unique index kode_mk (dipakai sebagai range scan)
+  - sks / sks_min / sks_max -> ix_matakuliah_sks
+
+Contoh:
+    >>> build_criteria(Matakuliah.__table__, {"semester": 3})
+    [<BinaryExpression matakuliah.semester = :semester_1>]
+"""
+from sqlalchemy import and_
+
+
+class FilterError(ValueError):
+    """
+    EXCEPTION - Parameter filter tidak valid (key tidak dikenal / tipe salah)
+    """
+
+
+def _parse_int(name, value):
+    # Query string selalu string, body JSON bisa int; terima keduanya.
+    # Float dari JSON hanya diterima jika bulat (2.0), bukan dipotong (2.9)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        raise FilterError(f"{name} must be an integer")
+    try:
+        return int(value)
+    except ValueError:
+        raise FilterError(f"{name} must be an integer")
+
+
+def _equals(column_name):
+    def build(table, name, value):
+        return table.c[column_name] == _parse_int(name, value)
+    return build
+
+
+def _at_least(column_name):
+    def build(table, name, value):
+        return table.c[column_name] >= _parse_int(name, value)
+    return build
+
+
+def _at_most(column_name):
+    def build(table, name, value):
+        return table.c[column_name] <= _parse_int(name, value)
+    return build
+
+
+def prefix_upper_bound(prefix):
+    """
+    HELPER FUNCTION - String terkecil yang lebih besar dari semua string
+    berawalan `prefix`
+
+    Contoh: 'IF1' -> 'IF2'. Mengembalikan None jika tidak ada batas atas
+    (prefix hanya berisi karakter unicode maksimum).
+    """
+    stripped = prefix.rstrip(chr(0x10FFFF))
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+def _prefix(column_name):
+    def build(table, name, value):
+        if not isinstance(value, str) or not value:
+            raise FilterError(f"{name} must be a non-empty string")
+        column = table.c[column_name]
+        # Range `kode_mk >= 'IF1' AND kode_mk < 'IF2'` bisa memakai index
+        # B-tree, sedangkan LIKE 'IF1%' saja sering menjadi full scan
+        # (SQLite LIKE case-insensitive, PostgreSQL dengan collation non-C).
+        # LIKE tetap disertakan agar hasil tepat di collation apapun.
+        clauses = [column >= value, column.startswith(value, autoescape=True)]
+        upper = prefix_upper_bound(value)
+        if upper is not None:
+            clauses.append(column < upper)
+        return and_(*clauses)
+    return build
+
+
+# Nama filter -> fungsi pembuat klausa SQL
+FILTERS = {
+    'semester': _equals('semester'),
+    'sks': _equals('sks'),
+    'sks_min': _at_least('sks'),
+    'sks_max': _at_most('sks'),
+    'kode_mk_prefix': _prefix('kode_mk'),
+}
+
+# Kolom yang boleh dipakai untuk `sort`; awalan '-' berarti descending.
+# Urutan selalu ditambah id sebagai tie-breaker agar keyset pagination stabil.
+SORT_FIELDS = ('id', 'kode_mk', 'nama_mk', 'semester', 'sks')
+DEFAULT_SORT = ('id', False)
+
+
+def build_criteria(table, filters):
+    """
+    HELPER FUNCTION - Buat list klausa WHERE dari dictionary filter
+
+    Args:
+        table (Table): Tabel target (misal Matakuliah.__table__)
+        filters (dict): {nama_filter: nilai}
+
+    Returns:
+        list: Klausa SQL yang siap digabung dengan and_()
+
+    Raises:
+        FilterError: Jika ada filter yang tidak dikenal atau nilainya salah
+    """
+    if not isinstance(filters, dict):
+        raise FilterError("filter must be a JSON object")
+
+    unknown = sorted(set(filters) - set(FILTERS))
+    if unknown:
+        raise FilterError(f"Unknown filter: {', '.join(unknown)}")
+
+    return [FILTERS[name](table, name, value) for name, value in filters.items()]
+
+
+def filters_from_params(params):
+    """
+    HELPER FUNCTION - Ambil filter yang dikenal dari query string
+
+    Parameter lain (limit, after, sort, stream, pretty, ...) diabaikan.
+
+    Args:
+        params: request.params (MultiDict)
+
+    Returns:
+        dict: {nama_filter: nilai_string}
+    """
+    return {name: params[name] for name in FILTERS if name in params}
+
+
+def parse_sort(value):
+    """
+    HELPER FUNCTION - Validasi parameter `sort`
+
+    Args:
+        value (str|None): Misal 'kode_mk' atau '-semester'
+
+    Returns:
+        tuple: (nama_kolom, descending)
+
+    Raises:
+        FilterError: Jika kolom tidak boleh dipakai untuk sort
+    """
+    if not value:
+        return DEFAULT_SORT
+    descending = value.startswith('-')
+    field = value[1:] if descending else value
+    if field not in SORT_FIELDS:
+        raise FilterError(
+            f"sort must be one of: {', '.join(SORT_FIELDS)} (prefix '-' for descending)"
+        )
+    return field, descending
+
+
+def order_by_clauses(table, sort):
+    """
+    HELPER FUNCTION - Klausa ORDER BY untuk hasil parse_sort()
+
+    Returns:
+        list: Kolom sort + id sebagai tie-breaker, arah yang sama
+    """
+    field, descending = sort
+    columns = [table.c[field]]
+    if field != 'id':
+        columns.append(table.c.id)
+    return [c.desc() if descending else c.asc() for c in columns]
@@ -0,0 +1,334 @@
+"""
+MODUL METRICS - Counter & Histogram ringan untuk instrumentasi aplikasi
+
+Modul ini menyediakan registry metrics in-process yang disimpan di
+`config.registry['metrics']`. Komponen lain (renderer, cache, tween, dll)
+mendaftarkan metric-nya di sini.
+
+Desain "lock-light":
+  - Setiap thread waitress menulis ke shard miliknya sendiri
+    (threading.local), sehingga hot path inc()/observe() tidak memakai lock
+  - Lock hanya dipakai sekali per thread (saat shard pertama kali dibuat)
+    dan saat registry membuat metric baru
+  - Pembacaan (collect) menjumlahkan seluruh shard
+
+Exposition:
+  render_text() menghasilkan format teks Prometheus (version 0.0.4) dari
+  semua metric + collector; dilayani oleh GET /metrics (views/metrics.py).
+
+Contoh Penggunaan:
+    metrics = request.registry['metrics']
+    hist = metrics.histogram(
+        'matakuliah_json_render_seconds',
+        'Time spent serializing JSON responses',
+    )
+    hist.observe(0.0012)
+"""
+from bisect import bisect_left
+import threading
+
+
+# Bucket default (detik) untuk histogram latency
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _Metric(object):
+    """
+    BASE CLASS - Penyimpanan per-thread (shard) untuk satu metric
+
+    Subclass hanya perlu mengimplementasikan cara menulis ke shard dan
+    cara menggabungkan shard saat collect().
+    """
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def _snapshot_shards(self):
+        with self._lock:
+            shards = list(self._shards)
+        # list(dict.items()) disalin tanpa melepas GIL, aman dibaca
+        # walaupun thread pemilik shard sedang menulis
+        return [list(shard.items()) for shard in shards]
+
+
+class Counter(_Metric):
+    """
+    METRIC - Counter yang hanya bisa naik (misal jumlah request)
+    """
+    kind = 'counter'
+
+    def inc(self, amount=1, labels=()):
+        """
+        Tambah nilai counter.
+
+        Args:
+            amount (int|float): Besar kenaikan (default 1)
+            labels (tuple): Nilai label sesuai urutan labelnames
+        """
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def collect(self):
+        """
+        Returns:
+            dict: {labels_tuple: total}
+        """
+        totals = {}
+        for items in self._snapshot_shards():
+            for labels, value in items:
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+
+class Gauge(_Metric):
+    """
+    METRIC - Gauge yang bisa naik turun (misal request yang sedang diproses)
+
+    Setiap thread menulis selisih (+/-) ke shard-nya sendiri; nilai gauge
+    adalah jumlah semua shard.
+    """
+    kind = 'gauge'
+
+    def inc(self, amount=1, labels=()):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def dec(self, amount=1, labels=()):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) - amount
+
+    def collect(self):
+        """
+        Returns:
+            dict: {labels_tuple: nilai}
+        """
+        totals = {}
+        for items in self._snapshot_shards():
+            for labels, value in items:
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+
+class Histogram(_Metric):
+    """
+    METRIC - Histogram kumulatif (misal latency atau ukuran response)
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(),
+                 buckets=DEFAULT_BUCKETS):
+        super(Histogram, self).__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, labels=()):
+        """
+        Catat satu observasi.
+
+        Args:
+            value (float): Nilai observasi (detik, byte, dll)
+            labels (tuple): Nilai label sesuai urutan labelnames
+        """
+        shard = self._shard()
+        entry = shard.get(labels)
+        if entry is None:
+            # [jumlah per bucket (+Inf di akhir), sum, count]
+            entry = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def collect(self):
+        """
+        Returns:
+            dict: {labels_tuple: (bucket_counts, sum, count)}
+                  bucket_counts TIDAK kumulatif, elemen terakhir = +Inf
+        """
+        totals = {}
+        for items in self._snapshot_shards():
+            for labels, (counts, total, count) in items:
+                merged = totals.get(labels)
+                if merged is None:
+                    merged = totals[labels] = [[0] * len(counts), 0.0, 0]
+                for i, c in enumerate(counts):
+                    merged[0][i] += c
+                merged[1] += total
+                merged[2] += count
+        return {k: (v[0], v[1], v[2]) for k, v in totals.items()}
+
+
+class MetricsRegistry(object):
+    """
+    REGISTRY - Kumpulan semua metric aplikasi
+
+    Method counter()/gauge()/histogram() bersifat get-or-create sehingga aman
+    dipanggil berulang dari modul berbeda dengan nama yang sama.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, *args, **kwargs)
+        if not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} already registered as {metric.kind}")
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(),
+                  buckets=DEFAULT_BUCKETS):
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def register_collector(self, collector):
+        """
+        Daftarkan callback yang menghasilkan metric saat dibaca.
+
+        Cocok untuk nilai yang sudah dihitung di tempat lain (misal
+        statistik cache) sehingga tidak perlu dicatat dua kali.
+
+        Args:
+            collector (callable): Mengembalikan list tuple
+                (name, kind, documentation, {labels_tuple: value})
+                dengan kind 'counter' atau 'gauge'; labels_tuple berisi
+                pasangan (nama_label, nilai), atau () tanpa label
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect_callbacks(self):
+        """
+        Returns:
+            list: Gabungan hasil semua collector yang terdaftar
+        """
+        with self._lock:
+            collectors = list(self._collectors)
+        samples = []
+        for collector in collectors:
+            samples.extend(collector())
+        return samples
+
+    def __iter__(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return iter(sorted(metrics, key=lambda m: m.name))
+
+
+def _escape(value, quote=True):
+    # HELP hanya meng-escape backslash & newline; nilai label juga quote
+    value = str(value).replace('\\', '\\\\').replace('\n', '\\n')
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{n}="{_escape(v)}"' for n, v in pairs) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if value == float('inf'):
+            return '+Inf'
+        return repr(value)
+    return str(value)
+
+
+def render_text(metrics):
+    """
+    HELPER FUNCTION - Format semua metric sebagai teks Prometheus
+
+    Args:
+        metrics (MetricsRegistry): Registry metrics aplikasi
+
+    Returns:
+        str: Body untuk Content-Type text/plain; version=0.0.4
+    """
+    lines = []
+    for metric in metrics:
+        lines.append(f'# HELP {metric.name} {_escape(metric.documentation, quote=False)}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        samples = sorted(metric.collect().items())
+        if metric.kind != 'histogram':
+            for labels, value in samples:
+                lines.append(f'{metric.name}'
+                             f'{_format_labels(metric.labelnames, labels)} '
+                             f'{_format_value(value)}')
+            continue
+        for labels, (counts, total, count) in samples:
+            cumulative = 0
+            for bound, bucket in zip(metric.buckets + (float('inf'),), counts):
+                cumulative += bucket
+                le = _format_labels(metric.labelnames, labels,
+                                    [('le', _format_value(bound))])
+                lines.append(f'{metric.name}_bucket{le} {cumulative}')
+            label_text = _format_labels(metric.labelnames, labels)
+            lines.append(f'{metric.name}_sum{label_text} {_format_value(total)}')
+            lines.append(f'{metric.name}_count{label_text} {count}')
+
+    # collector: (name, kind, documentation, {labels_tuple: value}); label
+    # collector berbentuk tuple pasangan (nama, nilai)
+    for name, kind, documentation, values in metrics.collect_callbacks():
+        lines.append(f'# HELP {name} {_escape(documentation, quote=False)}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in sorted(values.items()):
+            names = [n for n, _ in labels]
+            lines.append(f'{name}{_format_labels(names, [v for _, v in labels])} '
+                         f'{_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def get_metrics(registry):
+    """
+    HELPER FUNCTION - Ambil MetricsRegistry dari Pyramid registry
+
+    Returns:
+        MetricsRegistry|None: None jika modul metrics belum di-include
+                              (misal pada DummyRequest di unit test)
+    """
+    if registry is None:
+        return None
+    return registry.get('metrics')
+
+
+def includeme(config):
+    """
+    Daftarkan MetricsRegistry ke `config.registry['metrics']`.
+
+    Aktifkan dengan ``config.include('matakuliah_app.metrics')``.
+    """
+    if config.registry.get('metrics') is None:
+        config.registry['metrics'] = MetricsRegistry()
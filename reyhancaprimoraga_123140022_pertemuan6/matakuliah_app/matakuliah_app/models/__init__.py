@@ -1,4 +1,5 @@
-from sqlalchemy import engine_from_config
+from pyramid.settings import aslist
+from sqlalchemy import engine_from_config, event, insert, inspect, select, update
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import configure_mappers
 import zope.sqlalchemy
@@ -8,22 +9,192 @@ import zope.sqlalchemy
 from .meta import Base
 from .mymodel import MyModel  # flake8: noqa
 from .matakuliah import Matakuliah 
-
-# Run ``configure_mappers`` after defining all of the models to ensure
-# all relationships can be setup.
-configure_mappers()
+from .table_version import TableVersion
+from .cache_invalidation import CacheInvalidation
+from .invalidation import make_invalidation_bus, merge_changes
+from .pool import engine_settings, pool_options
+from .readonly import (
+    DEFAULT_READONLY_ROUTES,
+    is_readonly_request,
+    readonly_engine,
+    reject_flush,
+    reject_write_statement,
+    tm_activate_hook,
+)
+from .sqlite import setup_sqlite
+from ..startup import startup_phase
 
 
 def get_engine(settings, prefix='sqlalchemy.'):
-    return engine_from_config(settings, prefix)
+    # pool sizing / pre-ping / recycle come from the backend profile in
+    # pool.py, overridable with ``sqlalchemy.pool_*`` in the INI file
+    engine = engine_from_config(
+        engine_settings(settings, prefix), prefix,
+        **pool_options(settings, prefix)
+    )
+    # WAL & friends for file based SQLite (``matakuliah.sqlite.*``)
+    setup_sqlite(engine, settings)
+    return engine
+
+
+# Tables whose writes bump ``table_versions`` on commit (used for ETags).
+VERSIONED_TABLES = frozenset([Matakuliah.__tablename__])
+
+
+def get_table_version(dbsession, table_name):
+    """
+    Return the current change counter of ``table_name``.
+
+    This is a single primary-key lookup that does not touch the ORM
+    identity map, so it is cheap enough to run on every conditional GET.
+
+    """
+    table = TableVersion.__table__
+    version = dbsession.execute(
+        select(table.c.version).where(table.c.table_name == table_name)
+    ).scalar()
+    return version or 0
+
 
+def bump_table_versions(dbsession, table_names):
+    """
+    Increment the change counter of every table in ``table_names``.
 
-def get_session_factory(engine):
+    The counter row is created on first use, so databases initialized
+    with ``Base.metadata.create_all`` work as well as migrated ones.
+
+    """
+    table = TableVersion.__table__
+    for table_name in sorted(table_names):
+        result = dbsession.execute(
+            update(table)
+            .where(table.c.table_name == table_name)
+            .values(version=table.c.version + 1)
+        )
+        if result.rowcount == 0:
+            dbsession.execute(
+                insert(table).values(table_name=table_name, version=1)
+            )
+
+
+def _record_changes(session, table, keys=None):
+    if table is not None and table.name in VERSIONED_TABLES:
+        merge_changes(
+            session.info.setdefault('changed_keys', {}), table.name, keys
+        )
+
+
+def _track_flush(session, flush_context):
+    # ORM unit-of-work writes (session.add / attribute changes / delete);
+    # after a flush every object has its primary key, so the exact rows
+    # are recorded for cache invalidation
+    for obj in session.new | session.dirty | session.deleted:
+        primary_key = inspect(obj).mapper.primary_key_from_instance(obj)
+        _record_changes(
+            session,
+            getattr(obj, '__table__', None),
+            primary_key if len(primary_key) == 1 else None,
+        )
+
+
+def _track_execute(orm_execute_state):
+    # Core / ORM-enabled INSERT, UPDATE and DELETE statements; callers that
+    # know the affected primary keys pass them as the ``changed_keys``
+    # execution option, otherwise the whole table counts as changed
+    if (orm_execute_state.is_insert or orm_execute_state.is_update
+            or orm_execute_state.is_delete):
+        _record_changes(
+            orm_execute_state.session,
+            getattr(orm_execute_state.statement, 'table', None),
+            orm_execute_state.execution_options.get('changed_keys'),
+        )
+
+
+def _bump_on_commit(session):
+    # ``before_commit`` fires before the final flush; flush now so pending
+    # ORM changes are recorded by ``_track_flush`` first
+    session.flush()
+    changes = session.info.get('changed_keys')
+    if changes:
+        bump_table_versions(session, changes)
+        bus = session.info.get('invalidation_bus')
+        if bus is not None:
+            # written in the same transaction, so other processes only
+            # ever see invalidations for committed data
+            bus.publish(session.connection(), changes)
+
+
+def _notify_on_commit(session):
+    changes = session.info.pop('changed_keys', None)
+    bus = session.info.get('invalidation_bus')
+    if changes and bus is not None:
+        bus.notify(changes)
+
+
+def _poll_on_begin(session, transaction, connection):
+    # consume invalidations published by other processes before this
+    # transaction reads anything (rate limited by the bus itself)
+    bus = session.info.get('invalidation_bus')
+    if bus is not None and transaction.parent is None:
+        bus.poll(connection)
+
+
+def _forget_changes(session):
+    session.info.pop('changed_keys', None)
+
+
+def get_session_factory(engine, invalidation_bus=None):
     factory = sessionmaker()
     factory.configure(bind=engine)
+    if invalidation_bus is not None:
+        factory.configure(info={'invalidation_bus': invalidation_bus})
+
+    # keep ``table_versions`` in step with every committed write so that
+    # ETags derived from it change exactly when the data does, and
+    # publish / consume cache invalidations through ``invalidation_bus``
+    event.listen(factory, 'after_flush', _track_flush)
+    event.listen(factory, 'do_orm_execute', _track_execute)
+    event.listen(factory, 'before_commit', _bump_on_commit)
+    event.listen(factory, 'after_commit', _notify_on_commit)
+    event.listen(factory, 'after_begin', _poll_on_begin)
+    event.listen(factory, 'after_rollback', _forget_changes)
     return factory
 
 
+def get_readonly_session_factory(engine, invalidation_bus=None):
+    """
+    Create a session factory for the read-only GET fast path.
+
+    Sessions share the engine's pool but run on AUTOCOMMIT connections
+    (see ``readonly.py``) and refuse to write.  Invalidations from other
+    processes are still polled when a session first touches the database,
+    so the cache is as fresh as on the transactional path.
+
+    """
+    factory = sessionmaker(autoflush=False)
+    factory.configure(bind=readonly_engine(engine))
+    if invalidation_bus is not None:
+        factory.configure(info={'invalidation_bus': invalidation_bus})
+
+    event.listen(factory, 'after_begin', _poll_on_begin)
+    event.listen(factory, 'before_flush', reject_flush)
+    event.listen(factory, 'do_orm_execute', reject_write_statement)
+    return factory
+
+
+def get_readonly_session(session_factory, request):
+    """
+    Get a read-only ``sqlalchemy.orm.Session`` for ``request``.
+
+    The session is not joined to any transaction manager; it is closed
+    (returning its connection to the pool) when the request finishes.
+
+    """
+    dbsession = session_factory(info={"request": request})
+    request.add_finished_callback(lambda request: dbsession.close())
+    return dbsession
+
+
 def get_tm_session(session_factory, transaction_manager, request=None):
     """
     Get a ``sqlalchemy.orm.Session`` instance backed by a transaction.
@@ -86,6 +257,27 @@ def get_tm_session(session_factory, transaction_manager, request=None):
     return dbsession
 
 
+def open_stream_session(request):
+    """
+    Get a ``sqlalchemy.orm.Session`` for streaming response bodies.
+
+    Streaming ``app_iter`` generators run after the view has returned and
+    after ``pyramid_tm`` has already closed ``request.dbsession``, so they
+    need a session that is not bound to the request transaction.
+
+    Returns a ``(dbsession, owned)`` tuple.  When ``owned`` is true the
+    caller is responsible for closing the session once the stream is
+    exhausted.  The shared ``app.dbsession`` testing hook is honoured so
+    tests can stream uncommitted fixture data.
+
+    """
+    dbsession = request.environ.get('app.dbsession')
+    if dbsession is not None:
+        return dbsession, False
+    session_factory = request.registry['dbsession_factory']
+    return session_factory(info={"request": request}), True
+
+
 def includeme(config):
     """
     Initialize the model for a Pyramid app.
@@ -107,23 +299,61 @@ def includeme(config):
     # use pyramid_retry to retry a request when transient exceptions occur
     config.include('pyramid_retry')
 
+    # Run ``configure_mappers`` after defining all of the models to ensure
+    # all relationships can be setup.  Done here rather than at import time
+    # so that importing the models (alembic, scripts) stays cheap and the
+    # cost shows up as its own phase in the startup report.
+    with startup_phase(config.registry, 'mappers'):
+        configure_mappers()
+
     # hook to share the dbengine fixture in testing
     dbengine = settings.get('dbengine')
     if not dbengine:
-        dbengine = get_engine(settings)
+        with startup_phase(config.registry, 'engine'):
+            dbengine = get_engine(settings)
+    config.registry['dbengine'] = dbengine
 
-    session_factory = get_session_factory(dbengine)
+    # checked-out / idle connections, checkout wait time, overflow
+    config.include('.pool')
+
+    # count statements / DB time per request, log slow statements
+    config.include('.query_stats')
+
+    # cache invalidation channel shared by every session of this process
+    invalidation_bus = make_invalidation_bus(settings)
+    config.registry['invalidation_bus'] = invalidation_bus
+
+    session_factory = get_session_factory(dbengine, invalidation_bus)
     config.registry['dbsession_factory'] = session_factory
 
+    # GET / HEAD on these routes skip pyramid_tm and use a read-only
+    # AUTOCOMMIT session (see readonly.py)
+    readonly_routes = frozenset(aslist(settings.get(
+        'matakuliah.readonly.routes', DEFAULT_READONLY_ROUTES
+    )))
+    readonly_factory = None
+    if readonly_routes:
+        config.registry['readonly_routes'] = readonly_routes
+        readonly_factory = get_readonly_session_factory(
+            dbengine, invalidation_bus
+        )
+        config.registry['readonly_session_factory'] = readonly_factory
+        settings.setdefault('tm.activate_hook', tm_activate_hook)
+    config.add_request_method(is_readonly_request, 'readonly', reify=True)
+
     # make request.dbsession available for use in Pyramid
     def dbsession(request):
         # hook to share the dbsession fixture in testing
         dbsession = request.environ.get('app.dbsession')
         if dbsession is None:
-            # request.tm is the transaction manager used by pyramid_tm
-            dbsession = get_tm_session(
-                session_factory, request.tm, request=request
-            )
+            if request.readonly:
+                # no transaction manager, no COMMIT round trip
+                dbsession = get_readonly_session(readonly_factory, request)
+            else:
+                # request.tm is the transaction manager used by pyramid_tm
+                dbsession = get_tm_session(
+                    session_factory, request.tm, request=request
+                )
         return dbsession
 
     config.add_request_method(dbsession, reify=True)
@@ -0,0 +1,288 @@
+"""
+MODUL BULK - Operasi tulis set-based untuk tabel matakuliah
+
+Fungsi di modul ini memakai SQLAlchemy Core (bukan ORM unit-of-work)
+sehingga ribuan baris bisa ditulis dengan sedikit statement:
+  - bulk_insert_matakuliah: multi-row INSERT per batch
+  - bulk_update_matakuliah: satu UPDATE ... WHERE untuk semua baris
+  - bulk_delete_matakuliah: satu DELETE ... WHERE untuk semua baris
+  - upsert_matakuliah     : multi-row INSERT ... ON CONFLICT (kode_mk)
+                            DO UPDATE per batch
+
+Semua fungsi menerima `dbsession` yang sudah terikat ke transaksi
+(pyramid_tm / transaction.manager). Karena statement Core tidak melewati
+ORM flush, session ditandai "changed" lewat zope.sqlalchemy.mark_changed()
+agar transaksi benar-benar di-commit.
+
+Jika id baris yang terpengaruh diketahui (argumen `keys`), id tersebut
+dititipkan sebagai execution option `changed_keys` sehingga invalidasi
+cache hanya menyentuh baris itu, bukan seluruh tabel.
+"""
+import importlib
+
+from sqlalchemy import delete, insert, select, update
+import zope.sqlalchemy
+
+from .invalidation import merge_changes
+from .matakuliah import Matakuliah
+
+
+# Jumlah baris per statement INSERT multi-row.
+# 500 baris x 4 kolom = 2000 bind parameter, aman untuk SQLite & PostgreSQL.
+DEFAULT_BATCH_SIZE = 500
+
+
+# Kolom yang ditimpa saat kode_mk sudah ada (id & kode_mk tidak berubah)
+UPSERT_UPDATE_FIELDS = ('nama_mk', 'sks', 'semester')
+
+# Nama dialect SQLAlchemy -> modul dengan konstruktor INSERT yang punya
+# on_conflict_do_update. Modul baru diimpor saat upsert pertama: mengimpor
+# sqlalchemy.dialects.postgresql saja memakan ~40ms startup, padahal
+# deployment SQLite tidak pernah membutuhkannya.
+UPSERT_DIALECTS = {
+    'sqlite': 'sqlalchemy.dialects.sqlite',
+    'postgresql': 'sqlalchemy.dialects.postgresql',
+}
+
+
+class UpsertUnavailable(Exception):
+    """
+    EXCEPTION - Database aktif tidak mendukung INSERT ... ON CONFLICT
+    """
+
+
+def iter_batches(items, batch_size):
+    """
+    HELPER FUNCTION - Potong list menjadi batch berukuran batch_size
+    """
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def find_existing_kode_mk(dbsession, kode_mks, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    HELPER FUNCTION - Cari kode_mk yang sudah ada di database
+
+    Args:
+        dbsession (Session): Session aktif
+        kode_mks (list): Daftar kode_mk yang akan dicek
+        batch_size (int): Jumlah kode per query IN (...)
+
+    Returns:
+        set: kode_mk yang sudah terdaftar
+    """
+    table = Matakuliah.__table__
+    existing = set()
+    for batch in iter_batches(list(kode_mks), batch_size):
+        rows = dbsession.execute(
+            select(table.c.kode_mk).where(table.c.kode_mk.in_(batch))
+        )
+        existing.update(row.kode_mk for row in rows)
+    return existing
+
+
+def _multi_row(stmt, batch_size):
+    # executemany + RETURNING dijalankan SQLAlchemy sebagai satu
+    # INSERT ... VALUES (...), (...) per halaman ("insertmanyvalues").
+    # SQL-nya di-compile sekali dan di-cache, berbeda dengan
+    # insert().values(batch) yang di-compile ulang untuk setiap batch
+    # (~75% waktu import pada 200 ribu baris)
+    return stmt.execution_options(insertmanyvalues_page_size=batch_size)
+
+
+def bulk_insert_matakuliah(dbsession, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    FUNGSI UTAMA - Insert banyak matakuliah dengan multi-row INSERT
+
+    Satu statement `INSERT INTO matakuliah (...) VALUES (...), (...), ...`
+    dijalankan per batch (lihat _multi_row). Jika dialect mendukung RETURNING (PostgreSQL,
+    SQLite >= 3.35) id langsung dibaca dari statement yang sama; jika tidak,
+    id diambil dengan satu SELECT per batch.
+
+    Args:
+        dbsession (Session): Session yang terikat ke transaksi
+        rows (list): List dict yang SUDAH divalidasi
+                     (kode_mk, nama_mk, sks, semester)
+        batch_size (int): Jumlah baris per statement
+
+    Returns:
+        list: id baris baru, urutannya sama dengan `rows`
+    """
+    if not rows:
+        return []
+
+    table = Matakuliah.__table__
+    use_returning = dbsession.get_bind().dialect.insert_returning
+    ids_by_kode = {}
+
+    for batch in iter_batches(rows, batch_size):
+        if use_returning:
+            result = dbsession.execute(
+                _multi_row(insert(table).returning(table.c.id, table.c.kode_mk),
+                           batch_size),
+                batch,
+            )
+        else:
+            dbsession.execute(insert(table), batch)
+            result = dbsession.execute(
+                select(table.c.id, table.c.kode_mk).where(
+                    table.c.kode_mk.in_([row['kode_mk'] for row in batch])
+                )
+            )
+        # kode_mk unik, jadi aman dipakai untuk memetakan id ke input
+        ids_by_kode.update((r.kode_mk, r.id) for r in result)
+
+    zope.sqlalchemy.mark_changed(dbsession)
+    return [ids_by_kode[row['kode_mk']] for row in rows]
+
+
+def _with_keys(stmt, keys):
+    # Lihat _track_execute di models/__init__.py
+    if keys is None:
+        return stmt
+    return stmt.execution_options(changed_keys=tuple(keys))
+
+
+def _select_rows(dbsession, table, where):
+    result = dbsession.execute(select(table).where(where).order_by(table.c.id))
+    return [dict(row) for row in result.mappings()]
+
+
+def bulk_update_matakuliah(dbsession, where, values, returning=False,
+                           keys=None):
+    """
+    FUNGSI UTAMA - UPDATE set-based tanpa hydrate object ORM
+
+    Args:
+        dbsession (Session): Session yang terikat ke transaksi
+        where: Klausa WHERE (misal table.c.semester == 3)
+        values (dict): Kolom yang diubah, SUDAH divalidasi
+        returning (bool): True untuk ikut mengembalikan baris yang berubah
+        keys (iterable|None): id yang dicakup `where`, jika diketahui
+
+    Returns:
+        tuple: (jumlah_baris, list_baris_atau_None)
+    """
+    table = Matakuliah.__table__
+    stmt = _with_keys(update(table).where(where).values(**values), keys)
+
+    if not returning:
+        count = dbsession.execute(stmt).rowcount
+        rows = None
+    elif dbsession.get_bind().dialect.update_returning:
+        result = dbsession.execute(stmt.returning(*table.c))
+        rows = sorted((dict(r) for r in result.mappings()), key=lambda r: r['id'])
+        count = len(rows)
+    else:
+        # Fallback tanpa RETURNING: kunci dulu id yang cocok, lalu baca ulang
+        ids = list(dbsession.scalars(select(table.c.id).where(where)))
+        count = dbsession.execute(_with_keys(
+            update(table).where(table.c.id.in_(ids)).values(**values), ids
+        )).rowcount
+        rows = _select_rows(dbsession, table, table.c.id.in_(ids))
+
+    zope.sqlalchemy.mark_changed(dbsession)
+    return count, rows
+
+
+def bulk_delete_matakuliah(dbsession, where, returning=False, keys=None):
+    """
+    FUNGSI UTAMA - DELETE set-based tanpa hydrate object ORM
+
+    Args:
+        dbsession (Session): Session yang terikat ke transaksi
+        where: Klausa WHERE
+        returning (bool): True untuk ikut mengembalikan baris yang dihapus
+        keys (iterable|None): id yang dicakup `where`, jika diketahui
+
+    Returns:
+        tuple: (jumlah_baris, list_baris_atau_None)
+    """
+    table = Matakuliah.__table__
+    stmt = _with_keys(delete(table).where(where), keys)
+
+    if not returning:
+        count = dbsession.execute(stmt).rowcount
+        rows = None
+    elif dbsession.get_bind().dialect.delete_returning:
+        result = dbsession.execute(stmt.returning(*table.c))
+        rows = sorted((dict(r) for r in result.mappings()), key=lambda r: r['id'])
+        count = len(rows)
+    else:
+        # Fallback tanpa RETURNING: baca baris dulu, lalu hapus berdasarkan id
+        rows = _select_rows(dbsession, table, where)
+        ids = [row['id'] for row in rows]
+        count = dbsession.execute(_with_keys(
+            delete(table).where(table.c.id.in_(ids)), ids
+        )).rowcount
+
+    zope.sqlalchemy.mark_changed(dbsession)
+    return count, rows
+
+
+def upsert_matakuliah(dbsession, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    FUNGSI UTAMA - Insert atau update matakuliah berdasarkan kode_mk
+
+    Satu statement per batch:
+        INSERT INTO matakuliah (...) VALUES (...), (...)
+        ON CONFLICT (kode_mk) DO UPDATE
+            SET nama_mk = excluded.nama_mk, sks = ..., semester = ...
+        RETURNING *
+    Database sendiri yang memutuskan insert atau update secara atomik,
+    jadi tidak ada SELECT lebih dulu dan tidak ada race dengan writer lain
+    yang berujung IntegrityError pada uq_matakuliah_kode_mk.
+
+    Args:
+        dbsession (Session): Session yang terikat ke transaksi
+        rows (list): List dict yang SUDAH divalidasi; kode_mk tidak boleh
+                     duplikat di dalam satu pemanggilan (PostgreSQL menolak
+                     ON CONFLICT yang menyentuh baris sama dua kali)
+        batch_size (int): Jumlah baris per statement
+
+    Returns:
+        list: Dict baris hasil (termasuk id), urutannya sama dengan `rows`
+
+    Raises:
+        UpsertUnavailable: Jika dialect database tidak didukung
+    """
+    if not rows:
+        return []
+
+    dialect = dbsession.get_bind().dialect
+    if dialect.name not in UPSERT_DIALECTS:
+        raise UpsertUnavailable(f"Upsert is not supported on {dialect.name}")
+
+    table = Matakuliah.__table__
+    make_insert = importlib.import_module(UPSERT_DIALECTS[dialect.name]).insert
+    rows_by_kode = {}
+
+    stmt = make_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.kode_mk],
+        set_={name: stmt.excluded[name] for name in UPSERT_UPDATE_FIELDS},
+    )
+    # id baru diketahui setelah statement jalan; changed_keys=() agar
+    # _track_execute tidak menganggap seluruh tabel berubah, id yang
+    # sebenarnya dicatat di bawah
+    stmt = _with_keys(stmt, ())
+
+    for batch in iter_batches(rows, batch_size):
+        if dialect.insert_returning:
+            result = dbsession.execute(
+                _multi_row(stmt.returning(*table.c), batch_size), batch
+            )
+        else:
+            dbsession.execute(stmt, batch)
+            result = dbsession.execute(select(table).where(
+                table.c.kode_mk.in_([row['kode_mk'] for row in batch])
+            ))
+        rows_by_kode.update((r['kode_mk'], dict(r)) for r in result.mappings())
+
+    merge_changes(
+        dbsession.info.setdefault('changed_keys', {}),
+        table.name,
+        [row['id'] for row in rows_by_kode.values()],
+    )
+    zope.sqlalchemy.mark_changed(dbsession)
+    return [rows_by_kode[row['kode_mk']] for row in rows]
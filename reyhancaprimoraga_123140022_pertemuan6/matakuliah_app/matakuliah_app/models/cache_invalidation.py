@@ -0,0 +1,45 @@
+"""
+MODUL MODEL CACHE INVALIDATION - Log perubahan untuk invalidasi antar proses
+
+Setiap transaksi yang mengubah tabel ter-track menulis baris ke tabel ini
+DI DALAM transaksi yang sama (lihat models/invalidation.py), sehingga log
+hanya berisi perubahan yang benar-benar ter-commit. Proses waitress lain
+membaca baris baru secara berkala dan menghapus entry cache lokalnya.
+"""
+from sqlalchemy import BigInteger, Column, DateTime, Integer, Text
+from .meta import Base
+
+
+class CacheInvalidation(Base):
+    """
+    MODEL CACHE INVALIDATION - Satu baris per kunci yang berubah
+
+    Atribut:
+      - id (BigInteger, PK): Urutan monoton; dipakai sebagai cursor polling
+      - table_name (Text): Tabel yang berubah, misal 'matakuliah'
+      - key (Text, nullable): Primary key baris yang berubah;
+                              NULL berarti seluruh tabel harus di-invalidate
+      - created_at (DateTime, index): Waktu publish (UTC), untuk pruning
+    """
+    __tablename__ = 'cache_invalidations'
+    # AUTOINCREMENT di SQLite: id tidak dipakai ulang setelah pruning,
+    # sehingga cursor polling tidak pernah mundur
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    id = Column(
+        # SQLite hanya mengenal AUTOINCREMENT untuk INTEGER PRIMARY KEY
+        BigInteger().with_variant(Integer, 'sqlite'),
+        primary_key=True,
+    )
+    table_name = Column(Text, nullable=False)
+    key = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return (
+            f"<CacheInvalidation("
+            f"id={self.id}, "
+            f"table_name='{self.table_name}', "
+            f"key={self.key!r}"
+            f")>"
+        )
@@ -0,0 +1,312 @@
+"""
+MODUL INVALIDATION BUS - Kanal invalidasi cache antar proses
+
+Cache in-process (lihat cache.py) hanya tahu perubahan yang dibuat oleh
+proses itu sendiri. Saat beberapa proses waitress berjalan di belakang load
+balancer, perubahan dari proses lain harus disebarkan lewat bus ini.
+
+Event hook di models/__init__.py memakai bus dengan alur:
+  1. before_commit : publish(connection, changes) di transaksi penulis
+  2. after_commit  : notify(changes) untuk subscriber di proses yang sama
+  3. after_begin   : poll(connection) untuk membaca perubahan proses lain
+
+Format `changes`: {nama_tabel: set(primary_key) | None}
+None berarti seluruh tabel berubah (misal UPDATE/DELETE set-based).
+
+Backend:
+  - local    : tanpa kanal antar proses (cukup untuk satu proses)
+  - database : log perubahan di tabel `cache_invalidations` pada database
+               yang sama (`sqlalchemy.url`), tanpa service tambahan
+
+Batas Staleness (backend database):
+  Setiap proses mem-poll paling lama `poll_interval` detik sekali, tepat
+  saat request berikutnya membuka transaksi (sebelum cache dibaca). Jadi
+  data dari cache tidak pernah lebih tua dari `poll_interval` setelah
+  commit di proses lain. Id log yang belum terlihat (transaksi penulis
+  lain belum commit) ditunggu maksimal `gap_timeout` detik.
+
+Konfigurasi INI (opsional):
+    matakuliah.invalidation.backend = database
+    matakuliah.invalidation.poll_interval = 1
+    matakuliah.invalidation.retention = 3600
+"""
+from datetime import datetime, timedelta, timezone
+import logging
+import threading
+import time
+
+from sqlalchemy import delete, func, insert, select
+
+from .cache_invalidation import CacheInvalidation
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_RETENTION = 3600.0
+DEFAULT_GAP_TIMEOUT = 30.0
+
+# Lebih dari ini kunci per tabel dalam satu commit -> publish "seluruh tabel"
+DEFAULT_MAX_KEYS = 100
+
+# Baris log maksimum per poll; jika terlampaui semua subscriber di-reset
+DEFAULT_POLL_LIMIT = 1000
+
+# Jeda minimum antar pruning baris log lama (detik)
+PRUNE_INTERVAL = 60.0
+
+
+def merge_changes(changes, table_name, keys):
+    """
+    HELPER FUNCTION - Gabungkan perubahan ke dict {tabel: set|None}
+
+    Args:
+        changes (dict): Dict tujuan (dimutasi)
+        table_name (str): Nama tabel
+        keys (iterable|None): Primary key yang berubah; None = seluruh tabel
+    """
+    if keys is None:
+        changes[table_name] = None
+        return
+    current = changes.setdefault(table_name, set())
+    if current is not None:
+        current.update(keys)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class InvalidationBus(object):
+    """
+    BASE CLASS - Registry subscriber + notifikasi lokal
+
+    Subclass mengimplementasikan publish() dan poll() untuk kanal antar
+    proses. Callback subscriber menerima satu argumen: set primary key
+    yang berubah, atau None jika seluruh tabel harus di-invalidate.
+    """
+    name = None
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, table_name, callback):
+        """
+        Daftarkan callback untuk perubahan pada `table_name`.
+        """
+        with self._lock:
+            self._subscribers.setdefault(table_name, []).append(callback)
+
+    def unsubscribe(self, table_name, callback):
+        """
+        Hapus callback yang didaftarkan lewat subscribe().
+        """
+        with self._lock:
+            self._subscribers.get(table_name, []).remove(callback)
+
+    def notify(self, changes):
+        """
+        Jalankan callback subscriber untuk setiap tabel di `changes`.
+
+        Error di satu callback dicatat dan tidak menghentikan callback lain.
+        """
+        with self._lock:
+            subscribers = {k: list(v) for k, v in self._subscribers.items()}
+        for table_name, keys in changes.items():
+            for callback in subscribers.get(table_name, ()):
+                try:
+                    callback(keys)
+                except Exception:
+                    log.exception(
+                        f"Invalidation callback failed for table {table_name}"
+                    )
+
+    def publish(self, connection, changes):
+        """
+        Tulis perubahan ke kanal antar proses (di transaksi penulis).
+        """
+
+    def poll(self, connection):
+        """
+        Baca perubahan dari proses lain dan jalankan notify().
+        """
+
+
+class LocalInvalidationBus(InvalidationBus):
+    """
+    BACKEND LOCAL - Hanya notifikasi dalam proses (deployment satu proses)
+    """
+    name = 'local'
+
+
+class DatabaseInvalidationBus(InvalidationBus):
+    """
+    BACKEND DATABASE - Log perubahan di tabel `cache_invalidations`
+
+    Args:
+        poll_interval (float): Jeda minimum antar poll (detik)
+        retention (float): Umur baris log sebelum dihapus (detik)
+        gap_timeout (float): Lama menunggu id log yang belum terlihat
+        max_keys (int): Batas kunci per tabel sebelum publish seluruh tabel
+        poll_limit (int): Batas baris log per poll
+        clock (callable): Sumber waktu monotonic (bisa diganti di test)
+    """
+    name = 'database'
+
+    def __init__(self, poll_interval=DEFAULT_POLL_INTERVAL,
+                 retention=DEFAULT_RETENTION,
+                 gap_timeout=DEFAULT_GAP_TIMEOUT,
+                 max_keys=DEFAULT_MAX_KEYS,
+                 poll_limit=DEFAULT_POLL_LIMIT,
+                 clock=time.monotonic):
+        super(DatabaseInvalidationBus, self).__init__()
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.gap_timeout = gap_timeout
+        self.max_keys = max_keys
+        self.poll_limit = poll_limit
+        self._clock = clock
+        self._poll_lock = threading.Lock()
+        self._next_poll = 0.0
+        self._next_prune = 0.0
+        # Semua id <= low_water sudah diproses; id di atasnya yang sudah
+        # diproses disimpan di _seen sampai celahnya tertutup
+        self._low_water = None
+        self._seen = set()
+        self._gap_since = None
+
+    def publish(self, connection, changes):
+        table = CacheInvalidation.__table__
+        now = _utcnow()
+        rows = []
+        for table_name, keys in sorted(changes.items()):
+            if keys is None or len(keys) > self.max_keys:
+                rows.append(
+                    {'table_name': table_name, 'key': None, 'created_at': now}
+                )
+                continue
+            rows.extend(
+                {'table_name': table_name, 'key': str(key), 'created_at': now}
+                for key in sorted(keys, key=str)
+            )
+        if rows:
+            connection.execute(insert(table), rows)
+        self._prune(connection, now)
+
+    def _prune(self, connection, now):
+        # Dilakukan oleh penulis (bukan di poll) agar request GET tetap
+        # read-only; paling sering sekali per PRUNE_INTERVAL per proses
+        tick = self._clock()
+        if tick < self._next_prune:
+            return
+        self._next_prune = tick + PRUNE_INTERVAL
+        table = CacheInvalidation.__table__
+        cutoff = now - timedelta(seconds=self.retention)
+        connection.execute(delete(table).where(table.c.created_at < cutoff))
+
+    def poll(self, connection):
+        tick = self._clock()
+        if tick < self._next_poll:
+            return
+        # Hanya satu thread yang poll; thread lain langsung lanjut
+        if not self._poll_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_poll = tick + self.poll_interval
+            changes = self._read_changes(connection, tick)
+        finally:
+            self._poll_lock.release()
+        if changes:
+            self.notify(changes)
+
+    def _max_id(self, connection):
+        table = CacheInvalidation.__table__
+        return connection.execute(select(func.max(table.c.id))).scalar() or 0
+
+    def _read_changes(self, connection, tick):
+        if self._low_water is None:
+            # Start proses: cache masih kosong, log lama tidak relevan
+            self._low_water = self._max_id(connection)
+            return None
+
+        table = CacheInvalidation.__table__
+        rows = connection.execute(
+            select(table.c.id, table.c.table_name, table.c.key)
+            .where(table.c.id > self._low_water)
+            .order_by(table.c.id)
+            .limit(self.poll_limit)
+        ).all()
+
+        if len(rows) >= self.poll_limit:
+            # Terlalu tertinggal: lebih murah mengosongkan semua cache
+            log.warning("Invalidation log backlog exceeded, resetting caches")
+            self._low_water = self._max_id(connection)
+            self._seen.clear()
+            self._gap_since = None
+            return {table_name: None for table_name in self._subscribers}
+
+        changes = {}
+        for row in rows:
+            if row.id in self._seen:
+                continue
+            self._seen.add(row.id)
+            merge_changes(
+                changes, row.table_name,
+                None if row.key is None else [row.key],
+            )
+        self._advance(tick)
+        return changes
+
+    def _advance(self, tick):
+        while self._seen:
+            next_id = self._low_water + 1
+            if next_id in self._seen:
+                self._seen.remove(next_id)
+                self._low_water = next_id
+                self._gap_since = None
+                continue
+            # Ada id lebih besar yang sudah terlihat: next_id milik transaksi
+            # yang belum commit, atau hilang karena rollback (sequence)
+            if self._gap_since is None:
+                self._gap_since = tick
+            if tick - self._gap_since < self.gap_timeout:
+                return
+            self._low_water = next_id
+        self._gap_since = None
+
+
+BACKENDS = {
+    LocalInvalidationBus.name: LocalInvalidationBus,
+    DatabaseInvalidationBus.name: DatabaseInvalidationBus,
+}
+
+
+def make_invalidation_bus(settings):
+    """
+    HELPER FUNCTION - Buat bus invalidasi dari settings INI
+
+    Args:
+        settings (dict): Settings aplikasi
+
+    Returns:
+        InvalidationBus: Backend sesuai `matakuliah.invalidation.backend`
+    """
+    name = settings.get('matakuliah.invalidation.backend', 'local')
+    if name not in BACKENDS:
+        log.warning(f"Invalidation backend '{name}' is not available, using 'local'")
+        name = 'local'
+    if name == 'local':
+        return LocalInvalidationBus()
+    return DatabaseInvalidationBus(
+        poll_interval=float(settings.get(
+            'matakuliah.invalidation.poll_interval', DEFAULT_POLL_INTERVAL
+        )),
+        retention=float(settings.get(
+            'matakuliah.invalidation.retention', DEFAULT_RETENTION
+        )),
+        gap_timeout=float(settings.get(
+            'matakuliah.invalidation.gap_timeout', DEFAULT_GAP_TIMEOUT
+        )),
+    )
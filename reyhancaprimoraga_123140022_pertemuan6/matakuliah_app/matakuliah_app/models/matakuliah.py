@@ -14,7 +14,7 @@ Kontribusi ke Kriteria Penilaian:
   - Model Data (30%): Atribut lengkap, validasi, method to_dict()
   - Dokumentasi dan Kerapian Kode: Comments dan docstrings lengkap
 """
-from sqlalchemy import Column, Integer, Text
+from sqlalchemy import Column, Index, Integer, Text
 from .meta import Base
 
 
@@ -101,6 +101,16 @@ class Matakuliah(Base):
     # Nama tabel di database PostgreSQL yang akan digunakan
     __tablename__ = 'matakuliah'
     
+    # ========== INDEX PENDUKUNG FILTER & SORT ==========
+    # - (semester, kode_mk): filter semester, opsional dengan prefix kode_mk
+    #   atau sort kode_mk, menjadi satu index range scan yang sudah terurut
+    # - sks: filter sks / sks_min / sks_max
+    # Prefix kode_mk tanpa semester memakai unique index kode_mk.
+    __table_args__ = (
+        Index('ix_matakuliah_semester_kode_mk', 'semester', 'kode_mk'),
+        Index('ix_matakuliah_sks', 'sks'),
+    )
+    
     
     # ========== DEFINISI KOLOM/ATRIBUT ==========
     # Masing-masing Column mewakili satu kolom di tabel database
@@ -0,0 +1,259 @@
+"""
+MODUL POOL - Tuning connection pool engine & metrics pool
+
+`get_engine` (models/__init__.py) membuat engine dengan opsi pool dari
+profil backend di bawah ini; setiap opsi bisa ditimpa lewat INI dengan
+prefix `sqlalchemy.` seperti opsi engine lainnya.
+
+Profil (ukuran pool mengikuti jumlah thread waitress, default 4):
+  - postgresql : pool_size 4, max_overflow 4, pool_timeout 10,
+                 pool_pre_ping true (koneksi yang diputus server / firewall
+                 diganti sebelum dipakai), pool_recycle 1800,
+                 pool_use_lifo true (koneksi idle berlebih cepat di-recycle)
+  - sqlite     : pool_size 4, max_overflow 4, pool_timeout 10,
+                 pool_pre_ping false (file lokal, koneksi tidak bisa
+                 "putus"), pool_recycle -1
+  - sqlite in-memory (sqlite://) memakai pool bawaan SQLAlchemy
+    (SingletonThreadPool / StaticPool) tanpa perubahan; opsi
+    `sqlalchemy.pool_*` di INI diabaikan (lihat engine_settings)
+
+Dengan profil ini setiap thread waitress punya koneksi sendiri di pool;
+overflow hanya terjadi jika ada pekerjaan lain (script, thread streaming)
+yang ikut memakai koneksi. Jika request menunggu koneksi lebih dari
+`pool_timeout` detik, TimeoutError di-raise (bukan menunggu selamanya).
+
+Metrics (lihat metrics.py, dibaca lewat GET /metrics):
+  - matakuliah_db_pool_checked_out   : koneksi yang sedang dipakai (gauge)
+  - matakuliah_db_pool_idle          : koneksi idle di pool (gauge)
+  - matakuliah_db_pool_overflow      : koneksi overflow yang terbuka (gauge)
+  - matakuliah_db_pool_size          : pool_size yang dikonfigurasi (gauge)
+  - matakuliah_db_pool_wait_seconds  : histogram waktu mendapat koneksi
+  - matakuliah_db_pool_overflow_total: jumlah koneksi overflow dibuat
+  - matakuliah_db_pool_timeouts_total: jumlah checkout yang timeout
+
+Konfigurasi INI (opsional):
+    sqlalchemy.pool_size = 4
+    sqlalchemy.max_overflow = 4
+    sqlalchemy.pool_timeout = 10
+    sqlalchemy.pool_recycle = 1800
+    sqlalchemy.pool_pre_ping = true
+    sqlalchemy.pool_use_lifo = true
+"""
+import logging
+import time
+
+from pyramid.settings import asbool
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+from ..metrics import get_metrics
+
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+POOL_PROFILES = {
+    'postgresql': {
+        'pool_size': 4,
+        'max_overflow': 4,
+        'pool_timeout': 10.0,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+        'pool_use_lifo': True,
+    },
+    'sqlite': {
+        'pool_size': 4,
+        'max_overflow': 4,
+        'pool_timeout': 10.0,
+        'pool_recycle': -1,
+        'pool_pre_ping': False,
+        'pool_use_lifo': False,
+    },
+}
+
+# Tipe setiap opsi pool; engine_from_config tidak meng-coerce
+# pool_pre_ping / pool_use_lifo sehingga string "false" akan dianggap True
+POOL_OPTION_TYPES = {
+    'pool_size': int,
+    'max_overflow': int,
+    'pool_timeout': float,
+    'pool_recycle': int,
+    'pool_pre_ping': asbool,
+    'pool_use_lifo': asbool,
+}
+
+# Bucket waktu checkout (detik): checkout dari pool biasanya < 100 µs,
+# nilai besar berarti thread menunggu koneksi (pool habis)
+WAIT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _is_memory_sqlite(url):
+    return url.get_backend_name() == 'sqlite' and (
+        url.database in (None, '', ':memory:')
+        or url.query.get('mode') == 'memory'
+    )
+
+
+def pool_options(settings, prefix='sqlalchemy.'):
+    """
+    HELPER FUNCTION - Opsi pool untuk create_engine dari profil + INI
+
+    Args:
+        settings (dict): Settings app (berisi `<prefix>url`)
+        prefix (str): Prefix opsi engine di settings
+
+    Returns:
+        dict: kwargs untuk engine_from_config (termasuk `poolclass`),
+              atau {} untuk backend tanpa profil / SQLite in-memory
+    """
+    url = make_url(settings[prefix + 'url'])
+    profile = POOL_PROFILES.get(url.get_backend_name())
+    if profile is None or _is_memory_sqlite(url):
+        return {}
+
+    options = dict(profile)
+    for name, coerce in POOL_OPTION_TYPES.items():
+        value = settings.get(prefix + name)
+        if value is not None:
+            options[name] = coerce(value)
+    options['poolclass'] = InstrumentedQueuePool
+    return options
+
+
+def engine_settings(settings, prefix='sqlalchemy.'):
+    """
+    HELPER FUNCTION - Settings untuk engine_from_config
+
+    SingletonThreadPool / StaticPool (SQLite in-memory) tidak menerima
+    opsi QueuePool seperti max_overflow / pool_timeout, sehingga
+    create_engine gagal jika url INI di-override ke sqlite:// (test,
+    benchmark). Untuk kasus itu opsi pool dari INI dibuang.
+
+    Returns:
+        dict: `settings` apa adanya, atau salinan tanpa `<prefix>pool_*`
+              / `<prefix>max_overflow` untuk SQLite in-memory
+    """
+    if not _is_memory_sqlite(make_url(settings[prefix + 'url'])):
+        return settings
+    return {
+        key: value for key, value in settings.items()
+        if not (key.startswith(prefix)
+                and key[len(prefix):] in POOL_OPTION_TYPES)
+    }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    CLASS - QueuePool yang mencatat waktu checkout, overflow & timeout
+
+    Metric di-bind lewat bind_metrics() setelah MetricsRegistry tersedia;
+    sebelum itu (misal di script) pool bekerja seperti QueuePool biasa.
+    """
+
+    # log checkout / checkin tetap di logger sqlalchemy.pool (bukan
+    # matakuliah_app.*, yang di development.ini level DEBUG).
+    # PERHATIAN: atribut PRIVATE SQLAlchemy, dibaca oleh
+    # sqlalchemy.log._qual_logger_name_for_cls (SQLAlchemy 2.1); periksa
+    # lagi saat upgrade SQLAlchemy
+    _sqla_logger_namespace = 'sqlalchemy.pool.impl.QueuePool'
+
+    _wait_seconds = None
+    _overflow_total = None
+    _timeouts_total = None
+
+    def bind_metrics(self, metrics):
+        self._wait_seconds = metrics.histogram(
+            'matakuliah_db_pool_wait_seconds',
+            'Time to check out a connection from the pool',
+            buckets=WAIT_BUCKETS,
+        )
+        self._overflow_total = metrics.counter(
+            'matakuliah_db_pool_overflow_total',
+            'Connections opened beyond pool_size',
+        )
+        self._timeouts_total = metrics.counter(
+            'matakuliah_db_pool_timeouts_total',
+            'Checkouts that timed out waiting for a connection',
+        )
+
+    def connect(self):
+        if self._wait_seconds is None:
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._timeouts_total.inc()
+            raise
+        finally:
+            self._wait_seconds.observe(time.perf_counter() - started)
+        return connection
+
+    def _inc_overflow(self):
+        # PERHATIAN: override method PRIVATE QueuePool._inc_overflow dan
+        # membaca atribut private QueuePool._overflow (SQLAlchemy 2.1,
+        # sqlalchemy/pool/impl.py); periksa lagi saat upgrade SQLAlchemy
+        created = super()._inc_overflow()
+        # _overflow mulai dari -pool_size; > 0 berarti melewati pool_size
+        if created and self._overflow > 0 and self._overflow_total is not None:
+            self._overflow_total.inc()
+        return created
+
+    def recreate(self):
+        # engine.dispose() membuat pool baru; metric tetap terpasang
+        pool = super().recreate()
+        if self._wait_seconds is not None:
+            pool._wait_seconds = self._wait_seconds
+            pool._overflow_total = self._overflow_total
+            pool._timeouts_total = self._timeouts_total
+        return pool
+
+
+def _pool_collector(engine):
+    """
+    HELPER FUNCTION - Collector metrics untuk gauge pool
+
+    `engine.pool` dibaca ulang setiap scrape karena engine.dispose()
+    mengganti objek pool.
+    """
+    def collect():
+        pool = engine.pool
+        return [
+            ('matakuliah_db_pool_checked_out', 'gauge',
+             'Connections currently checked out', {(): pool.checkedout()}),
+            ('matakuliah_db_pool_idle', 'gauge',
+             'Idle connections in the pool', {(): pool.checkedin()}),
+            ('matakuliah_db_pool_overflow', 'gauge',
+             'Open connections beyond pool_size', {(): max(pool.overflow(), 0)}),
+            ('matakuliah_db_pool_size', 'gauge',
+             'Configured pool_size', {(): pool.size()}),
+        ]
+    return collect
+
+
+def includeme(config):
+    """
+    Pasang metrics pool untuk engine app ini.
+
+    Dipanggil dari ``matakuliah_app.models.includeme`` setelah engine
+    dibuat (``config.registry['dbengine']``); butuh
+    ``matakuliah_app.metrics`` sudah di-include.
+    """
+    engine = config.registry['dbengine']
+    if not isinstance(engine.pool, InstrumentedQueuePool):
+        log.info(f"Pool metrics not available for {type(engine.pool).__name__}")
+        return
+    log.info(f"Connection pool: {engine.pool.status()}")
+
+    metrics = get_metrics(config.registry)
+    if metrics is None:
+        log.warning("Pool metrics requested but matakuliah_app.metrics "
+                    "is not included")
+        return
+    engine.pool.bind_metrics(metrics)
+    metrics.register_collector(_pool_collector(engine))
@@ -0,0 +1,210 @@
+"""
+MODUL QUERY STATS - Akuntansi statement SQL per request & slow-query log
+
+Event engine SQLAlchemy (before_cursor_execute / after_cursor_execute)
+mengukur setiap statement yang dikirim ke database. Selama request
+diproses, QueryStats milik request tersebut disimpan di context variable
+(di-set oleh subscriber NewRequest), sehingga setiap statement tercatat
+ke request yang menjalankannya:
+  - request.sql_stats : jumlah statement & total waktu DB request ini
+  - Header response   : Server-Timing: db;dur=<ms>;desc="<n> queries"
+  - Metrics (lihat metrics.py, dibaca lewat GET /metrics):
+      matakuliah_db_statements_per_request{route}
+          Histogram jumlah statement per request (pola N+1 terlihat di sini)
+      matakuliah_db_request_duration_seconds{route}
+          Histogram total waktu DB per request
+      matakuliah_db_statement_duration_seconds
+          Histogram latency per statement
+      matakuliah_db_slow_statements_total{route}
+          Jumlah statement yang melewati threshold
+  - Slow-query log    : statement yang lebih lambat dari
+                        `matakuliah.sql.slow_threshold_ms` dicatat level
+                        WARNING beserta nama route-nya
+
+Redaksi Parameter:
+  Nilai bind parameter tidak pernah ditulis ke log (SQL hanya berisi
+  placeholder ? / %(name)s); literal yang ter-render langsung di teks SQL
+  juga diganti dengan ?.
+
+Catatan Streaming:
+  Statement yang dijalankan saat body streaming dikirim (?stream=1, export)
+  terjadi setelah request selesai diproses, sehingga tidak tercatat ke
+  request manapun; begitu juga statement di luar request (script).
+
+Konfigurasi INI (opsional):
+    matakuliah.sql.stats = true
+    matakuliah.sql.slow_threshold_ms = 200
+"""
+import contextvars
+import logging
+import re
+import time
+
+from pyramid.events import NewRequest
+from pyramid.settings import asbool
+from sqlalchemy import event
+
+from ..metrics import get_metrics
+
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+DEFAULT_SLOW_THRESHOLD_MS = 200.0
+
+# Bucket jumlah statement per request: puluhan biasanya tanda N+1
+STATEMENT_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+UNMATCHED_ROUTE = 'none'
+
+_current_stats = contextvars.ContextVar('matakuliah_sql_stats', default=None)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def redact_sql(statement):
+    """
+    HELPER FUNCTION - SQL satu baris dengan literal diganti ``?``
+    """
+    statement = _STRING_LITERAL.sub("'?'", statement)
+    statement = _NUMBER_LITERAL.sub('?', statement)
+    return _WHITESPACE.sub(' ', statement).strip()
+
+
+class QueryStats(object):
+    """
+    CLASS - Jumlah statement & waktu database untuk satu request
+    """
+
+    def __init__(self, request, slow_threshold):
+        self.request = request
+        self.slow_threshold = slow_threshold
+        self.count = 0
+        self.duration = 0.0
+        self.slow = 0
+
+    @property
+    def route(self):
+        route = getattr(self.request, 'matched_route', None)
+        return route.name if route is not None else UNMATCHED_ROUTE
+
+    def record(self, statement, elapsed):
+        self.count += 1
+        self.duration += elapsed
+        if elapsed >= self.slow_threshold:
+            self.slow += 1
+            log.warning(
+                f"Slow SQL ({elapsed * 1000:.1f} ms, route={self.route}): "
+                f"{redact_sql(statement)}"
+            )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context,
+                           executemany):
+    conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    started = conn.info['query_started'].pop()
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats.record(statement, elapsed)
+    metrics = get_metrics(stats.request.registry)
+    if metrics is not None:
+        metrics.histogram(
+            'matakuliah_db_statement_duration_seconds',
+            'SQL statement execution time',
+        ).observe(elapsed)
+
+
+def _forget_started(exception_context):
+    # statement yang gagal tidak pernah sampai ke after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get('query_started'):
+        conn.info['query_started'].pop()
+
+
+def instrument_engine(engine):
+    """
+    Pasang event hook pengukur statement ke ``engine``.
+
+    Aman dipanggil berulang kali (misal beberapa app memakai engine yang
+    sama di test): listener yang sudah terpasang tidak ditambah lagi.
+    """
+    for name, fn in (
+        ('before_cursor_execute', _before_cursor_execute),
+        ('after_cursor_execute', _after_cursor_execute),
+        ('handle_error', _forget_started),
+    ):
+        if not event.contains(engine, name, fn):
+            event.listen(engine, name, fn)
+
+
+def _emit(request, response):
+    stats = request.sql_stats
+    # digabung ke satu field (misal "render;dur=.., db;dur=..") agar header
+    # Server-Timing dari renderer tidak tertimpa / terpecah
+    timings = response.headers.getall('Server-Timing')
+    timings.append(
+        f'db;dur={stats.duration * 1000:.3f};desc="{stats.count} queries"'
+    )
+    response.headers['Server-Timing'] = ', '.join(timings)
+    metrics = get_metrics(request.registry)
+    if metrics is None:
+        return
+    labels = (stats.route,)
+    metrics.histogram(
+        'matakuliah_db_statements_per_request',
+        'SQL statements issued per request',
+        labelnames=('route',),
+        buckets=STATEMENT_COUNT_BUCKETS,
+    ).observe(stats.count, labels=labels)
+    metrics.histogram(
+        'matakuliah_db_request_duration_seconds',
+        'Total SQL execution time per request',
+        labelnames=('route',),
+    ).observe(stats.duration, labels=labels)
+    if stats.slow:
+        metrics.counter(
+            'matakuliah_db_slow_statements_total',
+            'SQL statements slower than matakuliah.sql.slow_threshold_ms',
+            labelnames=('route',),
+        ).inc(stats.slow, labels=labels)
+
+
+def _finished(request):
+    _current_stats.set(None)
+
+
+def includeme(config):
+    """
+    Aktifkan akuntansi SQL per request untuk engine app ini.
+
+    Dipanggil dari ``matakuliah_app.models.includeme`` setelah engine
+    dibuat (``config.registry['dbengine']``); matikan lewat setting
+    ``matakuliah.sql.stats = false``.
+    """
+    settings = config.get_settings()
+    if not asbool(settings.get('matakuliah.sql.stats', True)):
+        log.info("SQL statement accounting disabled")
+        return
+    slow_threshold = float(settings.get(
+        'matakuliah.sql.slow_threshold_ms', DEFAULT_SLOW_THRESHOLD_MS
+    )) / 1000
+
+    instrument_engine(config.registry['dbengine'])
+
+    def start_request(event):
+        request = event.request
+        stats = QueryStats(request, slow_threshold)
+        request.sql_stats = stats
+        _current_stats.set(stats)
+        request.add_response_callback(_emit)
+        request.add_finished_callback(_finished)
+
+    config.add_subscriber(start_request, NewRequest)
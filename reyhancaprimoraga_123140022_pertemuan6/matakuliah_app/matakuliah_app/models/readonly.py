@@ -0,0 +1,88 @@
+"""
+MODUL READ-ONLY - Fast path GET tanpa pyramid_tm
+
+Request GET / HEAD ke route di `matakuliah.readonly.routes` (default
+matakuliah_collection & matakuliah_detail, yaitu view matakuliah_list dan
+matakuliah_detail) tidak memakai transaction manager:
+  - `tm.activate_hook` membuat pyramid_tm melewati request ini (tanpa
+    transaction.begin / commit)
+  - request.dbsession adalah session read-only yang tidak didaftarkan ke
+    zope.sqlalchemy dan memakai koneksi AUTOCOMMIT: tidak ada BEGIN /
+    COMMIT ke database, setiap SELECT langsung dijalankan
+  - Di PostgreSQL koneksi juga di-set READ ONLY sehingga server menolak
+    semua penulisan; di backend lain session menolak flush ORM dan
+    statement INSERT / UPDATE / DELETE (ReadOnlySessionError)
+
+Konsistensi:
+  Tanpa transaksi, setiap statement melihat data commit terbaru. View GET
+  membaca versi tabel (ETag) SEBELUM data, sehingga ETag tidak pernah
+  lebih baru dari body; paling buruk client memuat ulang sekali lagi.
+
+Route ditentukan sebelum routing Pyramid (pyramid_tm berjalan di tween,
+di luar router), lewat lookup IRoutesMapper yang sama dengan router.
+
+Konfigurasi INI (opsional; kosongkan untuk mematikan):
+    matakuliah.readonly.routes = matakuliah_collection matakuliah_detail
+"""
+from pyramid.interfaces import IRoutesMapper
+
+
+READONLY_METHODS = frozenset(['GET', 'HEAD'])
+
+DEFAULT_READONLY_ROUTES = 'matakuliah_collection matakuliah_detail'
+
+
+class ReadOnlySessionError(Exception):
+    """
+    EXCEPTION - Penulisan lewat session read-only
+    """
+    pass
+
+
+def readonly_engine(engine):
+    """
+    HELPER FUNCTION - Engine (berbagi pool & event) dengan koneksi
+    AUTOCOMMIT, plus READ ONLY di PostgreSQL
+    """
+    options = {'isolation_level': 'AUTOCOMMIT'}
+    if engine.dialect.name == 'postgresql':
+        options['postgresql_readonly'] = True
+    return engine.execution_options(**options)
+
+
+def reject_flush(session, flush_context, instances):
+    # event before_flush: perubahan object ORM di session read-only
+    if session.new or session.dirty or session.deleted:
+        raise ReadOnlySessionError("Cannot flush changes in a read-only session")
+
+
+def reject_write_statement(orm_execute_state):
+    # event do_orm_execute: INSERT / UPDATE / DELETE (ORM maupun Core)
+    if (orm_execute_state.is_insert or orm_execute_state.is_update
+            or orm_execute_state.is_delete):
+        raise ReadOnlySessionError("Cannot execute writes in a read-only session")
+
+
+def is_readonly_request(request):
+    """
+    HELPER FUNCTION - Apakah request memakai fast path read-only
+
+    Dipasang sebagai ``request.readonly`` (reify), sehingga lookup route
+    hanya dilakukan sekali per request.
+    """
+    routes = request.registry.get('readonly_routes')
+    if not routes or request.method not in READONLY_METHODS:
+        return False
+    route = getattr(request, 'matched_route', None)
+    if route is None:
+        # dipanggil dari tween pyramid_tm: routing belum terjadi
+        route = request.registry.getUtility(IRoutesMapper)(request)['route']
+    return route is not None and route.name in routes
+
+
+def tm_activate_hook(request):
+    """
+    HELPER FUNCTION - `tm.activate_hook` pyramid_tm: aktif kecuali
+    untuk request read-only
+    """
+    return not request.readonly
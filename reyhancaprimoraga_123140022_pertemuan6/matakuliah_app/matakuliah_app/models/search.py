@@ -0,0 +1,141 @@
+"""
+MODUL SEARCH - Full-text search nama_mk memakai index native database
+
+Index dibuat oleh migrasi Alembic 9e2a4c7d1f58:
+  - SQLite     : tabel virtual FTS5 `matakuliah_fts` (external content,
+                 content_rowid = matakuliah.id) yang dijaga sinkron oleh
+                 trigger AFTER INSERT/UPDATE/DELETE pada tabel matakuliah
+  - PostgreSQL : index GIN pada ekspresi to_tsvector('simple', nama_mk);
+                 PostgreSQL memperbarui index ekspresi secara otomatis
+                 pada setiap INSERT/UPDATE, sehingga tidak perlu trigger
+
+Semantik Query (sama di kedua database):
+  Input `q` dipecah menjadi kata (huruf/angka). Setiap kata dicocokkan
+  sebagai PREFIX dan semua kata wajib ada (AND), misal
+  "algo pemrog" -> "algo"* "pemrog"*   (FTS5)
+                -> algo:* & pemrog:*   (tsquery)
+  Input tidak pernah diteruskan mentah ke parser FTS, sehingga karakter
+  khusus dari client tidak bisa menyebabkan syntax error.
+
+Ranking & Pagination:
+  `score` makin besar makin relevan (-bm25 di SQLite, ts_rank_cd di
+  PostgreSQL). Hasil diurutkan (score DESC, id ASC) dan dipaginasi dengan
+  keyset pada pasangan tersebut.
+
+Performa:
+  Biaya query sebanding dengan jumlah baris yang COCOK (semua harus diberi
+  skor sebelum diurutkan), bukan ukuran tabel. Pada 1 juta baris, query
+  yang selektif selesai < 1 ms, tetapi satu kata yang cocok dengan ~15%
+  tabel butuh ratusan ms karena ranking BM25. Tambahkan kata kunci agar
+  hasil lebih sempit.
+"""
+import re
+
+from sqlalchemy import (
+    and_,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table as sql_table,
+)
+
+from .matakuliah import Matakuliah
+
+
+# Batas jumlah kata per query agar query FTS tetap murah
+MAX_TERMS = 8
+
+# Konfigurasi text search PostgreSQL; HARUS sama persis dengan ekspresi
+# index di migrasi agar planner memakai index GIN
+PG_TS_CONFIG = literal_column("'simple'::regconfig")
+
+# Huruf/angka unicode, tanpa underscore (dianggap pemisah oleh kedua parser)
+_TERM_RE = re.compile(r'[^\W_]+', re.UNICODE)
+
+_fts = sql_table('matakuliah_fts', column('rowid'))
+
+
+class SearchUnavailable(Exception):
+    """
+    EXCEPTION - Database aktif tidak punya index full-text yang didukung
+    """
+
+
+def search_terms(q):
+    """
+    HELPER FUNCTION - Pecah query client menjadi list kata (lowercase)
+
+    Args:
+        q (str): Query mentah dari parameter `q`
+
+    Returns:
+        list: Maksimal MAX_TERMS kata; kosong jika tidak ada kata valid
+    """
+    return _TERM_RE.findall(q.lower())[:MAX_TERMS]
+
+
+def _sqlite_search(table, terms):
+    match = ' '.join(f'"{term}"*' for term in terms)
+    score = -func.bm25(literal_column('matakuliah_fts'))
+    stmt = select(_fts.c.rowid.label('id'), score.label('score')).where(
+        literal_column('matakuliah_fts').op('MATCH')(match)
+    )
+    return stmt, score, _fts.c.rowid
+
+
+def _postgresql_search(table, terms):
+    vector = func.to_tsvector(PG_TS_CONFIG, table.c.nama_mk)
+    query = func.to_tsquery(
+        PG_TS_CONFIG, ' & '.join(f'{term}:*' for term in terms)
+    )
+    score = func.ts_rank_cd(vector, query)
+    stmt = select(table.c.id, score.label('score')).where(vector.op('@@')(query))
+    return stmt, score, table.c.id
+
+
+# Nama dialect SQLAlchemy -> pembuat (select id+score, ekspresi score, kolom id)
+BACKENDS = {
+    'sqlite': _sqlite_search,
+    'postgresql': _postgresql_search,
+}
+
+
+def search_matakuliah(dbsession, terms, limit, after=None):
+    """
+    FUNGSI UTAMA - Cari matakuliah berdasarkan nama_mk, urut relevansi
+
+    Args:
+        dbsession (Session): Session aktif
+        terms (list): Hasil search_terms(), minimal satu kata
+        limit (int): Jumlah baris maksimum
+        after (dict|None): Posisi cursor {"r": score, "id": id} baris
+                           terakhir halaman sebelumnya
+
+    Returns:
+        list: Mapping baris matakuliah + kolom `score`
+
+    Raises:
+        SearchUnavailable: Jika dialect database tidak didukung
+    """
+    dialect = dbsession.get_bind().dialect.name
+    if dialect not in BACKENDS:
+        raise SearchUnavailable(f"Full-text search is not supported on {dialect}")
+
+    table = Matakuliah.__table__
+    hits, score, id_column = BACKENDS[dialect](table, terms)
+    if after is not None:
+        hits = hits.where(or_(
+            score < after['r'],
+            and_(score == after['r'], id_column > after['id']),
+        ))
+    # Ranking + LIMIT dikerjakan hanya pada (id, score) dari index; kolom
+    # lengkap baru diambil untuk `limit` baris teratas (join per primary key)
+    hits = hits.order_by(score.desc(), id_column).limit(limit).subquery('hits')
+    stmt = (
+        select(table, hits.c.score)
+        .join(hits, table.c.id == hits.c.id)
+        .order_by(hits.c.score.desc(), hits.c.id)
+    )
+    return list(dbsession.execute(stmt).mappings())
@@ -0,0 +1,130 @@
+"""
+MODUL SQLITE - PRAGMA untuk profil produksi SQLite
+
+Setiap koneksi SQLite baru (event `connect` engine) menjalankan PRAGMA
+berikut, sehingga semua koneksi di pool memakai pengaturan yang sama:
+
+  journal_mode = wal      Write-Ahead Log: pembaca tidak diblok penulis
+                          (dan sebaliknya); hanya satu penulis sekaligus.
+                          Mode ini tersimpan di file database.
+  synchronous  = normal   fsync hanya saat checkpoint; aman dari korupsi
+                          di mode WAL, transaksi terakhir bisa hilang jika
+                          listrik mati (bukan jika proses crash)
+  busy_timeout = 5000     ms menunggu lock penulis lain sebelum
+                          "database is locked"
+  cache_size   = -64000   page cache per koneksi; negatif = KiB (64 MB)
+  mmap_size    = 268435456
+                          baca file lewat memory-mapped I/O (256 MB),
+                          mengurangi copy read() ke page cache
+  temp_store   = memory   tabel / index sementara (ORDER BY besar, dll)
+                          di memori, bukan file temp
+
+Semua nilai bisa diubah di INI dengan prefix `matakuliah.sqlite.`; nilai
+kosong berarti PRAGMA tersebut tidak dijalankan (default SQLite).
+Database in-memory (sqlite://) dan backend selain SQLite tidak disentuh.
+
+Konfigurasi INI (opsional):
+    matakuliah.sqlite.pragmas = true
+    matakuliah.sqlite.journal_mode = wal
+    matakuliah.sqlite.synchronous = normal
+    matakuliah.sqlite.busy_timeout = 5000
+    matakuliah.sqlite.cache_size = -64000
+    matakuliah.sqlite.mmap_size = 268435456
+    matakuliah.sqlite.temp_store = memory
+"""
+import logging
+
+from pyramid.settings import asbool
+from sqlalchemy import event
+
+from .pool import _is_memory_sqlite
+
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+def _choice(*allowed):
+    def validate(value):
+        value = value.lower()
+        if value not in allowed:
+            raise ValueError(f"expected one of {', '.join(allowed)}")
+        return value
+    return validate
+
+
+def _integer(value):
+    return str(int(value))
+
+
+# (nama PRAGMA, nilai default, validator); journal_mode dijalankan pertama
+# karena PRAGMA lain (synchronous) dipilih untuk mode WAL
+SQLITE_PRAGMAS = (
+    ('journal_mode', 'wal',
+     _choice('delete', 'truncate', 'persist', 'memory', 'wal', 'off')),
+    ('synchronous', 'normal', _choice('off', 'normal', 'full', 'extra')),
+    ('busy_timeout', '5000', _integer),
+    ('cache_size', '-64000', _integer),
+    ('mmap_size', '268435456', _integer),
+    ('temp_store', 'memory', _choice('default', 'file', 'memory')),
+)
+
+
+def sqlite_pragmas(settings):
+    """
+    HELPER FUNCTION - Daftar PRAGMA yang dijalankan saat connect
+
+    Nilai dari INI divalidasi di sini karena PRAGMA tidak mendukung bind
+    parameter (nilai ditulis langsung ke statement).
+
+    Returns:
+        list: Pasangan (nama, nilai); kosong jika dimatikan lewat
+              `matakuliah.sqlite.pragmas = false`
+
+    Raises:
+        ValueError: Jika nilai di INI tidak valid
+    """
+    if not asbool(settings.get('matakuliah.sqlite.pragmas', True)):
+        return []
+    pragmas = []
+    for name, default, validate in SQLITE_PRAGMAS:
+        value = str(settings.get(f'matakuliah.sqlite.{name}', default)).strip()
+        if not value:
+            continue
+        try:
+            pragmas.append((name, validate(value)))
+        except ValueError as e:
+            raise ValueError(f"Invalid matakuliah.sqlite.{name} = {value!r}: {e}")
+    return pragmas
+
+
+def setup_sqlite(engine, settings):
+    """
+    Pasang event `connect` yang menjalankan PRAGMA pada ``engine``.
+
+    Dipanggil dari ``get_engine``; tidak melakukan apa-apa untuk backend
+    selain SQLite dan untuk database in-memory.
+    """
+    if engine.dialect.name != 'sqlite' or _is_memory_sqlite(engine.url):
+        return
+    pragmas = sqlite_pragmas(settings)
+    if not pragmas:
+        return
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f'PRAGMA {name} = {value}')
+                if name == 'journal_mode':
+                    # SQLite mengembalikan mode yang benar-benar dipakai
+                    # (misal WAL tidak didukung di network filesystem)
+                    actual = cursor.fetchone()[0]
+                    if actual != value:
+                        log.warning(f"SQLite journal_mode {value} not "
+                                    f"available, using {actual}")
+        finally:
+            cursor.close()
+
+    event.listen(engine, 'connect', set_pragmas)
+    log.info("SQLite pragmas: " + ', '.join(f'{n}={v}' for n, v in pragmas))
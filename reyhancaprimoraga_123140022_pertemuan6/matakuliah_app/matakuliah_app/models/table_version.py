@@ -0,0 +1,32 @@
+"""
+MODUL MODEL TABLE VERSION - Counter versi per tabel
+
+Setiap kali transaksi yang mengubah tabel ter-track (misal 'matakuliah')
+di-commit, kolom `version` untuk tabel tersebut dinaikkan satu (lihat
+event hook di models/__init__.py). Nilai ini dipakai untuk membuat ETag
+yang kuat tanpa perlu membaca ulang data.
+"""
+from sqlalchemy import BigInteger, Column, Text
+from .meta import Base
+
+
+class TableVersion(Base):
+    """
+    MODEL TABLE VERSION - Satu baris per tabel yang di-track
+
+    Atribut:
+      - table_name (Text, PK): Nama tabel, misal 'matakuliah'
+      - version (BigInteger): Naik setiap commit yang mengubah tabel
+    """
+    __tablename__ = 'table_versions'
+
+    table_name = Column(Text, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<TableVersion("
+            f"table_name='{self.table_name}', "
+            f"version={self.version}"
+            f")>"
+        )
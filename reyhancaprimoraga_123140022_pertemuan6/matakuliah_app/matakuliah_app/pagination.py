@@ -0,0 +1,244 @@
+"""
+MODUL PAGINATION - Keyset (cursor-based) pagination untuk endpoint koleksi
+
+Modul ini menyediakan helper untuk pagination berbasis keyset:
+  - Client mengirim `limit` (ukuran halaman) dan `after` (cursor opaque)
+  - Server mengembalikan `next_cursor` untuk mengambil halaman berikutnya
+  - Query selalu berbentuk `WHERE id > :last_id ORDER BY id LIMIT :n`
+    sehingga memanfaatkan index primary key (tidak ada OFFSET scan)
+  - Dengan `sort` kolom lain, keyset memakai pasangan (kolom, id):
+    `WHERE kode_mk > :k OR (kode_mk = :k AND id > :last_id)
+     ORDER BY kode_mk, id`
+
+Kenapa keyset, bukan OFFSET?
+  - OFFSET N tetap membaca N baris pertama di database, semakin lambat
+    semakin jauh halamannya
+  - Keyset langsung "lompat" ke posisi cursor lewat index, sehingga
+    latency dan memori tetap datar berapapun ukuran tabel
+
+Format Cursor:
+  Cursor adalah JSON yang di-encode dengan base64 url-safe (tanpa padding),
+  misal {"id": 42} -> "eyJpZCI6NDJ9". Untuk sort selain id, cursor juga
+  menyimpan parameter sort ("s") dan nilai kolom sort ("k") baris terakhir.
+  Client TIDAK boleh bergantung pada isi cursor; cukup kirim balik apa
+  adanya bersama parameter filter & sort yang sama.
+"""
+import base64
+import binascii
+import json
+import operator
+
+from sqlalchemy import and_, or_
+
+
+# Ukuran halaman default jika client tidak mengirim `limit`
+DEFAULT_PAGE_SIZE = 50
+
+# Batas keras ukuran halaman; `limit` lebih besar akan dipotong ke nilai ini
+MAX_PAGE_SIZE = 500
+
+# Tipe nilai kolom sort (`k`) yang valid di cursor
+CURSOR_KEY_TYPES = (str, int, float, type(None))
+
+
+class PaginationError(ValueError):
+    """
+    EXCEPTION - Parameter pagination tidak valid
+
+    Dilempar ketika `limit` bukan integer positif atau `after` bukan
+    cursor yang valid. View menangkap exception ini dan mengembalikan
+    response 400.
+    """
+
+
+def encode_cursor(payload):
+    """
+    HELPER FUNCTION - Encode dictionary menjadi cursor opaque
+
+    Args:
+        payload (dict): Posisi terakhir halaman, misal {"id": 42}
+
+    Returns:
+        str: Token base64 url-safe tanpa padding '='
+    """
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def decode_cursor(token):
+    """
+    HELPER FUNCTION - Decode cursor opaque menjadi dictionary
+
+    Args:
+        token (str): Token yang sebelumnya dibuat oleh encode_cursor()
+
+    Returns:
+        dict: Payload cursor
+
+    Raises:
+        PaginationError: Jika token rusak atau bukan JSON object
+    """
+    try:
+        # Kembalikan padding '=' yang dibuang saat encode
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, binascii.Error, UnicodeError):
+        raise PaginationError("Invalid cursor")
+
+    if not isinstance(payload, dict):
+        raise PaginationError("Invalid cursor")
+    return payload
+
+
+def get_page_settings(settings):
+    """
+    HELPER FUNCTION - Baca ukuran halaman default & maksimum dari INI
+
+    Settings yang didukung (opsional):
+        matakuliah.default_page_size = 50
+        matakuliah.max_page_size = 500
+
+    Args:
+        settings (dict): Registry settings aplikasi
+
+    Returns:
+        tuple: (default_page_size, max_page_size)
+    """
+    max_size = int(settings.get('matakuliah.max_page_size', MAX_PAGE_SIZE))
+    default_size = int(settings.get(
+        'matakuliah.default_page_size', DEFAULT_PAGE_SIZE
+    ))
+    return min(default_size, max_size), max_size
+
+
+def parse_limit(value, default_size, max_size):
+    """
+    HELPER FUNCTION - Validasi parameter `limit`
+
+    Args:
+        value (str|None): Nilai query param `limit`
+        default_size (int): Ukuran halaman jika `limit` tidak dikirim
+        max_size (int): Batas keras ukuran halaman
+
+    Returns:
+        int: Ukuran halaman (1 <= limit <= max_size)
+
+    Raises:
+        PaginationError: Jika `limit` bukan integer positif
+    """
+    if value is None or value == '':
+        return default_size
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise PaginationError("limit must be a positive integer")
+    if limit <= 0:
+        raise PaginationError("limit must be a positive integer")
+    return min(limit, max_size)
+
+
+def parse_after_id(value):
+    """
+    HELPER FUNCTION - Ambil id terakhir dari cursor `after`
+
+    Args:
+        value (str|None): Nilai query param `after`
+
+    Returns:
+        int|None: id terakhir halaman sebelumnya, None untuk halaman pertama
+
+    Raises:
+        PaginationError: Jika cursor tidak valid
+    """
+    if not value:
+        return None
+    payload = decode_cursor(value)
+    last_id = payload.get('id')
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise PaginationError("Invalid cursor")
+    return last_id
+
+
+def _sort_param(sort):
+    field, descending = sort
+    return f"-{field}" if descending else field
+
+
+def encode_page_cursor(sort, row):
+    """
+    HELPER FUNCTION - Buat cursor halaman berikutnya dari baris terakhir
+
+    Args:
+        sort (tuple): (nama_kolom, descending) dari filters.parse_sort()
+        row: Baris/object terakhir halaman ini (punya atribut id & kolom sort)
+
+    Returns:
+        str: Cursor opaque
+    """
+    field, descending = sort
+    if field == 'id' and not descending:
+        # Format lama tetap dipakai agar cursor yang sudah beredar valid
+        return encode_cursor({"id": row.id})
+    return encode_cursor({
+        "s": _sort_param(sort),
+        "k": getattr(row, field),
+        "id": row.id,
+    })
+
+
+def parse_page_cursor(value, sort):
+    """
+    HELPER FUNCTION - Validasi cursor `after` untuk sort tertentu
+
+    Args:
+        value (str|None): Nilai query param `after`
+        sort (tuple): (nama_kolom, descending) dari filters.parse_sort()
+
+    Returns:
+        dict|None: Payload cursor, None untuk halaman pertama
+
+    Raises:
+        PaginationError: Jika cursor rusak atau dibuat untuk sort lain
+    """
+    if not value:
+        return None
+    field, descending = sort
+    if field == 'id' and not descending:
+        return {"id": parse_after_id(value)}
+
+    payload = decode_cursor(value)
+    last_id = payload.get('id')
+    # nilai kolom sort dibandingkan langsung di SQL: hanya skalar JSON
+    # (list / dict / bool dari cursor yang dimanipulasi ditolak)
+    last_key = payload.get('k')
+    if (payload.get('s') != _sort_param(sort)
+            or 'k' not in payload
+            or not isinstance(last_key, CURSOR_KEY_TYPES)
+            or isinstance(last_key, bool)
+            or not isinstance(last_id, int) or isinstance(last_id, bool)):
+        raise PaginationError("Invalid cursor")
+    return payload
+
+
+def keyset_criterion(table, sort, payload):
+    """
+    HELPER FUNCTION - Klausa WHERE untuk melanjutkan setelah cursor
+
+    Args:
+        table (Table): Tabel sumber (misal Matakuliah.__table__)
+        sort (tuple): (nama_kolom, descending)
+        payload (dict): Hasil parse_page_cursor()
+
+    Returns:
+        ClauseElement: Baris yang urutannya setelah posisi cursor
+    """
+    field, descending = sort
+    id_column = table.c.id
+    after = operator.lt if descending else operator.gt
+    if field == 'id':
+        return after(id_column, payload['id'])
+    column = table.c[field]
+    return or_(
+        after(column, payload['k']),
+        and_(column == payload['k'], after(id_column, payload['id'])),
+    )
@@ -0,0 +1,185 @@
+"""
+MODUL RENDERER - JSON renderer compact dengan content negotiation
+
+Renderer 'json' aplikasi ini:
+  - Default: JSON compact (tanpa spasi/indentasi, keys tidak diurutkan)
+    sehingga payload lebih kecil dan serialisasi lebih cepat
+  - Pretty-print (indent 2, keys diurutkan) HANYA jika diminta:
+      * query param  : ?pretty=1
+      * Accept header: application/json; pretty=1
+                       application/json; indent=2
+  - Memakai backend `orjson` jika terpasang (jauh lebih cepat), dan
+    fallback ke modul `json` standard library jika tidak ada
+  - Waktu serialisasi dicatat di histogram metrics
+    `matakuliah_json_render_seconds` dan di header `Server-Timing`
+
+Konfigurasi INI (opsional):
+    matakuliah.json_backend = auto    # auto | orjson | json
+"""
+import json
+import logging
+import time
+
+from pyramid.settings import asbool
+
+from .metrics import get_metrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - backend opsional
+    orjson = None
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+def _stdlib_dumps(value, pretty=False):
+    if pretty:
+        text = json.dumps(value, indent=2, sort_keys=True, ensure_ascii=False)
+    else:
+        text = json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def _orjson_dumps(value, pretty=False):
+    option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+    try:
+        return orjson.dumps(value, option=option)
+    except TypeError:
+        # orjson lebih ketat (misal integer > 64 bit); pakai stdlib saja
+        return _stdlib_dumps(value, pretty)
+
+
+BACKENDS = {'json': _stdlib_dumps}
+if orjson is not None:
+    BACKENDS['orjson'] = _orjson_dumps
+
+
+def resolve_backend(name='auto'):
+    """
+    HELPER FUNCTION - Pilih fungsi serialisasi berdasarkan nama backend
+
+    Args:
+        name (str): 'auto', 'orjson', atau 'json'
+
+    Returns:
+        tuple: (nama_backend, fungsi_dumps)
+    """
+    if name == 'auto':
+        name = 'orjson' if 'orjson' in BACKENDS else 'json'
+    if name not in BACKENDS:
+        log.warning(f"JSON backend '{name}' is not available, using 'json'")
+        name = 'json'
+    return name, BACKENDS[name]
+
+
+# Backend default modul ini, dipakai oleh dumps() (misal oleh streaming)
+_backend_name, _default_dumps = resolve_backend()
+
+
+def dumps(value, pretty=False):
+    """
+    HELPER FUNCTION - Serialisasi value ke JSON bytes (UTF-8)
+
+    Args:
+        value: Data Python (dict/list/str/int/...)
+        pretty (bool): True untuk indent 2 + keys diurutkan
+
+    Returns:
+        bytes: JSON ter-encode UTF-8
+    """
+    return _default_dumps(value, pretty)
+
+
+def wants_pretty(request):
+    """
+    HELPER FUNCTION - Cek apakah client meminta JSON pretty-printed
+
+    Args:
+        request: Pyramid request (boleh None)
+
+    Returns:
+        bool: True jika ?pretty=1 atau Accept application/json
+              memiliki parameter pretty=1 / indent=N
+    """
+    if request is None:
+        return False
+    if asbool(request.params.get('pretty')):
+        return True
+
+    for media_range in request.headers.get('Accept', '').split(','):
+        parts = [p.strip() for p in media_range.split(';')]
+        if parts[0].lower() != 'application/json':
+            continue
+        for param in parts[1:]:
+            key, _, val = param.partition('=')
+            key = key.strip().lower()
+            val = val.strip().strip('"')
+            if key == 'pretty' and asbool(val):
+                return True
+            if key == 'indent' and val.isdigit() and int(val) > 0:
+                return True
+    return False
+
+
+def json_renderer_factory(backend='auto'):
+    """
+    FACTORY FUNCTION - Buat renderer factory untuk config.add_renderer()
+
+    Args:
+        backend (str): Nama backend ('auto', 'orjson', 'json')
+
+    Returns:
+        callable: Renderer factory (menerima `info` dari Pyramid)
+    """
+    backend_name, backend_dumps = resolve_backend(backend)
+
+    def factory(info):
+        def renderer(value, system):
+            """
+            INNER FUNCTION - Konversi value ke JSON bytes
+
+            Args:
+                value (dict): Data yang akan dikonversi ke JSON
+                system (dict): System values dari Pyramid request
+
+            Returns:
+                bytes: JSON compact (atau pretty jika diminta)
+            """
+            request = system.get('request')
+            pretty = wants_pretty(request)
+
+            started = time.perf_counter()
+            body = backend_dumps(value, pretty)
+            elapsed = time.perf_counter() - started
+
+            if request is not None:
+                response = request.response
+                if response.content_type == response.default_content_type:
+                    response.content_type = 'application/json'
+                response.headers.add(
+                    'Server-Timing', f'render;dur={elapsed * 1000:.3f}'
+                )
+                metrics = get_metrics(request.registry)
+                if metrics is not None:
+                    metrics.histogram(
+                        'matakuliah_json_render_seconds',
+                        'Time spent serializing JSON responses',
+                        labelnames=('backend',),
+                    ).observe(elapsed, labels=(backend_name,))
+            return body
+        return renderer
+
+    log.info(f"JSON renderer using '{backend_name}' backend")
+    return factory
+
+
+def includeme(config):
+    """
+    Daftarkan renderer 'json' compact sebagai pengganti renderer bawaan.
+
+    Aktifkan dengan ``config.include('matakuliah_app.renderers')``.
+    """
+    settings = config.get_settings()
+    backend = settings.get('matakuliah.json_backend', 'auto')
+    config.add_renderer('json', json_renderer_factory(backend))
@@ -30,10 +30,11 @@ def includeme(config):
     
     Definisi Routes:
     
-    1. Static Files (CSS, JS, images)
+    1. Static Files (CSS, JS, images) - lihat assets.py
        Pattern: /static/*
        Tujuan: Serve static assets (non-dynamic files)
-       Cache: 1 jam (3600 detik)
+       Cache: URL ber-fingerprint (theme.<hash>.css) 1 tahun + immutable,
+              URL biasa 1 jam (3600 detik)
     
     2. Home Page
        Pattern: /
@@ -48,7 +49,41 @@ def includeme(config):
          - POST: Buat matakuliah baru
        Note: Method ditentukan di @view_config, bukan di sini
     
-    4. Matakuliah Detail (Read, Update, Delete)
+    4. Matakuliah Bulk (operasi massal)
+       Pattern: /api/matakuliah/_bulk
+       Route Name: 'matakuliah_bulk'
+       Methods:
+         - POST: Buat banyak matakuliah sekaligus (JSON array / NDJSON)
+         - PATCH: Update banyak matakuliah (ids / filter)
+         - DELETE: Hapus banyak matakuliah (ids / filter)
+       Note: Harus didaftarkan SEBELUM matakuliah_detail, karena
+             '/api/matakuliah/{id}' juga akan cocok dengan '_bulk'
+    
+    5. Matakuliah Search (full-text)
+       Pattern: /api/matakuliah/search
+       Route Name: 'matakuliah_search'
+       Methods:
+         - GET: Cari matakuliah berdasarkan nama_mk (?q=...)
+       Note: Sama seperti _bulk, harus didaftarkan SEBELUM
+             matakuliah_detail
+    
+    6. Matakuliah Upsert (berdasarkan kode_mk)
+       Pattern: /api/matakuliah/by-kode/{kode_mk} (satu item)
+                /api/matakuliah/by-kode           (banyak item)
+       Route Name: 'matakuliah_upsert' / 'matakuliah_upsert_bulk'
+       Methods:
+         - PUT: Buat baru atau timpa matakuliah dengan kode_mk tersebut
+       Note: '/api/matakuliah/by-kode' juga harus SEBELUM
+             matakuliah_detail
+    
+    7. Matakuliah Export (CSV / NDJSON)
+       Pattern: /api/matakuliah/export
+       Route Name: 'matakuliah_export'
+       Methods:
+         - GET: Download seluruh matakuliah (?format=csv|ndjson)
+       Note: Harus didaftarkan SEBELUM matakuliah_detail
+    
+    8. Matakuliah Detail (Read, Update, Delete)
        Pattern: /api/matakuliah/{id}
        Route Name: 'matakuliah_detail'
        Path Parameter: {id} = ID matakuliah (number)
@@ -58,22 +93,38 @@ def includeme(config):
          - DELETE: Hapus matakuliah
        Note: Method ditentukan di @view_config, bukan di sini
     
+    9. Metrics (format Prometheus)
+       Pattern: /metrics
+       Route Name: 'metrics'
+       Methods:
+         - GET: Latency, status, in-progress & ukuran response per route,
+                plus metrics cache / renderer / kompresi
+    
     Args:
         config (Configurator): Objek Pyramid Configurator untuk registrasi
         
     Contoh Output saat dijalankan (debug):
+        Route: static_fingerprinted -> /static/*subpath
+        Route: __static/ -> /static/*subpath
         Route: home -> /
         Route: matakuliah_collection -> /api/matakuliah
+        Route: matakuliah_bulk -> /api/matakuliah/_bulk
+        Route: matakuliah_search -> /api/matakuliah/search
+        Route: matakuliah_upsert_bulk -> /api/matakuliah/by-kode
+        Route: matakuliah_upsert -> /api/matakuliah/by-kode/{kode_mk}
+        Route: matakuliah_export -> /api/matakuliah/export
         Route: matakuliah_detail -> /api/matakuliah/{id}
+        Route: metrics -> /metrics
     """
     
     # ========== STATIC FILES ==========
     # Registrasi direktori untuk static assets (CSS, JS, images, etc)
-    # add_static_view(name, path, **kwds)
-    # - name: Virtual path di URL (/static)
-    # - path: Direktori fisik di project (static/)
-    # - cache_max_age: Browser cache duration dalam detik (3600 = 1 jam)
-    config.add_static_view('static', 'static', cache_max_age=3600)
+    # (lihat assets.py):
+    # - request.static_url() menghasilkan URL ber-content-hash, misal
+    #   /static/theme.1f0e3dad9990.css, di-cache browser 1 tahun (immutable)
+    # - /static/theme.css tanpa hash tetap dilayani dengan cache 1 jam
+    #   (matakuliah.static.max_age)
+    config.include('.assets')
     
     
     # ========== HOME PAGE ROUTE ==========
@@ -101,6 +152,40 @@ def includeme(config):
     config.add_route('matakuliah_collection', '/api/matakuliah')
     
     
+    # ========== API ROUTES - MATAKULIAH BULK ==========
+    # Route untuk operasi massal (lihat views/matakuliah_bulk.py)
+    # Pattern: /api/matakuliah/_bulk
+    #
+    # PENTING: Pyramid mencocokkan route sesuai URUTAN pendaftaran.
+    # Route ini harus berada sebelum matakuliah_detail, kalau tidak
+    # '/api/matakuliah/_bulk' akan dianggap sebagai {id} = '_bulk'.
+    config.add_route('matakuliah_bulk', '/api/matakuliah/_bulk')
+    
+    
+    # ========== API ROUTES - MATAKULIAH SEARCH ==========
+    # Route untuk full-text search nama_mk (lihat views/matakuliah_search.py)
+    # Pattern: /api/matakuliah/search?q=...
+    # Juga harus sebelum matakuliah_detail (alasan sama dengan _bulk).
+    config.add_route('matakuliah_search', '/api/matakuliah/search')
+    
+    
+    # ========== API ROUTES - MATAKULIAH UPSERT ==========
+    # Route untuk insert-or-update berdasarkan kode_mk
+    # (lihat views/matakuliah_upsert.py)
+    # Pattern: /api/matakuliah/by-kode (bulk) dan
+    #          /api/matakuliah/by-kode/{kode_mk} (satu item)
+    # Route bulk juga harus sebelum matakuliah_detail (alasan sama dengan _bulk).
+    config.add_route('matakuliah_upsert_bulk', '/api/matakuliah/by-kode')
+    config.add_route('matakuliah_upsert', '/api/matakuliah/by-kode/{kode_mk}')
+    
+    
+    # ========== API ROUTES - MATAKULIAH EXPORT ==========
+    # Route untuk download katalog CSV / NDJSON (lihat views/matakuliah_export.py)
+    # Pattern: /api/matakuliah/export?format=csv|ndjson
+    # Juga harus sebelum matakuliah_detail (alasan sama dengan _bulk).
+    config.add_route('matakuliah_export', '/api/matakuliah/export')
+    
+    
     # ========== API ROUTES - MATAKULIAH DETAIL ==========
     # Route untuk operasi pada item tertentu (read, update, delete)
     # Pattern: /api/matakuliah/{id}
@@ -127,3 +212,9 @@ def includeme(config):
     #   PUT /api/matakuliah/5      -> matakuliah_update (id=5)
     #   DELETE /api/matakuliah/10  -> matakuliah_delete (id=10)
     config.add_route('matakuliah_detail', '/api/matakuliah/{id}')
+    
+    
+    # ========== METRICS ==========
+    # Endpoint scrape Prometheus (lihat views/metrics.py dan
+    # instrumentation.py)
+    config.add_route('metrics', '/metrics')
@@ -0,0 +1,72 @@
+"""
+SCRIPT - Rekam hasil scan @view_config menjadi view_manifest.json
+
+Cara Menjalankan:
+    build_matakuliah_app_view_manifest
+    build_matakuliah_app_view_manifest --check     # untuk CI
+
+Manifest dipakai production.ini (matakuliah.views.manifest) agar startup
+tidak perlu config.scan() atas seluruh package (lihat startup.py).
+Jalankan ulang setelah menambah, menghapus, atau mengubah decorator view.
+"""
+import argparse
+import json
+import os
+import sys
+
+import matakuliah_app
+from ..startup import ManifestError, record_view_manifest
+
+
+DEFAULT_OUTPUT = os.path.join(
+    os.path.dirname(os.path.abspath(matakuliah_app.__file__)),
+    'view_manifest.json',
+)
+
+
+def dumps_manifest(manifest):
+    # format stabil (indent + sort_keys) agar diff manifest mudah direview
+    return json.dumps(manifest, indent=2, sort_keys=True) + '\n'
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Record the @view_config scan result as a view manifest",
+    )
+    parser.add_argument(
+        '--output', default=DEFAULT_OUTPUT,
+        help='Manifest path (default: matakuliah_app/view_manifest.json)',
+    )
+    parser.add_argument(
+        '--check', action='store_true',
+        help='Do not write; exit 1 if the manifest is missing or stale',
+    )
+    return parser.parse_args(argv[1:])
+
+
+def main(argv=sys.argv):
+    args = parse_args(argv)
+    try:
+        content = dumps_manifest(record_view_manifest(matakuliah_app))
+    except ManifestError as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 2
+
+    if args.check:
+        try:
+            with open(args.output) as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current != content:
+            print(f'{args.output} is stale, run build_matakuliah_app_view_manifest',
+                  file=sys.stderr)
+            return 1
+        print(f'{args.output} is up to date')
+        return 0
+
+    with open(args.output, 'w') as f:
+        f.write(content)
+    count = len(json.loads(content)['views'])
+    print(f'Wrote {count} views to {args.output}')
+    return 0
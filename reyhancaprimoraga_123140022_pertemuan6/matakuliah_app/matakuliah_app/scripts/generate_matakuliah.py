@@ -0,0 +1,207 @@
+"""
+SCRIPT - Generator data sintetis matakuliah untuk benchmark & eksperimen
+
+Cara Menjalankan:
+    generate_matakuliah_app_data development.ini --rows 1000000
+    generate_matakuliah_app_data development.ini --rows 50000 --seed 7 --truncate
+
+Data yang Dihasilkan:
+  - kode_mk  : <prefix prodi><semester><nomor urut>, misal IF3000042;
+               selalu unik untuk setiap baris dalam satu dataset
+  - nama_mk  : gabungan topik + kualifier berbahasa Indonesia, misal
+               "Pengantar Basis Data II"; frekuensi topik tidak merata
+               (topik umum jauh lebih sering muncul) seperti data nyata,
+               sehingga selektivitas search / filter realistis
+  - semester : condong ke semester awal (1-2 paling banyak, 8 paling sedikit)
+  - sks      : didominasi 3 dan 2 SKS, sesekali 1, 4, atau 6 SKS
+
+Determinisme:
+  Dataset sepenuhnya ditentukan oleh (--seed, --rows): seed dan jumlah
+  baris yang sama selalu menghasilkan baris yang sama dengan urutan yang
+  sama, sehingga benchmark dan eksperimen index bisa diulang. Dengan
+  --truncate pada SQLite, id juga dimulai lagi dari 1.
+
+Baris ditulis per chunk dengan multi-row INSERT (models/bulk.py) dan
+di-commit per chunk; throughput (rows/s) dicetak setiap chunk.
+"""
+import argparse
+import itertools
+import random
+import sys
+import time
+
+from pyramid.paster import bootstrap, setup_logging
+from sqlalchemy import func, select, true
+from sqlalchemy.exc import OperationalError
+
+from ..models import Matakuliah
+from ..models.bulk import bulk_delete_matakuliah, bulk_insert_matakuliah
+
+
+DEFAULT_ROWS = 100000
+DEFAULT_CHUNK_SIZE = 10000
+
+# Prefix kode program studi
+PRODI = ('IF', 'SI', 'TI', 'EL', 'MA', 'FI', 'KI', 'BI', 'TK', 'SD')
+
+# Bobot relatif semester 1..8 (semester awal punya lebih banyak matakuliah)
+SEMESTER_WEIGHTS = (22, 20, 16, 13, 11, 8, 6, 4)
+
+# SKS -> bobot relatif
+SKS_WEIGHTS = {1: 4, 2: 30, 3: 52, 4: 10, 6: 4}
+
+TOPIK = (
+    'Algoritma', 'Pemrograman', 'Struktur Data', 'Basis Data',
+    'Jaringan Komputer', 'Sistem Operasi', 'Kalkulus', 'Aljabar Linear',
+    'Statistika', 'Fisika Dasar', 'Kimia Dasar', 'Biologi Sel',
+    'Rekayasa Perangkat Lunak', 'Kecerdasan Buatan', 'Pembelajaran Mesin',
+    'Keamanan Informasi', 'Sistem Terdistribusi', 'Komputasi Awan',
+    'Interaksi Manusia dan Komputer', 'Grafika Komputer', 'Pengolahan Citra',
+    'Sistem Digital', 'Elektronika', 'Sinyal dan Sistem', 'Metode Numerik',
+    'Riset Operasi', 'Manajemen Proyek', 'Kewirausahaan', 'Etika Profesi',
+    'Bahasa Indonesia', 'Bahasa Inggris', 'Pancasila', 'Kewarganegaraan',
+    'Sains Data', 'Visualisasi Data', 'Teori Bahasa dan Automata',
+    'Matematika Diskrit', 'Arsitektur Komputer', 'Pemrograman Web',
+    'Pemrograman Mobile',
+)
+
+KUALIFIER_DEPAN = ('', '', '', 'Pengantar', 'Praktikum', 'Topik Khusus',
+                   'Dasar-Dasar', 'Seminar')
+KUALIFIER_BELAKANG = ('', '', '', 'I', 'II', 'III', 'Lanjut', 'Terapan')
+
+# Bobot topik mengikuti pola Zipf: topik ke-k muncul ~1/k kali topik pertama
+TOPIK_WEIGHTS = tuple(1.0 / rank for rank in range(1, len(TOPIK) + 1))
+
+
+def generate_matakuliah(rows, seed=0):
+    """
+    GENERATOR - Hasilkan `rows` matakuliah sintetis secara deterministik
+
+    Args:
+        rows (int): Jumlah baris
+        seed (int): Seed random; nilai sama -> dataset sama
+
+    Yields:
+        dict: {kode_mk, nama_mk, sks, semester} siap untuk INSERT
+    """
+    rng = random.Random(seed)
+    semesters = range(1, len(SEMESTER_WEIGHTS) + 1)
+    sks_values = tuple(SKS_WEIGHTS)
+    sks_weights = tuple(SKS_WEIGHTS.values())
+    for index in range(rows):
+        # prefix + nomor urut per prefix menjamin kode_mk unik; digit
+        # semester hanya informatif seperti kode matakuliah sungguhan
+        prodi = PRODI[index % len(PRODI)]
+        number = index // len(PRODI)
+        semester = rng.choices(semesters, SEMESTER_WEIGHTS)[0]
+        topik = rng.choices(TOPIK, TOPIK_WEIGHTS)[0]
+        nama = ' '.join(part for part in (
+            rng.choice(KUALIFIER_DEPAN), topik, rng.choice(KUALIFIER_BELAKANG),
+        ) if part)
+        yield {
+            'kode_mk': f'{prodi}{semester}{number:06d}',
+            'nama_mk': nama,
+            'sks': rng.choices(sks_values, sks_weights)[0],
+            'semester': semester,
+        }
+
+
+def fill_matakuliah(tm, dbsession, rows, seed=0, chunk_size=DEFAULT_CHUNK_SIZE,
+                    on_chunk=None):
+    """
+    FUNGSI UTAMA - Tulis dataset sintetis ke tabel matakuliah per chunk
+
+    Args:
+        tm: Transaction manager (request.tm / transaction.manager)
+        dbsession (Session): Session yang di-join ke `tm`
+        rows (int): Jumlah baris
+        seed (int): Seed dataset
+        chunk_size (int): Jumlah baris per commit
+        on_chunk (callable|None): Dipanggil setelah setiap commit dengan
+                                  (jumlah_baris_tertulis, detik)
+
+    Returns:
+        tuple: (jumlah_baris, detik)
+    """
+    records = generate_matakuliah(rows, seed)
+    written = 0
+    started = time.perf_counter()
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            break
+        with tm:
+            bulk_insert_matakuliah(dbsession, chunk)
+        written += len(chunk)
+        if on_chunk is not None:
+            on_chunk(written, time.perf_counter() - started)
+    return written, time.perf_counter() - started
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Fill the matakuliah table with synthetic courses",
+    )
+    parser.add_argument(
+        'config_uri',
+        help='Configuration file, e.g., development.ini',
+    )
+    parser.add_argument(
+        '--rows', type=int, default=DEFAULT_ROWS,
+        help=f'Number of courses to generate (default: {DEFAULT_ROWS})',
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='Random seed; the same seed gives the same dataset (default: 0)',
+    )
+    parser.add_argument(
+        '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f'Rows per commit (default: {DEFAULT_CHUNK_SIZE})',
+    )
+    parser.add_argument(
+        '--truncate', action='store_true',
+        help='Delete all existing matakuliah rows first',
+    )
+    args = parser.parse_args(argv[1:])
+    if args.rows < 0 or args.chunk_size < 1:
+        parser.error('--rows and --chunk-size must be positive')
+    return args
+
+
+def main(argv=sys.argv):
+    args = parse_args(argv)
+    setup_logging(args.config_uri)
+    env = bootstrap(args.config_uri)
+    tm = env['request'].tm
+    dbsession = env['request'].dbsession
+
+    def on_chunk(written, seconds):
+        print(f"{written:,} / {args.rows:,} rows ({written / seconds:,.0f} rows/s)")
+
+    try:
+        with tm:
+            table = Matakuliah.__table__
+            if args.truncate:
+                bulk_delete_matakuliah(dbsession, true())
+            elif dbsession.scalar(select(func.count()).select_from(table)):
+                print('error: matakuliah is not empty, pass --truncate to '
+                      'replace the existing rows', file=sys.stderr)
+                return 2
+        written, seconds = fill_matakuliah(
+            tm, dbsession, args.rows, seed=args.seed,
+            chunk_size=args.chunk_size, on_chunk=on_chunk,
+        )
+    except OperationalError:
+        print('''
+Pyramid is having a problem using your SQL database.  Check that the
+database referred to by the "sqlalchemy.url" setting is running and
+has been migrated with `alembic upgrade head`.
+            ''', file=sys.stderr)
+        return 1
+    finally:
+        env['closer']()
+
+    rate = written / seconds if seconds else 0.0
+    print(f"Done: {written:,} rows in {seconds:.1f}s ({rate:,.0f} rows/s), "
+          f"seed={args.seed}")
+    return 0
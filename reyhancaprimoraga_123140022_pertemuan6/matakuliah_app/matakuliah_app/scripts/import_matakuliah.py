@@ -0,0 +1,369 @@
+"""
+SCRIPT - Import matakuliah dari file CSV / NDJSON berukuran besar
+
+Cara Menjalankan:
+    import_matakuliah_app_data development.ini kurikulum.csv
+    import_matakuliah_app_data development.ini kurikulum.ndjson \
+        --chunk-size 5000 --on-conflict update --rejects ditolak.ndjson
+    # lanjutkan import yang terhenti dari chunk terakhir yang sudah commit
+    import_matakuliah_app_data development.ini kurikulum.csv --resume
+
+Format File:
+  - CSV    : baris header wajib berisi kode_mk,nama_mk,sks,semester
+  - NDJSON : satu JSON object per baris (format sama dengan POST /_bulk)
+  Format ditebak dari ekstensi file, atau dipaksa dengan --format.
+
+Cara Kerja:
+  File dibaca secara streaming dan diproses per chunk (--chunk-size
+  record). Setiap chunk divalidasi dengan aturan yang sama dengan
+  POST /api/matakuliah (validation.py), ditulis dengan multi-row INSERT
+  (atau INSERT ... ON CONFLICT untuk --on-conflict update), lalu di-commit.
+  Memori yang dipakai hanya sebesar satu chunk, berapa pun ukuran file.
+
+Resume:
+  Setelah setiap commit, jumlah record yang sudah diproses disimpan di file
+  checkpoint (default: <file>.checkpoint). Dengan --resume, record yang
+  sudah di-commit dilewati. Jika proses mati tepat di antara commit dan
+  penulisan checkpoint, chunk terakhir diproses ulang; mode "skip" melaporkan
+  baris tersebut sebagai "Already exists" dan mode "update" menulis nilai
+  yang sama, jadi data tetap benar. Checkpoint dihapus setelah import selesai.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+
+from pyramid.paster import bootstrap, setup_logging
+from sqlalchemy.exc import OperationalError
+
+from ..models.bulk import (
+    bulk_insert_matakuliah,
+    find_existing_kode_mk,
+    upsert_matakuliah,
+)
+from ..validation import REQUIRED_FIELDS, extract_fields, validate_matakuliah
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Kolom CSV yang berisi angka (CSV selalu menghasilkan string)
+INTEGER_FIELDS = ('sks', 'semester')
+
+# Ekstensi file -> format
+FORMATS = {
+    '.csv': 'csv',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+}
+
+
+class ImportFileError(Exception):
+    """
+    EXCEPTION - File / checkpoint tidak bisa dipakai untuk import
+    """
+
+
+def _coerce_csv_row(row):
+    item = {key: value for key, value in row.items() if key is not None}
+    for field in INTEGER_FIELDS:
+        value = item.get(field)
+        if isinstance(value, str) and value.strip().lstrip('-').isdigit():
+            item[field] = int(value)
+    return item
+
+
+def read_csv(stream):
+    """
+    HELPER FUNCTION - Baca record CSV secara streaming
+
+    Yields:
+        tuple: (nomor_baris, item, parse_error)
+    """
+    reader = csv.DictReader(stream)
+    missing = [f for f in REQUIRED_FIELDS if f not in (reader.fieldnames or [])]
+    if missing:
+        raise ImportFileError(f"CSV header is missing: {', '.join(missing)}")
+    for row in reader:
+        yield reader.line_num, _coerce_csv_row(row), None
+
+
+def read_ndjson(stream):
+    """
+    HELPER FUNCTION - Baca record NDJSON secara streaming
+
+    Yields:
+        tuple: (nomor_baris, item, parse_error)
+    """
+    for lineno, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield lineno, json.loads(line), None
+        except ValueError:
+            yield lineno, None, {"detail": "Invalid JSON"}
+
+
+READERS = {
+    'csv': read_csv,
+    'ndjson': read_ndjson,
+}
+
+
+def write_chunk(dbsession, chunk, on_conflict):
+    """
+    HELPER FUNCTION - Validasi dan tulis satu chunk record
+
+    Args:
+        dbsession (Session): Session yang terikat ke transaksi
+        chunk (list): List (nomor_baris, item, parse_error)
+        on_conflict (str): "skip" (tolak kode_mk yang sudah ada, seperti
+                           POST) atau "update" (timpa, seperti PUT by-kode)
+
+    Returns:
+        tuple: (jumlah_ditulis, list_penolakan)
+               penolakan = {"line": n, "errors": {...}}
+    """
+    rejected = []
+    pending = {}            # kode_mk -> (baris, row); duplikat dalam chunk ditolak
+    for lineno, item, parse_error in chunk:
+        errors = parse_error or validate_matakuliah(item)
+        if not errors:
+            row = extract_fields(item)
+            if row['kode_mk'] in pending:
+                errors = {"kode_mk": "Duplicate in file"}
+            else:
+                pending[row['kode_mk']] = (lineno, row)
+        if errors:
+            rejected.append({"line": lineno, "errors": errors})
+
+    if on_conflict == 'update':
+        written = len(upsert_matakuliah(
+            dbsession, [row for _, row in pending.values()]
+        ))
+    else:
+        existing = find_existing_kode_mk(dbsession, pending)
+        rows = []
+        for kode_mk, (lineno, row) in pending.items():
+            if kode_mk in existing:
+                rejected.append(
+                    {"line": lineno, "errors": {"kode_mk": "Already exists"}}
+                )
+            else:
+                rows.append(row)
+        written = len(bulk_insert_matakuliah(dbsession, rows))
+    return written, rejected
+
+
+class Checkpoint(object):
+    """
+    CLASS - Posisi terakhir yang sudah di-commit, disimpan sebagai JSON
+
+    File checkpoint mencatat path dan ukuran file sumber agar --resume
+    tidak dipakai untuk file yang sudah berubah.
+    """
+
+    def __init__(self, path, source):
+        self.path = path
+        self.source = os.path.abspath(source)
+
+    @property
+    def size(self):
+        return os.path.getsize(self.source)
+
+    def load(self):
+        """
+        Returns:
+            dict: {"records": n, "imported": n, "rejected": n}
+
+        Raises:
+            ImportFileError: Checkpoint tidak ada / milik file lain
+        """
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            raise ImportFileError(f"No usable checkpoint at {self.path}")
+        if state.get('source') != self.source or state.get('size') != self.size:
+            raise ImportFileError(
+                f"Checkpoint {self.path} belongs to a different or modified file"
+            )
+        return state
+
+    def save(self, records, imported, rejected):
+        state = {
+            'source': self.source,
+            'size': self.size,
+            'records': records,
+            'imported': imported,
+            'rejected': rejected,
+        }
+        # tulis ke file sementara lalu rename agar checkpoint tidak pernah
+        # setengah tertulis jika proses mati di tengah jalan
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def import_matakuliah(tm, dbsession, records, chunk_size=DEFAULT_CHUNK_SIZE,
+                      on_conflict='skip', start=None, on_chunk=None):
+    """
+    FUNGSI UTAMA - Import record per chunk, satu commit per chunk
+
+    Args:
+        tm: Transaction manager (request.tm / transaction.manager)
+        dbsession (Session): Session yang di-join ke `tm`
+        records (iterable): Hasil read_csv() / read_ndjson()
+        chunk_size (int): Jumlah record per commit
+        on_conflict (str): "skip" atau "update" (lihat write_chunk)
+        start (dict|None): State checkpoint untuk melanjutkan import
+        on_chunk (callable|None): Dipanggil setelah setiap commit dengan
+                                  (stats, rejected_chunk)
+
+    Returns:
+        dict: {"records", "imported", "rejected", "seconds", "rate"}
+              records/imported/rejected termasuk run sebelumnya (resume),
+              seconds dan rate (record/detik) hanya untuk run ini
+    """
+    stats = {'records': 0, 'imported': 0, 'rejected': 0}
+    if start:
+        stats.update((key, start[key]) for key in stats)
+    records = iter(records)
+    # lewati record yang sudah di-commit pada run sebelumnya
+    skipped = sum(1 for _ in itertools.islice(records, stats['records']))
+    if skipped < stats['records']:
+        raise ImportFileError("Checkpoint is past the end of the file")
+
+    def timing():
+        seconds = time.perf_counter() - started
+        done = stats['records'] - skipped
+        return {'seconds': seconds, 'rate': done / seconds if seconds else 0.0}
+
+    started = time.perf_counter()
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            break
+        with tm:
+            written, rejected = write_chunk(dbsession, chunk, on_conflict)
+        stats['records'] += len(chunk)
+        stats['imported'] += written
+        stats['rejected'] += len(rejected)
+        if on_chunk is not None:
+            on_chunk(dict(stats, **timing()), rejected)
+
+    stats.update(timing())
+    return stats
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Import matakuliah from a CSV or NDJSON file",
+    )
+    parser.add_argument(
+        'config_uri',
+        help='Configuration file, e.g., development.ini',
+    )
+    parser.add_argument('path', help='CSV or NDJSON file to import')
+    parser.add_argument(
+        '--format', choices=sorted(READERS),
+        help='File format (default: from the file extension)',
+    )
+    parser.add_argument(
+        '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f'Records per commit (default: {DEFAULT_CHUNK_SIZE})',
+    )
+    parser.add_argument(
+        '--on-conflict', choices=('skip', 'update'), default='skip',
+        help='What to do with an existing kode_mk (default: skip)',
+    )
+    parser.add_argument(
+        '--checkpoint',
+        help='Checkpoint file (default: <path>.checkpoint)',
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help='Continue after the last committed chunk',
+    )
+    parser.add_argument(
+        '--rejects',
+        help='Write rejected records to this NDJSON file',
+    )
+    args = parser.parse_args(argv[1:])
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be a positive integer')
+    if args.format is None:
+        extension = os.path.splitext(args.path)[1].lower()
+        if extension not in FORMATS:
+            parser.error('cannot guess the format, pass --format')
+        args.format = FORMATS[extension]
+    return args
+
+
+def main(argv=sys.argv):
+    args = parse_args(argv)
+    setup_logging(args.config_uri)
+
+    checkpoint = Checkpoint(
+        args.checkpoint or args.path + '.checkpoint', args.path
+    )
+    try:
+        start = checkpoint.load() if args.resume else None
+    except ImportFileError as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 2
+    if start:
+        print(f"Resuming after {start['records']:,} records")
+
+    rejects = None
+    if args.rejects:
+        rejects = open(args.rejects, 'a' if start else 'w')
+
+    def on_chunk(stats, rejected):
+        checkpoint.save(stats['records'], stats['imported'], stats['rejected'])
+        if rejects is not None:
+            for reject in rejected:
+                rejects.write(json.dumps(reject) + '\n')
+        print(f"{stats['records']:,} records: {stats['imported']:,} imported, "
+              f"{stats['rejected']:,} rejected ({stats['rate']:,.0f} rows/s)")
+
+    env = bootstrap(args.config_uri)
+    try:
+        with open(args.path, newline='', encoding='utf-8') as stream:
+            stats = import_matakuliah(
+                env['request'].tm,
+                env['request'].dbsession,
+                READERS[args.format](stream),
+                chunk_size=args.chunk_size,
+                on_conflict=args.on_conflict,
+                start=start,
+                on_chunk=on_chunk,
+            )
+    except ImportFileError as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 2
+    except OperationalError:
+        print('''
+Pyramid is having a problem using your SQL database.  Check that the
+database referred to by the "sqlalchemy.url" setting is running and
+has been migrated with `alembic upgrade head`.  Re-run with --resume
+to continue after the last committed chunk.
+            ''', file=sys.stderr)
+        return 1
+    finally:
+        if rejects is not None:
+            rejects.close()
+        env['closer']()
+
+    checkpoint.clear()
+    print(f"Done: {stats['records']:,} records in {stats['seconds']:.1f}s "
+          f"({stats['rate']:,.0f} rows/s), {stats['imported']:,} imported, "
+          f"{stats['rejected']:,} rejected")
+    return 0
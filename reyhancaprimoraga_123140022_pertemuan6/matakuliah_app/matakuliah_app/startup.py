@@ -0,0 +1,256 @@
+"""
+MODUL STARTUP - Profiling startup app factory + registrasi view dari manifest
+
+Cold start worker (pserve / gunicorn / autoscaling) = import modul +
+main(). Modul ini membantu mengukur dan mengurangi waktu tersebut:
+
+1. StartupProfiler
+   main() mencatat durasi setiap fase (Configurator, setiap include,
+   scan / manifest view, commit action Pyramid). Komponen di dalam
+   include bisa menambah sub-fase lewat startup_phase(), misal
+   models.includeme() untuk pembuatan engine dan configure_mappers.
+   Laporan ditulis ke log (INFO) dan disimpan di
+   `registry['startup_profile']`:
+
+       Startup 0.512s
+         configurator                 0.004s
+         include .models              0.301s
+           engine                     0.002s
+           mappers                    0.010s
+         scan                         0.081s
+         commit                       0.046s
+
+2. View manifest (pengganti config.scan() untuk production)
+   config.scan() mengimpor SELURUH modul package (termasuk scripts/) dan
+   menelusuri semua atributnya untuk mencari decorator @view_config.
+   Manifest adalah hasil scan yang sudah direkam ke JSON
+   (view_manifest.json); saat startup hanya modul view yang diimpor dan
+   setiap view didaftarkan langsung.
+
+       build_matakuliah_app_view_manifest            # tulis ulang manifest
+       build_matakuliah_app_view_manifest --check    # gagal jika basi
+
+   Aktifkan dengan setting:
+       matakuliah.views.manifest = matakuliah_app:view_manifest.json
+
+   Decorator @view_config tetap menjadi sumber kebenaran; manifest WAJIB
+   dibuat ulang setelah menambah / mengubah view (tests/test_startup.py
+   gagal jika manifest tidak sama dengan hasil scan).
+"""
+from contextlib import contextmanager, nullcontext
+import json
+import logging
+import subprocess
+import sys
+import time
+
+from pyramid.path import AssetResolver
+import venusian
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+MANIFEST_VERSION = 1
+
+# Directive config yang bisa direkam (semua menerima argumen view=...)
+RECORDABLE_DIRECTIVES = (
+    'add_view',
+    'add_notfound_view',
+    'add_forbidden_view',
+    'add_exception_view',
+)
+
+
+class ManifestError(Exception):
+    """
+    EXCEPTION - Manifest view tidak bisa dibuat / dibaca
+    """
+
+
+class StartupProfiler(object):
+    """
+    CLASS - Pencatat durasi fase startup (boleh bersarang)
+
+    Args:
+        clock (callable): Sumber waktu (default time.perf_counter)
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._depth = 0
+        self.phases = []            # [kedalaman, nama, detik]
+
+    @contextmanager
+    def phase(self, name):
+        entry = [self._depth, name, 0.0]
+        self.phases.append(entry)
+        self._depth += 1
+        started = self._clock()
+        try:
+            yield
+        finally:
+            entry[2] = self._clock() - started
+            self._depth -= 1
+
+    def include(self, config, name):
+        """Jalankan config.include(name) sebagai satu fase."""
+        with self.phase(f'include {name}'):
+            config.include(name)
+
+    @property
+    def total(self):
+        return sum(seconds for depth, _, seconds in self.phases if depth == 0)
+
+    def as_dict(self):
+        """
+        Returns:
+            dict: {"total": detik, "phases": [{"name", "depth", "seconds"}]}
+        """
+        return {
+            'total': self.total,
+            'phases': [
+                {'name': name, 'depth': depth, 'seconds': seconds}
+                for depth, name, seconds in self.phases
+            ],
+        }
+
+    def report(self):
+        lines = [f'Startup {self.total:.3f}s']
+        for depth, name, seconds in self.phases:
+            label = '  ' * (depth + 1) + name
+            lines.append(f'{label:<36} {seconds:.3f}s')
+        return '\n'.join(lines)
+
+
+def startup_phase(registry, name):
+    """
+    HELPER FUNCTION - Sub-fase startup dari dalam includeme()
+
+    Returns:
+        context manager: Fase baru jika main() sedang memprofile startup,
+                         no-op jika tidak (misal includeme dipanggil test)
+    """
+    profiler = registry.get('startup_profiler') if registry is not None else None
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+
+# Script interpreter baru untuk measure_cold_start(): import + main()
+_COLD_START_SCRIPT = '''
+import json, sys, time
+started = time.perf_counter()
+from matakuliah_app import main
+app = main({}, **json.loads(sys.argv[1]))
+print(json.dumps({"seconds": time.perf_counter() - started,
+                  "profile": app.registry["startup_profile"]}))
+'''
+
+
+def measure_cold_start(settings):
+    """
+    HELPER FUNCTION - Ukur cold start di interpreter baru (subprocess)
+
+    Dipakai oleh benchmarks/bench_startup.py dan tests/test_startup.py.
+
+    Args:
+        settings (dict): Settings untuk main() (harus bisa di-JSON-kan)
+
+    Returns:
+        dict: {"seconds": waktu import + main(),
+               "profile": registry['startup_profile'] proses tersebut}
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', _COLD_START_SCRIPT, json.dumps(settings)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class _RecordingConfig(object):
+    """
+    HELPER CLASS - Pengganti Configurator untuk venusian yang hanya
+    merekam directive yang dipanggil callback decorator
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def with_package(self, package):
+        return self
+
+    def __getattr__(self, directive):
+        if directive not in RECORDABLE_DIRECTIVES:
+            raise ManifestError(f"Cannot record config.{directive}() in a manifest")
+
+        def record(view, **settings):
+            settings = {k: v for k, v in settings.items() if not k.startswith('_')}
+            try:
+                json.dumps(settings)
+            except TypeError:
+                raise ManifestError(
+                    f"{view.__module__}.{view.__qualname__}: view settings "
+                    f"are not JSON serializable"
+                )
+            self.entries.append({
+                'directive': directive,
+                'view': f'{view.__module__}:{view.__qualname__}',
+                'settings': settings,
+            })
+
+        return record
+
+
+def record_view_manifest(package):
+    """
+    FUNGSI UTAMA - Rekam hasil scan decorator view menjadi manifest
+
+    Args:
+        package (module): Package yang biasanya di-scan (matakuliah_app)
+
+    Returns:
+        dict: {"version": 1, "views": [{"directive", "view", "settings"}]}
+              urutan view = urutan yang dihasilkan config.scan()
+    """
+    recorder = _RecordingConfig()
+    venusian.Scanner(config=recorder).scan(package, categories=('pyramid',))
+    return {'version': MANIFEST_VERSION, 'views': recorder.entries}
+
+
+def read_view_manifest(spec):
+    """
+    HELPER FUNCTION - Baca manifest dari asset spec / path
+
+    Raises:
+        ManifestError: File tidak ada / format tidak dikenal
+    """
+    path = AssetResolver().resolve(spec).abspath()
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ManifestError(f"Cannot read view manifest {spec}: {e}")
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ManifestError(f"Unsupported view manifest version in {spec}")
+    return manifest
+
+
+def load_view_manifest(config, spec):
+    """
+    FUNGSI UTAMA - Daftarkan view dari manifest (pengganti config.scan())
+
+    Args:
+        config (Configurator): Configurator aplikasi
+        spec (str): Asset spec manifest, misal
+                    'matakuliah_app:view_manifest.json'
+
+    Returns:
+        int: Jumlah view yang didaftarkan
+    """
+    manifest = read_view_manifest(spec)
+    for entry in manifest['views']:
+        # with_package: renderer / asset spec relatif di-resolve terhadap
+        # modul view, sama seperti saat didaftarkan oleh scan
+        module = entry['view'].split(':', 1)[0]
+        directive = getattr(config.with_package(module), entry['directive'])
+        directive(view=entry['view'], **entry['settings'])
+    return len(manifest['views'])
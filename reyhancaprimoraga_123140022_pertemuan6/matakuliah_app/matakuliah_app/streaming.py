@@ -0,0 +1,205 @@
+"""
+MODUL STREAMING - Response JSON bertahap (streaming) untuk export penuh
+
+Modul ini menyediakan generator `app_iter` yang menulis envelope response
+standard (lihat create_response di views/matakuliah.py) sepotong demi
+sepotong, sambil membaca baris dari database memakai server-side cursor
+(`yield_per`). Generator yang sama dipakai untuk export CSV / NDJSON
+(iter_export_rows), dan body bisa dikompres gzip sambil ditulis
+(gzip_chunks).
+
+Keuntungan dibanding response biasa:
+  - Memori per request konstan: hanya satu batch baris yang ada di memori
+  - Byte pertama terkirim sebelum query selesai dibaca seluruhnya
+  - Tidak ada ORM identity map: baris dibaca sebagai Core row mapping
+
+Catatan Penting:
+  Generator dijalankan oleh WSGI server SETELAH view selesai dan
+  pyramid_tm sudah menutup request.dbsession. Karena itu streaming memakai
+  session sendiri (lihat models.open_stream_session) yang ditutup ketika
+  generator selesai atau ketika client memutus koneksi.
+"""
+import csv
+import io
+import logging
+import zlib
+
+from sqlalchemy import select
+
+from .renderers import dumps
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+# Jumlah baris per batch fetch dari database (dan per chunk yang ditulis)
+DEFAULT_BATCH_SIZE = 1000
+
+# Level kompresi gzip untuk body streaming; 6 = default zlib, kompromi
+# yang baik antara CPU dan ukuran untuk teks CSV / JSON
+DEFAULT_GZIP_LEVEL = 6
+
+
+def _csv_chunk(partition, columns, header=False):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    if header:
+        writer.writerow(columns)
+    writer.writerows([row[name] for name in columns] for row in partition)
+    return buffer.getvalue().encode('utf-8')
+
+
+def _ndjson_chunk(partition, columns, header=False):
+    return b''.join(dumps(dict(row)) + b'\n' for row in partition)
+
+
+# Format export -> (penulis satu batch baris, Content-Type)
+EXPORT_FORMATS = {
+    'csv': (_csv_chunk, 'text/csv'),
+    'ndjson': (_ndjson_chunk, 'application/x-ndjson'),
+}
+
+
+def iter_json_collection(dbsession, statement, envelope, collection_key,
+                         batch_size=DEFAULT_BATCH_SIZE, close_session=True):
+    """
+    GENERATOR - Tulis envelope JSON + isi koleksi secara bertahap
+
+    Output akhir identik secara struktur dengan create_response():
+        {"success":true,"code":200,...,"data":{"<key>":[...],"total":N}}
+
+    Args:
+        dbsession (Session): Session yang dipakai khusus untuk stream ini
+        statement (Select): Core select yang menghasilkan baris koleksi
+        envelope (dict): Field envelope (success, code, message, timestamp)
+        collection_key (str): Nama key list di dalam "data"
+        batch_size (int): Jumlah baris per fetch / per chunk output
+        close_session (bool): Tutup session setelah stream selesai
+
+    Yields:
+        bytes: Potongan body response (UTF-8)
+    """
+    try:
+        # Kepala envelope: buang '}' penutup lalu buka objek "data"
+        head = dumps(envelope)[:-1]
+        yield head + (',"data":{"%s":[' % collection_key).encode('utf-8')
+
+        result = dbsession.execute(
+            statement.execution_options(yield_per=batch_size)
+        )
+        total = 0
+        for partition in result.mappings().partitions():
+            chunk = b','.join(dumps(dict(row)) for row in partition)
+            if total:
+                chunk = b',' + chunk
+            total += len(partition)
+            yield chunk
+
+        # Ekor envelope: tutup list, tulis total, tutup "data" & root
+        yield ('],"total":%d}}' % total).encode('utf-8')
+        log.info(f"Streamed {total} {collection_key} records")
+
+    except Exception as e:
+        # Status & header sudah terkirim, jadi error hanya bisa di-log.
+        # Body JSON yang terpotong menandakan kegagalan ke client.
+        log.error(f"Error while streaming {collection_key}: {str(e)}")
+        raise
+
+    finally:
+        if close_session:
+            dbsession.close()
+
+
+def collection_statement(model, criteria=(), order_by=None, fields=None):
+    """
+    HELPER FUNCTION - Select Core seluruh kolom tabel, urut berdasarkan id
+
+    Args:
+        model: Kelas ORM (misal Matakuliah)
+        criteria (iterable): Klausa WHERE tambahan (misal dari filter)
+        order_by (list|None): Klausa ORDER BY; None = urut id
+        fields (tuple|None): Hanya kolom ini (sparse fieldset); None = semua
+
+    Returns:
+        Select: Statement siap dipakai iter_json_collection()
+    """
+    table = model.__table__
+    columns = [table] if fields is None else [table.c[name] for name in fields]
+    return (
+        select(*columns)
+        .where(*criteria)
+        .order_by(*(order_by if order_by is not None else [table.c.id]))
+    )
+
+
+def iter_export_rows(dbsession, statement, export_format,
+                     batch_size=DEFAULT_BATCH_SIZE, close_session=True):
+    """
+    GENERATOR - Tulis baris hasil query sebagai CSV / NDJSON secara bertahap
+
+    Tidak ada envelope: setiap baris database menjadi satu baris output
+    (CSV diawali header nama kolom), sehingga file bisa langsung dibaca
+    tool lain (spreadsheet, pandas, jq, import_matakuliah_app_data).
+
+    Args:
+        dbsession (Session): Session yang dipakai khusus untuk stream ini
+        statement (Select): Core select (lihat collection_statement)
+        export_format (str): Key EXPORT_FORMATS ("csv" / "ndjson")
+        batch_size (int): Jumlah baris per fetch / per chunk output
+        close_session (bool): Tutup session setelah stream selesai
+
+    Yields:
+        bytes: Potongan body response (UTF-8), satu per batch
+    """
+    write_chunk, _ = EXPORT_FORMATS[export_format]
+    columns = [column.key for column in statement.selected_columns]
+    try:
+        result = dbsession.execute(
+            statement.execution_options(yield_per=batch_size)
+        )
+        total = 0
+        for partition in result.mappings().partitions():
+            yield write_chunk(partition, columns, header=not total)
+            total += len(partition)
+        if not total and export_format == 'csv':
+            # tabel kosong: tetap kirim header agar file CSV valid
+            yield _csv_chunk((), columns, header=True)
+        log.info(f"Exported {total} rows as {export_format}")
+
+    except Exception as e:
+        log.error(f"Error while exporting {export_format}: {str(e)}")
+        raise
+
+    finally:
+        if close_session:
+            dbsession.close()
+
+
+def gzip_chunks(chunks, level=DEFAULT_GZIP_LEVEL):
+    """
+    GENERATOR - Kompres body streaming dengan gzip sambil ditulis
+
+    Setiap chunk input di-flush (Z_SYNC_FLUSH) sehingga client bisa
+    mendekompres data yang sudah diterima tanpa menunggu stream selesai,
+    dan memori tetap sebatas satu chunk + window zlib (32 KB).
+
+    Args:
+        chunks (iterable): Potongan body (bytes), misal iter_export_rows()
+        level (int): Level kompresi zlib 1-9
+
+    Yields:
+        bytes: Potongan body dalam format gzip (Content-Encoding: gzip)
+    """
+    # wbits=31 -> header & trailer gzip (bukan zlib mentah)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        # client memutus koneksi: tutup generator sumber (dan session-nya)
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
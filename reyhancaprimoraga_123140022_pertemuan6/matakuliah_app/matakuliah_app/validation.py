@@ -0,0 +1,82 @@
+"""
+MODUL VALIDASI - Aturan validasi input Matakuliah
+
+Aturan validasi dipusatkan di sini agar endpoint single (POST/PUT),
+endpoint bulk, dan script import memakai aturan yang PERSIS sama.
+
+Aturan:
+  - kode_mk  : wajib, string
+  - nama_mk  : wajib, string
+  - sks      : wajib, integer positif (> 0)
+  - semester : wajib, integer positif (> 0)
+"""
+
+# Field wajib untuk membuat matakuliah baru (urutan dipakai di pesan error)
+REQUIRED_FIELDS = ['kode_mk', 'nama_mk', 'sks', 'semester']
+
+# Field yang boleh diubah oleh update (PUT/PATCH)
+UPDATABLE_FIELDS = ['kode_mk', 'nama_mk', 'sks', 'semester']
+
+
+def _is_string(value):
+    return isinstance(value, str)
+
+
+def _is_positive_int(value):
+    return isinstance(value, int) and value > 0
+
+
+# Pemeriksa tipe per field beserta pesan error-nya
+FIELD_RULES = {
+    'kode_mk': (_is_string, "Must be a string"),
+    'nama_mk': (_is_string, "Must be a string"),
+    'sks': (_is_positive_int, "Must be a positive integer"),
+    'semester': (_is_positive_int, "Must be a positive integer"),
+}
+
+
+def validate_matakuliah(data, partial=False):
+    """
+    HELPER FUNCTION - Validasi satu payload matakuliah
+
+    Args:
+        data (dict): Payload dari client
+        partial (bool): True untuk update sebagian (field tidak wajib ada)
+
+    Returns:
+        dict: Error validasi; kosong ({}) jika valid.
+              - {"missing_fields": [...]} jika ada field wajib yang hilang
+              - {"<field>": "<pesan>"} untuk field dengan tipe salah
+              - {"detail": "..."} jika payload bukan JSON object
+
+    Contoh:
+        >>> validate_matakuliah({"kode_mk": "IF101"})
+        {'missing_fields': ['nama_mk', 'sks', 'semester']}
+    """
+    if not isinstance(data, dict):
+        return {"detail": "Must be a JSON object"}
+
+    # STEP 1: field wajib (hanya untuk create)
+    if not partial:
+        missing_fields = [f for f in REQUIRED_FIELDS if f not in data]
+        if missing_fields:
+            return {"missing_fields": missing_fields}
+
+    # STEP 2: tipe data setiap field yang dikirim
+    errors = {}
+    for field, (check, message) in FIELD_RULES.items():
+        if field in data and not check(data[field]):
+            errors[field] = message
+    return errors
+
+
+def extract_fields(data, fields=UPDATABLE_FIELDS):
+    """
+    HELPER FUNCTION - Ambil hanya kolom matakuliah dari payload
+
+    Key lain (misal "id") diabaikan agar tidak ikut ditulis ke database.
+
+    Returns:
+        dict: {field: value} untuk field yang ada di payload
+    """
+    return {f: data[f] for f in fields if f in data}
@@ -1,3 +1,8 @@
 from . import matakuliah
+from . import matakuliah_bulk
+from . import matakuliah_export
+from . import matakuliah_search
+from . import matakuliah_upsert
+from . import metrics
 from . import default
 from . import notfound
@@ -31,7 +31,35 @@ Kontribusi ke Kriteria Penilaian:
 """
 from pyramid.view import view_config
 from pyramid.response import Response
-from ..models import Matakuliah
+from pyramid.settings import asbool
+from ..cache import MISSING, cache_key, get_cache
+from ..conditional import not_modified_response, resource_etag, set_etag
+from ..fieldsets import FieldsetError, parse_fields, project, select_columns
+from ..models import Matakuliah, open_stream_session
+from ..models.bulk import bulk_delete_matakuliah, bulk_update_matakuliah
+from ..filters import (
+    FilterError,
+    build_criteria,
+    filters_from_params,
+    order_by_clauses,
+    parse_sort,
+)
+from ..pagination import (
+    PaginationError,
+    encode_page_cursor,
+    get_page_settings,
+    keyset_criterion,
+    parse_limit,
+    parse_page_cursor,
+)
+from ..validation import extract_fields, validate_matakuliah
+from ..streaming import (
+    DEFAULT_BATCH_SIZE,
+    collection_statement,
+    iter_json_collection,
+)
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 import logging
 from datetime import datetime
 import traceback
@@ -117,7 +145,29 @@ def matakuliah_list(request):
     Route Name: matakuliah_collection
     URL Pattern: /api/matakuliah
     
-    Query Parameters: Tidak ada (bisa ditambahkan untuk pagination)
+    Query Parameters (keyset pagination):
+      - limit: Jumlah item per halaman (default 50, maksimum 500;
+               nilai lebih besar dipotong ke batas maksimum)
+      - after: Cursor opaque dari `next_cursor` halaman sebelumnya
+    
+    Query Parameters (filter & sort, semuanya opsional):
+      - semester: Hanya semester tertentu (integer)
+      - sks_min / sks_max: Rentang SKS inklusif (integer)
+      - kode_mk_prefix: kode_mk diawali string ini (misal IF1)
+      - sort: id | kode_mk | nama_mk | semester | sks, awalan '-' untuk
+              descending (default id). Cursor `after` hanya valid untuk
+              kombinasi filter & sort yang sama.
+    
+    Query Parameter Sparse Fieldset:
+      - fields: Kolom yang dikembalikan, dipisah koma (misal
+                fields=kode_mk,nama_mk). Data dibaca dengan Core select()
+                tanpa membuat object ORM. Default: semua kolom.
+    
+    Query Parameter Streaming:
+      - stream=1: Export SEMUA matakuliah (yang lolos filter, urut sesuai
+                  sort) sebagai streaming response. Envelope yang sama
+                  ditulis bertahap dari server-side cursor; limit/after
+                  diabaikan dan next_cursor tidak ada.
     
     Request Body: Tidak ada
     
@@ -132,10 +182,36 @@ def matakuliah_list(request):
               {"id": 1, "kode_mk": "IF101", "nama_mk": "...", ...},
               {"id": 2, "kode_mk": "IF102", "nama_mk": "...", ...}
             ],
-            "total": 2
+            "total": 2,
+            "limit": 2,
+            "next_cursor": "eyJpZCI6Mn0"
           }
         }
     
+      - total: Jumlah item pada halaman ini
+      - next_cursor: null jika sudah halaman terakhir
+    
+    Conditional GET:
+      Response 200 membawa header ETag. Kirim kembali lewat
+      If-None-Match; jika data belum berubah server membalas
+      304 Not Modified tanpa body.
+    
+    Error Response (400 - Parameter Pagination Tidak Valid):
+        {
+          "success": false,
+          "code": 400,
+          "message": "Invalid pagination parameters",
+          "errors": {"detail": "Invalid cursor"}
+        }
+    
+    Error Response (400 - Parameter Filter/Sort Tidak Valid):
+        {
+          "success": false,
+          "code": 400,
+          "message": "Invalid filter parameters",
+          "errors": {"detail": "sks_min must be an integer"}
+        }
+    
     Error Response (500):
         {
           "success": false,
@@ -146,22 +222,106 @@ def matakuliah_list(request):
     
     Curl Testing:
         curl -X GET http://localhost:6543/api/matakuliah
+        curl -X GET "http://localhost:6543/api/matakuliah?limit=20&after=eyJpZCI6MjB9"
+        curl -X GET "http://localhost:6543/api/matakuliah?semester=3&kode_mk_prefix=IF&sort=kode_mk"
+        curl -X GET "http://localhost:6543/api/matakuliah?fields=kode_mk,nama_mk"
+        curl -N -X GET "http://localhost:6543/api/matakuliah?stream=1"
     """
     try:
-        # Query semua matakuliah dari database
-        matakuliahs = request.dbsession.query(Matakuliah).all()
+        # CONDITIONAL GET: jika data tidak berubah sejak ETag milik client,
+        # langsung balas 304 tanpa query ORM dan tanpa renderer
+        etag = resource_etag(request, Matakuliah.__tablename__)
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        # STEP 1: VALIDASI PARAMETER FILTER, SORT & FIELDS
+        table = Matakuliah.__table__
+        try:
+            criteria = build_criteria(table, filters_from_params(request.params))
+            sort = parse_sort(request.params.get('sort'))
+            fields = parse_fields(request.params.get('fields'), table)
+        except (FilterError, FieldsetError) as e:
+            request.response.status = 400
+            log.warning(f"Invalid filter parameters: {str(e)}")
+            return create_response(
+                success=False,
+                code=400,
+                message="Invalid filter parameters",
+                errors={"detail": str(e)}
+            )
+        
+        # MODE STREAMING: export penuh dengan memori konstan
+        if asbool(request.params.get('stream')):
+            response = _matakuliah_stream_response(request, criteria, sort, fields)
+            set_etag(response, etag)
+            return response
+        
+        # STEP 2: VALIDASI PARAMETER PAGINATION
+        default_size, max_size = get_page_settings(request.registry.settings)
+        try:
+            limit = parse_limit(request.params.get('limit'), default_size, max_size)
+            after = parse_page_cursor(request.params.get('after'), sort)
+        except PaginationError as e:
+            request.response.status = 400
+            log.warning(f"Invalid pagination parameters: {str(e)}")
+            return create_response(
+                success=False,
+                code=400,
+                message="Invalid pagination parameters",
+                errors={"detail": str(e)}
+            )
+        
+        # STEP 3: QUERY SATU HALAMAN (KEYSET PADA (kolom sort, id))
+        # Ambil limit + 1 baris: baris ekstra hanya penanda ada halaman berikutnya
+        if after is not None:
+            criteria = criteria + [keyset_criterion(table, sort, after)]
+        order_by = order_by_clauses(table, sort)
+        if fields is None:
+            rows = (
+                request.dbsession.query(Matakuliah)
+                .filter(*criteria)
+                .order_by(*order_by)
+                .limit(limit + 1)
+                .all()
+            )
+        else:
+            # SPARSE FIELDSET: Core select kolom yang diminta (+ id & kolom
+            # sort untuk cursor), tanpa object ORM / identity map
+            rows = request.dbsession.execute(
+                select(*select_columns(table, fields, ('id', sort[0])))
+                .where(*criteria)
+                .order_by(*order_by)
+                .limit(limit + 1)
+            ).all()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_page_cursor(sort, rows[-1])
+        
+        if fields is None:
+            matakuliahs = [m.to_dict() for m in rows]
+        else:
+            matakuliahs = [project(row._mapping, fields) for row in rows]
         
         # Log informasi
         log.info(f"Retrieved {len(matakuliahs)} matakuliah records")
         
+        # Sertakan ETag agar polling berikutnya bisa memakai If-None-Match
+        set_etag(request.response, etag)
+        
         # Return success response dengan data
         return create_response(
             success=True,
             code=200,
             message="Matakuliah data retrieved successfully",
             data={
-                "matakuliahs": [m.to_dict() for m in matakuliahs],
-                "total": len(matakuliahs)
+                "matakuliahs": matakuliahs,
+                "total": len(matakuliahs),
+                "limit": limit,
+                "next_cursor": next_cursor
             }
         )
     
@@ -181,6 +341,52 @@ def matakuliah_list(request):
         )
 
 
+def _matakuliah_stream_response(request, criteria=(), sort=None, fields=None):
+    """
+    HELPER FUNCTION - Buat streaming response untuk GET /api/matakuliah?stream=1
+    
+    Body ditulis oleh generator streaming.iter_json_collection() memakai
+    session terpisah dari request.dbsession (lihat models.open_stream_session).
+    
+    Args:
+        request: Pyramid request object
+        criteria (list): Klausa WHERE dari filters.build_criteria()
+        sort (tuple|None): (nama_kolom, descending); None = urut id
+        fields (tuple|None): Kolom yang dikirim; None = semua kolom
+    
+    Returns:
+        Response: Response dengan app_iter generator (chunked transfer)
+    """
+    dbsession, owned = open_stream_session(request)
+    batch_size = int(request.registry.settings.get(
+        'matakuliah.stream_batch_size', DEFAULT_BATCH_SIZE
+    ))
+    envelope = create_response(
+        success=True,
+        code=200,
+        message="Matakuliah data retrieved successfully"
+    )
+    app_iter = iter_json_collection(
+        dbsession,
+        collection_statement(
+            Matakuliah,
+            criteria,
+            order_by_clauses(Matakuliah.__table__, sort) if sort else None,
+            fields,
+        ),
+        envelope,
+        "matakuliahs",
+        batch_size=batch_size,
+        close_session=owned,
+    )
+    log.info("Streaming matakuliah collection")
+    return Response(
+        app_iter=app_iter,
+        content_type='application/json',
+        charset='utf-8',
+    )
+
+
 @view_config(route_name='matakuliah_collection', request_method='POST', renderer='json')
 def matakuliah_create(request):
     """
@@ -242,41 +448,12 @@ def matakuliah_create(request):
         # Parse JSON body dari request
         data = request.json_body
         
-        # STEP 1: VALIDASI FIELD WAJIB
-        # Cek apakah semua required fields ada di request
-        required_fields = ['kode_mk', 'nama_mk', 'sks', 'semester']
-        missing_fields = [field for field in required_fields if field not in data]
-        
-        if missing_fields:
-            # Ada field yang hilang
-            request.response.status = 400
-            log.warning(f"Missing fields: {missing_fields}")
-            return create_response(
-                success=False,
-                code=400,
-                message="Validation failed",
-                errors={"missing_fields": missing_fields}
-            )
-        
-        # STEP 2: VALIDASI TIPE DATA
-        # Cek apakah tipe data setiap field benar
-        validation_errors = {}
-        
-        # Validasi kode_mk: harus string
-        if not isinstance(data.get('kode_mk'), str):
-            validation_errors['kode_mk'] = "Must be a string"
-        
-        # Validasi nama_mk: harus string
-        if not isinstance(data.get('nama_mk'), str):
-            validation_errors['nama_mk'] = "Must be a string"
-        
-        # Validasi sks: harus integer dan positif (> 0)
-        if not isinstance(data.get('sks'), int) or data.get('sks') <= 0:
-            validation_errors['sks'] = "Must be a positive integer"
-        
-        # Validasi semester: harus integer dan positif (> 0)
-        if not isinstance(data.get('semester'), int) or data.get('semester') <= 0:
-            validation_errors['semester'] = "Must be a positive integer"
+        # STEP 1 & 2: VALIDASI FIELD WAJIB DAN TIPE DATA
+        # Aturan validasi dipusatkan di validation.py (dipakai juga oleh
+        # endpoint bulk), hasilnya:
+        #   - {"missing_fields": [...]} jika ada field wajib yang hilang
+        #   - {"<field>": "<pesan>"} untuk setiap field dengan tipe salah
+        validation_errors = validate_matakuliah(data)
         
         # Jika ada error validasi, return error response
         if validation_errors:
@@ -375,6 +552,13 @@ def matakuliah_detail(request):
           }
         }
     
+    Conditional GET:
+      Sama seperti koleksi: kirim ETag lewat If-None-Match untuk
+      mendapat 304 Not Modified jika data belum berubah.
+    
+    Query Parameter Sparse Fieldset:
+      - fields: Sama seperti koleksi, misal ?fields=kode_mk,nama_mk
+    
     Error Response (404 Not Found):
         {
           "success": false,
@@ -385,37 +569,96 @@ def matakuliah_detail(request):
     
     Curl Testing:
         curl -X GET http://localhost:6543/api/matakuliah/1
+        curl -X GET "http://localhost:6543/api/matakuliah/1?fields=kode_mk,nama_mk"
     """
     try:
         # Ambil parameter 'id' dari URL path
         # Format: /api/matakuliah/1 -> id = '1'
         id = request.matchdict['id']
         
-        # Query matakuliah berdasarkan ID
-        # one_or_none(): Return record jika ada, None jika tidak ada
-        # Ini lebih aman daripada .get() yang deprecated
-        matakuliah = request.dbsession.query(Matakuliah).filter_by(id=id).one_or_none()
+        # CONDITIONAL GET: balas 304 jika ETag client masih berlaku
+        etag = resource_etag(request, Matakuliah.__tablename__)
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
         
-        # Cek apakah matakuliah ditemukan
-        if not matakuliah:
-            request.response.status = 404
-            log.warning(f"Matakuliah not found: id={id}")
+        table = Matakuliah.__table__
+        try:
+            fields = parse_fields(request.params.get('fields'), table)
+        except FieldsetError as e:
+            request.response.status = 400
+            log.warning(f"Invalid fields parameter: {str(e)}")
             return create_response(
                 success=False,
-                code=404,
-                message="Matakuliah not found",
-                errors={"resource": f"Matakuliah with id {id} does not exist"}
+                code=400,
+                message="Invalid fields parameter",
+                errors={"fields": str(e)}
             )
         
+        # READ-THROUGH CACHE: id yang sering diminta tidak perlu query ulang
+        cache = get_cache(request.registry)
+        key = cache_key(id)
+        matakuliah_data = MISSING
+        if cache is not None and key is not None:
+            matakuliah_data = cache.get(key)
+        
+        if matakuliah_data is MISSING and fields is not None:
+            # SPARSE FIELDSET: Core select kolom yang diminta saja. Hasil
+            # parsial tidak disimpan ke cache (cache berisi data lengkap)
+            row = request.dbsession.execute(
+                select(*select_columns(table, fields)).where(table.c.id == id)
+            ).first()
+            if row is None:
+                request.response.status = 404
+                log.warning(f"Matakuliah not found: id={id}")
+                return create_response(
+                    success=False,
+                    code=404,
+                    message="Matakuliah not found",
+                    errors={"resource": f"Matakuliah with id {id} does not exist"}
+                )
+            matakuliah_data = row._mapping
+        
+        if matakuliah_data is MISSING:
+            # Catat generasi SEBELUM query agar hasil yang dibaca sebelum
+            # invalidasi (write yang baru commit) tidak disimpan ke cache
+            generation = cache.generation if cache is not None else None
+            
+            # Query matakuliah berdasarkan ID
+            # one_or_none(): Return record jika ada, None jika tidak ada
+            # Ini lebih aman daripada .get() yang deprecated
+            matakuliah = request.dbsession.query(Matakuliah).filter_by(id=id).one_or_none()
+            
+            # Cek apakah matakuliah ditemukan
+            if not matakuliah:
+                request.response.status = 404
+                log.warning(f"Matakuliah not found: id={id}")
+                return create_response(
+                    success=False,
+                    code=404,
+                    message="Matakuliah not found",
+                    errors={"resource": f"Matakuliah with id {id} does not exist"}
+                )
+            
+            matakuliah_data = matakuliah.to_dict()
+            if cache is not None and key is not None:
+                cache.put(key, matakuliah_data, generation)
+        
+        if fields is not None:
+            matakuliah_data = project(matakuliah_data, fields)
+        
         # Log informasi
-        log.info(f"Retrieved matakuliah: {matakuliah.kode_mk} (ID: {id})")
+        log.info(f"Retrieved matakuliah (ID: {id})")
+        
+        # Sertakan ETag untuk conditional GET berikutnya
+        set_etag(request.response, etag)
         
         # Return success response
         return create_response(
             success=True,
             code=200,
             message="Matakuliah data retrieved successfully",
-            data={"matakuliah": matakuliah.to_dict()}
+            data={"matakuliah": matakuliah_data}
         )
     
     except Exception as e:
@@ -570,6 +813,129 @@ def matakuliah_update(request):
         )
 
 
+@view_config(route_name='matakuliah_detail', request_method='PATCH', renderer='json')
+def matakuliah_patch(request):
+    """
+    ENDPOINT 4b - PATCH /api/matakuliah/{id}
+    
+    Partial update dalam SATU statement database.
+    
+    Pada database yang mendukung RETURNING (PostgreSQL, SQLite >= 3.35)
+    update dijalankan sebagai:
+        UPDATE matakuliah SET ... WHERE id = :id RETURNING *
+    sehingga tidak ada SELECT terpisah sebelum/sesudah update. Baris yang
+    tidak ada terdeteksi dari hasil RETURNING yang kosong (404). Database
+    lain memakai jalur ORM (load -> ubah atribut -> flush) seperti PUT.
+    
+    HTTP Method: PATCH
+    Route Name: matakuliah_detail
+    URL Pattern: /api/matakuliah/{id}
+    
+    Request Body (JSON - minimal satu field):
+        {"sks": 4}
+    
+    Success Response (200): Sama dengan PUT
+    
+    Error Response:
+      - 400: Body bukan JSON object / tipe field salah / tidak ada field
+      - 404: Matakuliah tidak ditemukan
+      - 409: kode_mk sudah dipakai matakuliah lain
+    
+    Curl Testing:
+        curl -X PATCH http://localhost:6543/api/matakuliah/1 \
+          -H "Content-Type: application/json" \
+          -d '{"sks":4}'
+    """
+    try:
+        id = request.matchdict['id']
+        
+        # STEP 1: PARSE & VALIDASI BODY (aturan sama dengan POST/PUT)
+        try:
+            data = request.json_body
+        except ValueError:
+            request.response.status = 400
+            return create_response(
+                success=False,
+                code=400,
+                message="Invalid JSON format",
+                errors={"detail": "Request body must be valid JSON"}
+            )
+        
+        validation_errors = validate_matakuliah(data, partial=True)
+        values = extract_fields(data) if not validation_errors else {}
+        if not validation_errors and not values:
+            validation_errors = {"detail": "At least one updatable field is required"}
+        if validation_errors:
+            request.response.status = 400
+            return create_response(
+                success=False,
+                code=400,
+                message="Validation failed",
+                errors=validation_errors
+            )
+        
+        # STEP 2: UPDATE
+        dbsession = request.dbsession
+        if dbsession.get_bind().dialect.update_returning:
+            # Satu round trip: UPDATE ... WHERE id = :id RETURNING *
+            table = Matakuliah.__table__
+            count, rows = bulk_update_matakuliah(
+                dbsession, table.c.id == id, values, returning=True, keys=[id]
+            )
+            matakuliah_data = rows[0] if rows else None
+        else:
+            # Fallback tanpa RETURNING: jalur ORM
+            matakuliah = dbsession.query(Matakuliah).filter_by(id=id).one_or_none()
+            matakuliah_data = None
+            if matakuliah is not None:
+                for field, value in values.items():
+                    setattr(matakuliah, field, value)
+                dbsession.flush()
+                matakuliah_data = matakuliah.to_dict()
+        
+        if matakuliah_data is None:
+            request.response.status = 404
+            log.warning(f"Matakuliah not found: id={id}")
+            return create_response(
+                success=False,
+                code=404,
+                message="Matakuliah not found",
+                errors={"resource": f"Matakuliah with id {id} does not exist"}
+            )
+        
+        # Log informasi
+        log.info(f"Patched matakuliah: {matakuliah_data['kode_mk']} (ID: {id})")
+        
+        return create_response(
+            success=True,
+            code=200,
+            message="Matakuliah updated successfully",
+            data={"matakuliah": matakuliah_data}
+        )
+    
+    except IntegrityError as e:
+        # kode_mk bentrok dengan baris lain (constraint unik)
+        log.warning(f"Patch conflict for matakuliah {request.matchdict.get('id')}: {str(e)}")
+        request.tm.doom()
+        request.response.status = 409
+        return create_response(
+            success=False,
+            code=409,
+            message="Matakuliah with this kode_mk already exists",
+            errors={"kode_mk": "Must be unique"}
+        )
+    
+    except Exception as e:
+        log.error(f"Error patching matakuliah {request.matchdict.get('id')}: {str(e)}\n{traceback.format_exc()}")
+        request.response.status = 500
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to update matakuliah",
+            errors={"detail": "Internal server error"}
+        )
+
+
 @view_config(route_name='matakuliah_detail', request_method='DELETE', renderer='json')
 def matakuliah_delete(request):
     """
@@ -577,6 +943,11 @@ def matakuliah_delete(request):
     
     Menghapus (delete) satu matakuliah dari database.
     
+    Pada database yang mendukung RETURNING delete dijalankan sebagai SATU
+    statement `DELETE FROM matakuliah WHERE id = :id RETURNING *`; data
+    yang dihapus diambil dari RETURNING dan baris yang tidak ada terdeteksi
+    dari hasil kosong. Database lain memakai jalur ORM (load -> delete).
+    
     HTTP Method: DELETE
     Route Name: matakuliah_detail
     URL Pattern: /api/matakuliah/{id}
@@ -615,12 +986,26 @@ def matakuliah_delete(request):
     try:
         # Ambil parameter 'id' dari URL path
         id = request.matchdict['id']
+        dbsession = request.dbsession
         
-        # Query matakuliah berdasarkan ID
-        matakuliah = request.dbsession.query(Matakuliah).filter_by(id=id).one_or_none()
+        if dbsession.get_bind().dialect.delete_returning:
+            # Satu round trip: DELETE ... WHERE id = :id RETURNING *
+            table = Matakuliah.__table__
+            count, rows = bulk_delete_matakuliah(
+                dbsession, table.c.id == id, returning=True, keys=[id]
+            )
+            deleted_data = rows[0] if rows else None
+        else:
+            # Fallback tanpa RETURNING: query, simpan data, lalu delete
+            matakuliah = dbsession.query(Matakuliah).filter_by(id=id).one_or_none()
+            deleted_data = None
+            if matakuliah is not None:
+                deleted_data = matakuliah.to_dict()
+                dbsession.delete(matakuliah)
+                dbsession.flush()
         
         # Cek apakah matakuliah ditemukan
-        if not matakuliah:
+        if deleted_data is None:
             request.response.status = 404
             log.warning(f"Matakuliah not found: id={id}")
             return create_response(
@@ -630,15 +1015,6 @@ def matakuliah_delete(request):
                 errors={"resource": f"Matakuliah with id {id} does not exist"}
             )
         
-        # Simpan data untuk return dalam response (sebelum delete)
-        deleted_data = matakuliah.to_dict()
-        
-        # Delete matakuliah dari database
-        request.dbsession.delete(matakuliah)
-        
-        # Flush delete ke database
-        request.dbsession.flush()
-        
         # Log informasi
         log.info(f"Deleted matakuliah: {deleted_data['kode_mk']} (ID: {id})")
         
@@ -0,0 +1,512 @@
+"""
+MODUL VIEWS - MATAKULIAH BULK - Endpoint operasi massal Matakuliah
+
+Endpoint:
+  - POST /api/matakuliah/_bulk    -> Buat banyak matakuliah sekaligus
+  - PATCH /api/matakuliah/_bulk   -> Update banyak matakuliah (set-based)
+  - DELETE /api/matakuliah/_bulk  -> Hapus banyak matakuliah (set-based)
+
+Dipakai untuk memuat kurikulum berisi ribuan matakuliah dalam SATU
+request dan SATU transaksi, menggantikan ribuan request POST tunggal.
+
+Semantik Partial-Failure:
+  Setiap item divalidasi dengan aturan yang sama dengan POST tunggal
+  (lihat validation.py). Item yang valid tetap disimpan walaupun item
+  lain gagal; hasil dilaporkan per item beserta index-nya.
+
+  Status response:
+    - 201 Created      : semua item berhasil dibuat
+    - 207 Multi-Status : sebagian berhasil, sebagian gagal
+    - 400 Bad Request  : tidak ada item yang berhasil
+
+Semantik Bulk PATCH/DELETE:
+  Baris dipilih dengan "ids" (list id) ATAU "filter" (misal semester=3),
+  lalu diubah/dihapus dengan SATU statement UPDATE/DELETE tanpa memuat
+  object ORM. Response berisi jumlah baris yang terpengaruh; baris yang
+  berubah hanya dikembalikan jika "returning": true. Cache detail
+  di-invalidate setelah commit (per id, atau seluruhnya untuk filter).
+"""
+from pyramid.view import view_config
+from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
+import json
+import logging
+import traceback
+
+from ..filters import FilterError, build_criteria
+from ..models import Matakuliah
+from ..models.bulk import (
+    DEFAULT_BATCH_SIZE,
+    bulk_delete_matakuliah,
+    bulk_insert_matakuliah,
+    bulk_update_matakuliah,
+    find_existing_kode_mk,
+)
+from ..validation import UPDATABLE_FIELDS, extract_fields, validate_matakuliah
+from .matakuliah import create_response
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+# Batas jumlah item dalam satu request bulk (bisa diubah di INI)
+DEFAULT_BULK_MAX_ITEMS = 5000
+
+# Content-Type yang diperlakukan sebagai NDJSON (satu JSON object per baris)
+NDJSON_CONTENT_TYPES = (
+    'application/x-ndjson',
+    'application/ndjson',
+    'application/jsonl',
+)
+
+
+class BulkRequestError(ValueError):
+    """
+    EXCEPTION - Body request bulk tidak bisa diproses sama sekali
+
+    Attributes:
+        code (int): HTTP status code yang harus dikembalikan
+    """
+
+    def __init__(self, message, code=400):
+        super(BulkRequestError, self).__init__(message)
+        self.code = code
+
+
+def get_bulk_settings(settings):
+    """
+    HELPER FUNCTION - Baca batas item & ukuran batch bulk dari INI
+
+    Settings yang didukung (opsional):
+        matakuliah.bulk_max_items = 5000
+        matakuliah.bulk_batch_size = 500
+
+    Returns:
+        tuple: (max_items, batch_size)
+    """
+    max_items = int(settings.get(
+        'matakuliah.bulk_max_items', DEFAULT_BULK_MAX_ITEMS
+    ))
+    batch_size = int(settings.get(
+        'matakuliah.bulk_batch_size', DEFAULT_BATCH_SIZE
+    ))
+    return max_items, batch_size
+
+
+def parse_bulk_items(request, max_items):
+    """
+    HELPER FUNCTION - Parse body JSON array atau NDJSON
+
+    Args:
+        request: Pyramid request
+        max_items (int): Batas jumlah item
+
+    Returns:
+        list: List tuple (item, parse_error). parse_error berisi dict
+              error jika baris NDJSON bukan JSON valid, selain itu None.
+
+    Raises:
+        BulkRequestError: Body bukan array / terlalu banyak item
+    """
+    if request.content_type in NDJSON_CONTENT_TYPES:
+        items = []
+        for lineno, line in enumerate(request.text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                items.append((json.loads(line), None))
+            except ValueError:
+                items.append((None, {"detail": f"Invalid JSON on line {lineno}"}))
+    else:
+        try:
+            data = request.json_body
+        except ValueError:
+            raise BulkRequestError("Request body must be valid JSON")
+        if not isinstance(data, list):
+            raise BulkRequestError("Request body must be a JSON array")
+        items = [(item, None) for item in data]
+
+    if not items:
+        raise BulkRequestError("No items to process")
+    if len(items) > max_items:
+        raise BulkRequestError(
+            f"Too many items: {len(items)} (max {max_items})", code=413
+        )
+    return items
+
+
+def parse_bulk_selector(data, max_items):
+    """
+    HELPER FUNCTION - Buat klausa WHERE dari "ids" atau "filter"
+
+    Tepat satu dari keduanya harus dikirim. Selector kosong ditolak agar
+    client tidak sengaja mengubah/menghapus seluruh tabel.
+
+    Args:
+        data (dict): Body request
+        max_items (int): Batas panjang list "ids"
+
+    Returns:
+        ClauseElement: Klausa WHERE untuk UPDATE/DELETE
+
+    Raises:
+        BulkRequestError: Selector tidak valid
+    """
+    table = Matakuliah.__table__
+    has_ids = 'ids' in data
+    has_filter = 'filter' in data
+    if has_ids == has_filter:
+        raise BulkRequestError('Exactly one of "ids" or "filter" is required')
+
+    if has_ids:
+        ids = data['ids']
+        if (not isinstance(ids, list) or not ids or any(
+                not isinstance(i, int) or isinstance(i, bool) for i in ids)):
+            raise BulkRequestError('"ids" must be a non-empty list of integers')
+        if len(ids) > max_items:
+            raise BulkRequestError(
+                f"Too many ids: {len(ids)} (max {max_items})", code=413
+            )
+        return table.c.id.in_(ids)
+
+    try:
+        criteria = build_criteria(table, data['filter'])
+    except FilterError as e:
+        raise BulkRequestError(str(e))
+    if not criteria:
+        raise BulkRequestError('"filter" must not be empty')
+    return and_(*criteria)
+
+
+def _parse_bulk_body(request):
+    try:
+        data = request.json_body
+    except ValueError:
+        raise BulkRequestError("Request body must be valid JSON")
+    if not isinstance(data, dict):
+        raise BulkRequestError("Request body must be a JSON object")
+    return data
+
+
+@view_config(route_name='matakuliah_bulk', request_method='POST', renderer='json')
+def matakuliah_bulk_create(request):
+    """
+    ENDPOINT - POST /api/matakuliah/_bulk
+
+    Membuat banyak matakuliah dalam satu transaksi dengan multi-row INSERT.
+
+    HTTP Method: POST
+    Route Name: matakuliah_bulk
+    URL Pattern: /api/matakuliah/_bulk
+
+    Request Body (JSON array):
+        [
+          {"kode_mk": "IF101", "nama_mk": "Algoritma", "sks": 3, "semester": 1},
+          {"kode_mk": "IF102", "nama_mk": "Struktur Data", "sks": 3, "semester": 2}
+        ]
+
+    Request Body (NDJSON, Content-Type: application/x-ndjson):
+        {"kode_mk": "IF101", "nama_mk": "Algoritma", "sks": 3, "semester": 1}
+        {"kode_mk": "IF102", "nama_mk": "Struktur Data", "sks": 3, "semester": 2}
+
+    Success / Partial Response (201 / 207):
+        {
+          "success": true,
+          "code": 207,
+          "message": "Bulk create partially succeeded",
+          "timestamp": "...",
+          "data": {
+            "created": 1,
+            "failed": 1,
+            "results": [
+              {"index": 0, "status": 201, "id": 7, "kode_mk": "IF101"},
+              {"index": 1, "status": 409, "kode_mk": "IF102",
+               "errors": {"kode_mk": "Already exists"}}
+            ]
+          }
+        }
+
+    Curl Testing:
+        curl -X POST http://localhost:6543/api/matakuliah/_bulk \
+          -H "Content-Type: application/x-ndjson" \
+          --data-binary @matakuliah.ndjson
+    """
+    try:
+        max_items, batch_size = get_bulk_settings(request.registry.settings)
+        items = parse_bulk_items(request, max_items)
+
+        # STEP 1: VALIDASI SEMUA ITEM DALAM SATU PASS
+        results = [None] * len(items)
+        pending = []            # (index, row) yang lolos validasi
+        seen_kode = set()       # deteksi kode_mk duplikat di dalam payload
+        for index, (item, parse_error) in enumerate(items):
+            errors = parse_error or validate_matakuliah(item)
+            if errors:
+                results[index] = {"index": index, "status": 400, "errors": errors}
+                continue
+            row = extract_fields(item)
+            if row['kode_mk'] in seen_kode:
+                results[index] = {
+                    "index": index,
+                    "status": 409,
+                    "kode_mk": row['kode_mk'],
+                    "errors": {"kode_mk": "Duplicate in request"},
+                }
+                continue
+            seen_kode.add(row['kode_mk'])
+            pending.append((index, row))
+
+        # STEP 2: TOLAK kode_mk YANG SUDAH ADA DI DATABASE
+        existing = find_existing_kode_mk(
+            request.dbsession, seen_kode, batch_size=batch_size
+        )
+        to_insert = []
+        for index, row in pending:
+            if row['kode_mk'] in existing:
+                results[index] = {
+                    "index": index,
+                    "status": 409,
+                    "kode_mk": row['kode_mk'],
+                    "errors": {"kode_mk": "Already exists"},
+                }
+            else:
+                to_insert.append((index, row))
+
+        # STEP 3: MULTI-ROW INSERT PER BATCH (SATU TRANSAKSI)
+        ids = bulk_insert_matakuliah(
+            request.dbsession,
+            [row for _, row in to_insert],
+            batch_size=batch_size,
+        )
+        for (index, row), new_id in zip(to_insert, ids):
+            results[index] = {
+                "index": index,
+                "status": 201,
+                "id": new_id,
+                "kode_mk": row['kode_mk'],
+            }
+
+        # STEP 4: RINGKASAN HASIL
+        created = len(ids)
+        failed = len(items) - created
+        if failed == 0:
+            code, message = 201, "Bulk create succeeded"
+        elif created:
+            code, message = 207, "Bulk create partially succeeded"
+        else:
+            code, message = 400, "Bulk create failed"
+
+        log.info(f"Bulk create matakuliah: {created} created, {failed} failed")
+        request.response.status = code
+        return create_response(
+            success=created > 0,
+            code=code,
+            message=message,
+            data={"created": created, "failed": failed, "results": results}
+        )
+
+    except BulkRequestError as e:
+        log.warning(f"Invalid bulk request: {str(e)}")
+        request.response.status = e.code
+        return create_response(
+            success=False,
+            code=e.code,
+            message="Invalid request data",
+            errors={"detail": str(e)}
+        )
+
+    except IntegrityError as e:
+        # Race dengan request lain yang memasukkan kode_mk sama
+        # setelah STEP 2; batalkan seluruh transaksi
+        log.warning(f"Bulk create conflict: {str(e)}")
+        request.tm.doom()
+        request.response.status = 409
+        return create_response(
+            success=False,
+            code=409,
+            message="Bulk create conflict, no items were created",
+            errors={"detail": "kode_mk conflict with concurrent write"}
+        )
+
+    except Exception as e:
+        log.error(f"Error in bulk create matakuliah: {str(e)}\n{traceback.format_exc()}")
+        request.response.status = 500
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to bulk create matakuliah",
+            errors={"detail": "Internal server error"}
+        )
+
+
+@view_config(route_name='matakuliah_bulk', request_method='PATCH', renderer='json')
+def matakuliah_bulk_update(request):
+    """
+    ENDPOINT - PATCH /api/matakuliah/_bulk
+
+    Update banyak matakuliah dengan satu statement UPDATE set-based.
+
+    HTTP Method: PATCH
+    Route Name: matakuliah_bulk
+    URL Pattern: /api/matakuliah/_bulk
+
+    Request Body (JSON):
+        {
+          "filter": {"semester": 3},      # ATAU "ids": [1, 2, 3]
+          "set": {"semester": 4},
+          "returning": false              # optional, default false
+        }
+
+    Catatan: "kode_mk" tidak boleh di-set secara massal karena unik.
+
+    Success Response (200):
+        {
+          "success": true,
+          "code": 200,
+          "message": "Bulk update succeeded",
+          "timestamp": "...",
+          "data": {"updated": 120}
+        }
+        (dengan "returning": true, data juga berisi "matakuliahs": [...])
+
+    Curl Testing:
+        curl -X PATCH http://localhost:6543/api/matakuliah/_bulk \
+          -H "Content-Type: application/json" \
+          -d '{"filter":{"semester":3},"set":{"semester":4}}'
+    """
+    try:
+        max_items, _ = get_bulk_settings(request.registry.settings)
+        data = _parse_bulk_body(request)
+        where = parse_bulk_selector(data, max_items)
+
+        # VALIDASI NILAI BARU (aturan yang sama dengan PUT tunggal)
+        values = data.get('set')
+        if not isinstance(values, dict) or not values:
+            raise BulkRequestError('"set" must be a non-empty JSON object')
+        unknown = sorted(set(values) - set(UPDATABLE_FIELDS))
+        if unknown:
+            raise BulkRequestError(f"Unknown field: {', '.join(unknown)}")
+        if 'kode_mk' in values:
+            raise BulkRequestError("kode_mk is unique and cannot be bulk updated")
+        validation_errors = validate_matakuliah(values, partial=True)
+        if validation_errors:
+            request.response.status = 400
+            log.warning(f"Validation errors: {validation_errors}")
+            return create_response(
+                success=False,
+                code=400,
+                message="Validation failed",
+                errors=validation_errors
+            )
+
+        returning = data.get('returning') is True
+        count, rows = bulk_update_matakuliah(
+            request.dbsession, where, values, returning=returning,
+            keys=data.get('ids'),
+        )
+
+        log.info(f"Bulk updated {count} matakuliah records")
+        result = {"updated": count}
+        if returning:
+            result["matakuliahs"] = rows
+        return create_response(
+            success=True,
+            code=200,
+            message="Bulk update succeeded",
+            data=result
+        )
+
+    except BulkRequestError as e:
+        log.warning(f"Invalid bulk request: {str(e)}")
+        request.response.status = e.code
+        return create_response(
+            success=False,
+            code=e.code,
+            message="Invalid request data",
+            errors={"detail": str(e)}
+        )
+
+    except Exception as e:
+        log.error(f"Error in bulk update matakuliah: {str(e)}\n{traceback.format_exc()}")
+        request.response.status = 500
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to bulk update matakuliah",
+            errors={"detail": "Internal server error"}
+        )
+
+
+@view_config(route_name='matakuliah_bulk', request_method='DELETE', renderer='json')
+def matakuliah_bulk_delete(request):
+    """
+    ENDPOINT - DELETE /api/matakuliah/_bulk
+
+    Hapus banyak matakuliah dengan satu statement DELETE set-based.
+
+    HTTP Method: DELETE
+    Route Name: matakuliah_bulk
+    URL Pattern: /api/matakuliah/_bulk
+
+    Request Body (JSON):
+        {
+          "ids": [1, 2, 3],               # ATAU "filter": {"semester": 8}
+          "returning": false              # optional, default false
+        }
+
+    Success Response (200):
+        {
+          "success": true,
+          "code": 200,
+          "message": "Bulk delete succeeded",
+          "timestamp": "...",
+          "data": {"deleted": 3}
+        }
+        (dengan "returning": true, data juga berisi "deleted_matakuliahs")
+
+    Curl Testing:
+        curl -X DELETE http://localhost:6543/api/matakuliah/_bulk \
+          -H "Content-Type: application/json" \
+          -d '{"ids":[1,2,3]}'
+    """
+    try:
+        max_items, _ = get_bulk_settings(request.registry.settings)
+        data = _parse_bulk_body(request)
+        where = parse_bulk_selector(data, max_items)
+
+        returning = data.get('returning') is True
+        count, rows = bulk_delete_matakuliah(
+            request.dbsession, where, returning=returning,
+            keys=data.get('ids'),
+        )
+
+        log.info(f"Bulk deleted {count} matakuliah records")
+        result = {"deleted": count}
+        if returning:
+            result["deleted_matakuliahs"] = rows
+        return create_response(
+            success=True,
+            code=200,
+            message="Bulk delete succeeded",
+            data=result
+        )
+
+    except BulkRequestError as e:
+        log.warning(f"Invalid bulk request: {str(e)}")
+        request.response.status = e.code
+        return create_response(
+            success=False,
+            code=e.code,
+            message="Invalid request data",
+            errors={"detail": str(e)}
+        )
+
+    except Exception as e:
+        log.error(f"Error in bulk delete matakuliah: {str(e)}\n{traceback.format_exc()}")
+        request.response.status = 500
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to bulk delete matakuliah",
+            errors={"detail": "Internal server error"}
+        )
@@ -0,0 +1,167 @@
+"""
+MODUL VIEWS - MATAKULIAH EXPORT - Export katalog matakuliah (CSV / NDJSON)
+
+Endpoint:
+  - GET /api/matakuliah/export?format=csv|ndjson  -> Download semua matakuliah
+
+Dipakai job reporting yang membutuhkan seluruh katalog. Berbeda dengan
+GET /api/matakuliah (envelope JSON), body di sini adalah file CSV / NDJSON
+biasa yang ditulis langsung dari server-side cursor (lihat streaming.py):
+  - memori per request konstan, tidak bergantung ukuran tabel
+  - dikirim dengan chunked transfer (tanpa Content-Length)
+  - dikompres gzip sambil ditulis jika client mengirim
+    Accept-Encoding: gzip
+"""
+from pyramid.response import Response
+from pyramid.view import view_config
+import logging
+import traceback
+
+from ..fieldsets import FieldsetError, parse_fields
+from ..filters import (
+    FilterError,
+    build_criteria,
+    filters_from_params,
+    order_by_clauses,
+    parse_sort,
+)
+from ..models import Matakuliah, open_stream_session
+from ..streaming import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_GZIP_LEVEL,
+    EXPORT_FORMATS,
+    collection_statement,
+    gzip_chunks,
+    iter_export_rows,
+)
+from .matakuliah import create_response
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+def wants_gzip(request):
+    """
+    HELPER FUNCTION - Cek apakah client menerima Content-Encoding gzip
+
+    Tanpa header Accept-Encoding, webob menganggap semua encoding diterima;
+    di sini gzip hanya dipakai jika client memintanya secara eksplisit.
+    """
+    if 'Accept-Encoding' not in request.headers:
+        return False
+    return bool(request.accept_encoding.acceptable_offers(['gzip']))
+
+
+@view_config(route_name='matakuliah_export', request_method='GET', renderer='json')
+def matakuliah_export(request):
+    """
+    ENDPOINT - GET /api/matakuliah/export
+
+    Streaming export seluruh matakuliah sebagai file CSV atau NDJSON.
+
+    HTTP Method: GET
+    Route Name: matakuliah_export
+    URL Pattern: /api/matakuliah/export
+
+    Query Parameters:
+      - format: "csv" (default) atau "ndjson"
+      - filter, sort, fields: Sama dengan GET /api/matakuliah
+        (misal semester=3&sort=-sks&fields=kode_mk,nama_mk)
+
+    Success Response (200, text/csv):
+        id,kode_mk,nama_mk,sks,semester
+        1,IF101,Algoritma dan Pemrograman,3,1
+        ...
+
+    Success Response (200, application/x-ndjson):
+        {"id":1,"kode_mk":"IF101","nama_mk":"Algoritma dan Pemrograman",...}
+        ...
+
+    Error Response (400 - format / filter tidak valid):
+        {
+          "success": false,
+          "code": 400,
+          "message": "Invalid export parameters",
+          "errors": {"detail": "Unknown format: xml (available: csv, ndjson)"}
+        }
+
+    Curl Testing:
+        curl -o matakuliah.csv "http://localhost:6543/api/matakuliah/export"
+        curl --compressed "http://localhost:6543/api/matakuliah/export?format=ndjson"
+    """
+    try:
+        table = Matakuliah.__table__
+
+        # STEP 1: VALIDASI PARAMETER (respons error tetap envelope JSON)
+        export_format = request.params.get('format', 'csv')
+        try:
+            if export_format not in EXPORT_FORMATS:
+                raise FilterError(
+                    f"Unknown format: {export_format} "
+                    f"(available: {', '.join(sorted(EXPORT_FORMATS))})"
+                )
+            criteria = build_criteria(table, filters_from_params(request.params))
+            sort = parse_sort(request.params.get('sort'))
+            fields = parse_fields(request.params.get('fields'), table)
+        except (FilterError, FieldsetError) as e:
+            request.response.status = 400
+            log.warning(f"Invalid export parameters: {str(e)}")
+            return create_response(
+                success=False,
+                code=400,
+                message="Invalid export parameters",
+                errors={"detail": str(e)}
+            )
+
+        # STEP 2: GENERATOR BODY (dijalankan WSGI server setelah view selesai;
+        # Response dikembalikan langsung sehingga renderer json dilewati)
+        settings = request.registry.settings
+        batch_size = int(settings.get(
+            'matakuliah.stream_batch_size', DEFAULT_BATCH_SIZE
+        ))
+        dbsession, owned = open_stream_session(request)
+        app_iter = iter_export_rows(
+            dbsession,
+            collection_statement(
+                Matakuliah,
+                criteria,
+                order_by_clauses(table, sort) if sort else None,
+                fields,
+            ),
+            export_format,
+            batch_size=batch_size,
+            close_session=owned,
+        )
+
+        # STEP 3: GZIP SAMBIL STREAMING (opsional, sesuai Accept-Encoding)
+        content_encoding = None
+        if wants_gzip(request):
+            level = int(settings.get(
+                'matakuliah.export_gzip_level', DEFAULT_GZIP_LEVEL
+            ))
+            app_iter = gzip_chunks(app_iter, level)
+            content_encoding = 'gzip'
+
+        # app_iter tanpa Content-Length -> server memakai chunked transfer
+        _, content_type = EXPORT_FORMATS[export_format]
+        response = Response(
+            app_iter=app_iter,
+            content_type=content_type,
+            charset='utf-8',
+            content_encoding=content_encoding,
+            content_disposition=f'attachment; filename="matakuliah.{export_format}"',
+        )
+        response.vary = ('Accept-Encoding',)
+        log.info(f"Streaming matakuliah export ({export_format}, "
+                 f"{content_encoding or 'identity'})")
+        return response
+
+    except Exception as e:
+        log.error(f"Error exporting matakuliah: {str(e)}\n{traceback.format_exc()}")
+        request.response.status = 500
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to export matakuliah",
+            errors={"detail": "Internal server error"}
+        )
@@ -0,0 +1,185 @@
+"""
+MODUL VIEWS - MATAKULIAH SEARCH - Endpoint full-text search Matakuliah
+
+Endpoint:
+  - GET /api/matakuliah/search?q=...  -> Cari matakuliah berdasarkan nama_mk
+
+Pencarian memakai index full-text native database (FTS5 di SQLite,
+GIN tsvector di PostgreSQL; lihat models/search.py), sehingga tidak perlu
+mengambil seluruh tabel ke client untuk mencari nama matakuliah.
+"""
+from pyramid.view import view_config
+import logging
+import traceback
+
+from ..conditional import not_modified_response, resource_etag, set_etag
+from ..models import Matakuliah
+from ..models.search import SearchUnavailable, search_matakuliah, search_terms
+from ..pagination import (
+    PaginationError,
+    decode_cursor,
+    encode_cursor,
+    get_page_settings,
+    parse_limit,
+)
+from .matakuliah import create_response
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+def parse_search_cursor(value):
+    """
+    HELPER FUNCTION - Validasi cursor `after` hasil pencarian
+
+    Args:
+        value (str|None): Nilai query param `after`
+
+    Returns:
+        dict|None: {"r": score, "id": id}, None untuk halaman pertama
+
+    Raises:
+        PaginationError: Jika cursor tidak valid
+    """
+    if not value:
+        return None
+    payload = decode_cursor(value)
+    score = payload.get('r')
+    last_id = payload.get('id')
+    if (not isinstance(score, (int, float)) or isinstance(score, bool)
+            or not isinstance(last_id, int) or isinstance(last_id, bool)):
+        raise PaginationError("Invalid cursor")
+    return payload
+
+
+@view_config(route_name='matakuliah_search', request_method='GET', renderer='json')
+def matakuliah_search(request):
+    """
+    ENDPOINT - GET /api/matakuliah/search
+
+    Full-text search pada nama_mk, hasil diurutkan berdasarkan relevansi.
+
+    HTTP Method: GET
+    Route Name: matakuliah_search
+    URL Pattern: /api/matakuliah/search
+
+    Query Parameters:
+      - q: Kata kunci (wajib). Setiap kata dicocokkan sebagai prefix dan
+           semua kata wajib ada, misal "algo pemrog"
+      - limit: Jumlah item per halaman (default 50, maksimum 500)
+      - after: Cursor opaque dari `next_cursor` halaman sebelumnya
+
+    Success Response (200):
+        {
+          "success": true,
+          "code": 200,
+          "message": "Matakuliah search completed successfully",
+          "data": {
+            "matakuliahs": [
+              {"id": 1, "kode_mk": "IF101", "nama_mk": "...", ...,
+               "score": 1.2e-06}
+            ],
+            "total": 1,
+            "limit": 50,
+            "next_cursor": null
+          }
+        }
+
+      - score: Relevansi (makin besar makin relevan), hanya untuk urutan
+      - total: Jumlah item pada halaman ini
+
+    Error Response (400 - Query / Pagination Tidak Valid):
+        {
+          "success": false,
+          "code": 400,
+          "message": "Invalid search parameters",
+          "errors": {"q": "Must contain at least one word"}
+        }
+
+    Error Response (501 - Database tidak mendukung full-text search)
+
+    Curl Testing:
+        curl "http://localhost:6543/api/matakuliah/search?q=algoritma"
+        curl "http://localhost:6543/api/matakuliah/search?q=pemrog%20web&limit=10"
+    """
+    try:
+        # CONDITIONAL GET: hasil pencarian hanya berubah jika tabel berubah
+        etag = resource_etag(request, Matakuliah.__tablename__)
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        # STEP 1: VALIDASI PARAMETER
+        terms = search_terms(request.params.get('q', ''))
+        if not terms:
+            request.response.status = 400
+            return create_response(
+                success=False,
+                code=400,
+                message="Invalid search parameters",
+                errors={"q": "Must contain at least one word"}
+            )
+
+        default_size, max_size = get_page_settings(request.registry.settings)
+        try:
+            limit = parse_limit(request.params.get('limit'), default_size, max_size)
+            after = parse_search_cursor(request.params.get('after'))
+        except PaginationError as e:
+            request.response.status = 400
+            log.warning(f"Invalid search parameters: {str(e)}")
+            return create_response(
+                success=False,
+                code=400,
+                message="Invalid search parameters",
+                errors={"detail": str(e)}
+            )
+
+        # STEP 2: QUERY INDEX FULL-TEXT (limit + 1 untuk deteksi halaman berikut)
+        try:
+            rows = search_matakuliah(request.dbsession, terms, limit + 1, after)
+        except SearchUnavailable as e:
+            request.response.status = 501
+            log.warning(str(e))
+            return create_response(
+                success=False,
+                code=501,
+                message="Full-text search is not available",
+                errors={"detail": str(e)}
+            )
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_cursor({"r": last['score'], "id": last['id']})
+
+        # Log informasi
+        log.info(f"Search '{' '.join(terms)}' returned {len(rows)} matakuliah records")
+
+        set_etag(request.response, etag)
+
+        return create_response(
+            success=True,
+            code=200,
+            message="Matakuliah search completed successfully",
+            data={
+                "matakuliahs": [dict(row) for row in rows],
+                "total": len(rows),
+                "limit": limit,
+                "next_cursor": next_cursor
+            }
+        )
+
+    except Exception as e:
+        # Log error untuk debugging (JANGAN kirim ke client)
+        log.error(f"Error searching matakuliah: {str(e)}\n{traceback.format_exc()}")
+
+        request.response.status = 500
+
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to search matakuliah data",
+            errors={"detail": "Internal server error"}
+        )
@@ -0,0 +1,269 @@
+"""
+MODUL VIEWS - MATAKULIAH UPSERT - Endpoint insert-or-update berdasarkan kode_mk
+
+Endpoint:
+  - PUT /api/matakuliah/by-kode/{kode_mk}  -> Upsert satu matakuliah
+  - PUT /api/matakuliah/by-kode            -> Upsert banyak matakuliah
+
+Dipakai oleh job sinkronisasi kurikulum yang tidak tahu apakah kode_mk
+sudah ada. Tanpa endpoint ini job harus GET dulu lalu POST / PUT, dan
+dua job yang berjalan bersamaan bisa sama-sama POST sehingga salah satunya
+gagal dengan IntegrityError pada uq_matakuliah_kode_mk (lalu di-retry
+oleh pyramid_retry).
+
+Di sini keputusan insert / update diserahkan ke database lewat
+INSERT ... ON CONFLICT (kode_mk) DO UPDATE (lihat models/bulk.py), sehingga:
+  - satu round trip per batch, tanpa SELECT lebih dulu
+  - atomik: writer lain yang bersamaan tidak menyebabkan konflik / retry
+  - PUT bersifat idempotent: mengirim payload yang sama dua kali
+    menghasilkan data yang sama
+"""
+from pyramid.view import view_config
+import logging
+import traceback
+
+from ..models.bulk import UpsertUnavailable, upsert_matakuliah
+from ..validation import extract_fields, validate_matakuliah
+from .matakuliah import create_response
+from .matakuliah_bulk import BulkRequestError, get_bulk_settings, parse_bulk_items
+
+# Inisialisasi logger untuk modul ini
+log = logging.getLogger(__name__)
+
+
+def _unavailable_response(request, error):
+    request.response.status = 501
+    log.warning(str(error))
+    return create_response(
+        success=False,
+        code=501,
+        message="Upsert is not available",
+        errors={"detail": str(error)}
+    )
+
+
+@view_config(route_name='matakuliah_upsert', request_method='PUT', renderer='json')
+def matakuliah_upsert(request):
+    """
+    ENDPOINT - PUT /api/matakuliah/by-kode/{kode_mk}
+
+    Buat matakuliah baru jika kode_mk belum ada, atau timpa nama_mk, sks,
+    dan semester jika sudah ada. Satu statement, tanpa cek lebih dulu.
+
+    HTTP Method: PUT
+    Route Name: matakuliah_upsert
+    URL Pattern: /api/matakuliah/by-kode/{kode_mk}
+
+    Request Body (JSON):
+        {
+          "nama_mk": "Algoritma",
+          "sks": 3,
+          "semester": 1
+        }
+        "kode_mk" boleh ikut dikirim asalkan sama dengan kode_mk di URL.
+
+    Success Response (200):
+        {
+          "success": true,
+          "code": 200,
+          "message": "Matakuliah upserted successfully",
+          "timestamp": "...",
+          "data": {
+            "matakuliah": {"id": 1, "kode_mk": "IF101", ...}
+          }
+        }
+
+    Error Response (400 - Validasi gagal / kode_mk berbeda dengan URL)
+    Error Response (501 - Database tidak mendukung ON CONFLICT)
+
+    Curl Testing:
+        curl -X PUT http://localhost:6543/api/matakuliah/by-kode/IF101 \
+          -H "Content-Type: application/json" \
+          -d '{"nama_mk":"Algoritma","sks":3,"semester":1}'
+    """
+    try:
+        kode_mk = request.matchdict['kode_mk']
+
+        # STEP 1: PARSE & VALIDASI BODY (aturan yang sama dengan POST)
+        try:
+            data = request.json_body
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            request.response.status = 400
+            return create_response(
+                success=False,
+                code=400,
+                message="Invalid request data",
+                errors={"detail": "Request body must be a JSON object"}
+            )
+        if data.get('kode_mk', kode_mk) != kode_mk:
+            request.response.status = 400
+            return create_response(
+                success=False,
+                code=400,
+                message="Validation failed",
+                errors={"kode_mk": "Must match the kode_mk in the URL"}
+            )
+        data = dict(data, kode_mk=kode_mk)
+
+        validation_errors = validate_matakuliah(data)
+        if validation_errors:
+            request.response.status = 400
+            log.warning(f"Validation errors: {validation_errors}")
+            return create_response(
+                success=False,
+                code=400,
+                message="Validation failed",
+                errors=validation_errors
+            )
+
+        # STEP 2: INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+        try:
+            [row] = upsert_matakuliah(request.dbsession, [extract_fields(data)])
+        except UpsertUnavailable as e:
+            return _unavailable_response(request, e)
+
+        log.info(f"Upserted matakuliah {kode_mk} (ID: {row['id']})")
+
+        return create_response(
+            success=True,
+            code=200,
+            message="Matakuliah upserted successfully",
+            data={"matakuliah": row}
+        )
+
+    except Exception as e:
+        log.error(f"Error upserting matakuliah: {str(e)}\n{traceback.format_exc()}")
+        request.response.status = 500
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to upsert matakuliah",
+            errors={"detail": "Internal server error"}
+        )
+
+
+@view_config(route_name='matakuliah_upsert_bulk', request_method='PUT', renderer='json')
+def matakuliah_upsert_bulk(request):
+    """
+    ENDPOINT - PUT /api/matakuliah/by-kode
+
+    Upsert banyak matakuliah dalam satu transaksi; satu statement
+    INSERT ... ON CONFLICT per batch (matakuliah.bulk_batch_size).
+
+    HTTP Method: PUT
+    Route Name: matakuliah_upsert_bulk
+    URL Pattern: /api/matakuliah/by-kode
+
+    Request Body: JSON array atau NDJSON (sama dengan POST /_bulk)
+        [
+          {"kode_mk": "IF101", "nama_mk": "Algoritma", "sks": 3, "semester": 1},
+          {"kode_mk": "IF102", "nama_mk": "Struktur Data", "sks": 3, "semester": 2}
+        ]
+
+    Success / Partial Response (200 / 207):
+        {
+          "success": true,
+          "code": 207,
+          "message": "Bulk upsert partially succeeded",
+          "timestamp": "...",
+          "data": {
+            "upserted": 1,
+            "failed": 1,
+            "results": [
+              {"index": 0, "status": 200, "id": 7, "kode_mk": "IF101"},
+              {"index": 1, "status": 400, "errors": {"sks": "..."}}
+            ]
+          }
+        }
+
+      Item dengan kode_mk yang muncul lebih dari sekali di payload
+      ditolak (409) karena hasil akhirnya bergantung pada urutan.
+
+    Curl Testing:
+        curl -X PUT http://localhost:6543/api/matakuliah/by-kode \
+          -H "Content-Type: application/x-ndjson" \
+          --data-binary @kurikulum.ndjson
+    """
+    try:
+        max_items, batch_size = get_bulk_settings(request.registry.settings)
+        items = parse_bulk_items(request, max_items)
+
+        # STEP 1: VALIDASI SEMUA ITEM DALAM SATU PASS
+        results = [None] * len(items)
+        pending = []            # (index, row) yang lolos validasi
+        seen_kode = set()       # deteksi kode_mk duplikat di dalam payload
+        for index, (item, parse_error) in enumerate(items):
+            errors = parse_error or validate_matakuliah(item)
+            if errors:
+                results[index] = {"index": index, "status": 400, "errors": errors}
+                continue
+            row = extract_fields(item)
+            if row['kode_mk'] in seen_kode:
+                results[index] = {
+                    "index": index,
+                    "status": 409,
+                    "kode_mk": row['kode_mk'],
+                    "errors": {"kode_mk": "Duplicate in request"},
+                }
+                continue
+            seen_kode.add(row['kode_mk'])
+            pending.append((index, row))
+
+        # STEP 2: SATU UPSERT PER BATCH (SATU TRANSAKSI)
+        try:
+            upserted_rows = upsert_matakuliah(
+                request.dbsession,
+                [row for _, row in pending],
+                batch_size=batch_size,
+            )
+        except UpsertUnavailable as e:
+            return _unavailable_response(request, e)
+
+        for (index, _), row in zip(pending, upserted_rows):
+            results[index] = {
+                "index": index,
+                "status": 200,
+                "id": row['id'],
+                "kode_mk": row['kode_mk'],
+            }
+
+        # STEP 3: RINGKASAN HASIL
+        upserted = len(upserted_rows)
+        failed = len(items) - upserted
+        if failed == 0:
+            code, message = 200, "Bulk upsert succeeded"
+        elif upserted:
+            code, message = 207, "Bulk upsert partially succeeded"
+        else:
+            code, message = 400, "Bulk upsert failed"
+
+        log.info(f"Bulk upsert matakuliah: {upserted} upserted, {failed} failed")
+        request.response.status = code
+        return create_response(
+            success=upserted > 0,
+            code=code,
+            message=message,
+            data={"upserted": upserted, "failed": failed, "results": results}
+        )
+
+    except BulkRequestError as e:
+        log.warning(f"Invalid bulk request: {str(e)}")
+        request.response.status = e.code
+        return create_response(
+            success=False,
+            code=e.code,
+            message="Invalid request data",
+            errors={"detail": str(e)}
+        )
+
+    except Exception as e:
+        log.error(f"Error in bulk upsert matakuliah: {str(e)}\n{traceback.format_exc()}")
+        request.response.status = 500
+        return create_response(
+            success=False,
+            code=500,
+            message="Failed to bulk upsert matakuliah",
+            errors={"detail": "Internal server error"}
+        )
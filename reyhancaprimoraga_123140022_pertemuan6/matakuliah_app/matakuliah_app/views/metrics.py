@@ -0,0 +1,43 @@
+"""
+MODUL VIEWS - METRICS - Endpoint metrics format Prometheus
+
+Endpoint:
+  - GET /metrics -> Semua metric aplikasi (teks Prometheus 0.0.4)
+
+Isi metric berasal dari MetricsRegistry (metrics.py): latency & status
+per route (instrumentation.py), render JSON (renderers.py), cache detail
+(cache.py), dan kompresi (compression.py).
+"""
+from pyramid.response import Response
+from pyramid.view import view_config
+
+from ..metrics import get_metrics, render_text
+
+# Content-Type standar untuk format teks Prometheus
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@view_config(route_name='metrics', request_method='GET')
+def metrics_view(request):
+    """
+    ENDPOINT - GET /metrics
+
+    HTTP Method: GET
+    Route Name: metrics
+    URL Pattern: /metrics
+
+    Success Response (200, text/plain):
+        # HELP matakuliah_http_requests_total HTTP requests by route, ...
+        # TYPE matakuliah_http_requests_total counter
+        matakuliah_http_requests_total{route="matakuliah_detail",method="GET",status="200"} 42
+        ...
+
+    Curl Testing:
+        curl http://localhost:6543/metrics
+    """
+    metrics = get_metrics(request.registry)
+    response = Response(render_text(metrics) if metrics is not None else '')
+    response.headers['Content-Type'] = CONTENT_TYPE
+    # nilai metric selalu berubah; jangan di-cache proxy / browser
+    response.cache_control = 'no-store'
+    return response
@@ -28,6 +28,17 @@ tests_require = [
     'pytest-cov',
 ]
 
+# Optional accelerated backends, picked up automatically when installed
+speedups_require = [
+    'orjson',
+]
+
+# Optional response encodings for the compression tween (gzip is built in)
+compression_require = [
+    'brotli',
+    'zstandard',
+]
+
 setup(
     name='matakuliah_app',
     version='0.0',
@@ -48,6 +59,8 @@ setup(
     zip_safe=False,
     extras_require={
         'testing': tests_require,
+        'speedups': speedups_require,
+        'compression': compression_require,
     },
     install_requires=requires,
     entry_points={
@@ -56,6 +69,9 @@ setup(
         ],
         'console_scripts': [
             'initialize_matakuliah_app_db=matakuliah_app.scripts.initialize_db:main',
+            'import_matakuliah_app_data=matakuliah_app.scripts.import_matakuliah:main',
+            'generate_matakuliah_app_data=matakuliah_app.scripts.generate_matakuliah:main',
+            'build_matakuliah_app_view_manifest=matakuliah_app.scripts.build_view_manifest:main',
         ],
     },
 )
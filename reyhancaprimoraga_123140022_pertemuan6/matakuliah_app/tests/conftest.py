@@ -6,14 +6,42 @@ from pyramid.paster import get_appsettings
 from pyramid.scripting import prepare
 from pyramid.testing import DummyRequest, testConfig
 import pytest
+from sqlalchemy import delete
 import transaction
 import webtest
+from webob import Request
+import zope.sqlalchemy
 
 from matakuliah_app import main
 from matakuliah_app import models
 from matakuliah_app.models.meta import Base
 
 
+def add_matakuliah(dbsession, count):
+    """
+    Add ``count`` matakuliah rows (IF001, IF002, ...) and flush them.
+
+    Returns the new objects, so tests can use their ids.
+
+    """
+    matakuliah = [
+        models.Matakuliah(
+            kode_mk=f'IF{i:03d}', nama_mk=f'Matakuliah {i}', sks=3, semester=1
+        )
+        for i in range(1, count + 1)
+    ]
+    dbsession.add_all(matakuliah)
+    dbsession.flush()
+    return matakuliah
+
+def raw_get(testapp, url, headers=None):
+    # webtest decodes gzip bodies and adds Content-Length; go through webob
+    # directly to see exactly what the app sends
+    request = Request.blank(url, headers=headers or {})
+    request.environ.update(testapp.extra_environ)
+    return request.get_response(testapp.app)
+
+
 def pytest_addoption(parser):
     parser.addoption('--ini', action='store', metavar='INI_FILE')
 
@@ -60,6 +88,25 @@ def tm():
 
     tm.abort()
 
+@pytest.fixture
+def commit_session(app):
+    """
+    A session on its own transaction manager that really commits.
+
+    For code that commits by itself (the import / generate scripts).  Every
+    matakuliah row is deleted afterwards so other tests still start empty.
+
+    """
+    tm = transaction.TransactionManager(explicit=True)
+    session_factory = app.registry['dbsession_factory']
+    dbsession = models.get_tm_session(session_factory, tm)
+
+    yield tm, dbsession
+
+    with tm:
+        dbsession.execute(delete(models.Matakuliah.__table__))
+        zope.sqlalchemy.mark_changed(dbsession)
+
 @pytest.fixture
 def dbsession(app, tm):
     session_factory = app.registry['dbsession_factory']
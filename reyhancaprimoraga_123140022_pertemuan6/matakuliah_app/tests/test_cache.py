@@ -0,0 +1,114 @@
+import pytest
+from sqlalchemy import select
+import webtest
+
+from matakuliah_app import models
+from matakuliah_app.cache import MISSING, LRUCache, _invalidation_subscriber
+from matakuliah_app.models.invalidation import DatabaseInvalidationBus
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_ttl():
+    clock = FakeClock()
+    cache = LRUCache(max_entries=2, ttl=10, clock=clock)
+    cache.put(1, 'a')
+    cache.put(2, 'b')
+    assert cache.get(1) == 'a'      # 1 becomes most recently used
+    cache.put(3, 'c')               # evicts 2
+    assert cache.get(2) is MISSING
+    assert cache.evictions == 1
+
+    clock.now = 11
+    assert cache.get(1) is MISSING
+    assert cache.expirations == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_put_ignored_after_invalidation():
+    cache = LRUCache()
+    generation = cache.generation
+    cache.invalidate([1])
+    assert cache.put(1, 'stale', generation) is False
+    assert cache.get(1) is MISSING
+
+
+@pytest.fixture
+def detail_cache(app):
+    cache = LRUCache(max_entries=10, ttl=60)
+    bus = app.registry['invalidation_bus']
+    subscriber = _invalidation_subscriber(cache)
+    app.registry['matakuliah_cache'] = cache
+    bus.subscribe('matakuliah', subscriber)
+    yield cache
+    bus.unsubscribe('matakuliah', subscriber)
+    del app.registry['matakuliah_cache']
+
+
+def test_detail_served_from_cache(app, commit_session, detail_cache):
+    tm, dbsession = commit_session
+    with tm:
+        matakuliah = models.Matakuliah(
+            kode_mk='IF101', nama_mk='Algoritma', sks=3, semester=1
+        )
+        dbsession.add(matakuliah)
+        dbsession.flush()
+        url = f'/api/matakuliah/{matakuliah.id}'
+
+    # no tm.active / app.dbsession hooks: writes really commit, which is
+    # when invalidations are published
+    testapp = webtest.TestApp(app, extra_environ={'HTTP_HOST': 'example.com'})
+    testapp.get(url, status=200)
+    res = testapp.get(url, status=200)
+    assert res.json['data']['matakuliah']['kode_mk'] == 'IF101'
+    assert detail_cache.stats()['hits'] == 1
+
+    # a committed update through the API evicts the entry ...
+    testapp.put_json(url, {'sks': 4}, status=200)
+    assert len(detail_cache) == 0
+
+    # ... so the next GET reads (and caches) the new data
+    res = testapp.get(url, status=200)
+    assert res.json['data']['matakuliah']['sks'] == 4
+    assert detail_cache.stats()['hits'] == 1
+    assert len(detail_cache) == 1
+
+
+def test_database_bus_delivers_committed_changes(app, dbengine):
+    writer_bus = DatabaseInvalidationBus(poll_interval=0)
+    reader_bus = DatabaseInvalidationBus(poll_interval=0)
+    received = []
+    reader_bus.subscribe('matakuliah', received.append)
+
+    writer = models.get_session_factory(dbengine, writer_bus)()
+    reader = models.get_session_factory(dbengine, reader_bus)()
+    try:
+        reader.execute(select(1))     # first poll only records the cursor
+        reader.rollback()
+
+        matakuliah = models.Matakuliah(
+            kode_mk='BUS1', nama_mk='Bus', sks=2, semester=1
+        )
+        writer.add(matakuliah)
+        writer.commit()
+        reader.execute(select(1))
+        reader.rollback()
+        assert received == [{str(matakuliah.id)}]
+
+        # set-based writes invalidate the whole table
+        table = models.Matakuliah.__table__
+        writer.execute(table.delete().where(table.c.kode_mk == 'BUS1'))
+        writer.commit()
+        reader.execute(select(1))
+        assert received[-1] is None
+    finally:
+        reader.close()
+        writer.execute(models.CacheInvalidation.__table__.delete())
+        writer.commit()
+        writer.close()
@@ -0,0 +1,109 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from webob import Request
+
+from matakuliah_app.compression import ENCODERS, CompressionPolicy
+
+from .conftest import add_matakuliah, raw_get
+
+
+def _data(body):
+    # the envelope carries a timestamp; compare the payload only
+    return json.loads(body)['data']
+
+
+def _counter(testapp, name, labels):
+    metric = testapp.app.registry['metrics'].get(name)
+    return metric.collect().get(labels, 0) if metric is not None else 0
+
+
+def test_negotiate_prefers_server_order_on_equal_q():
+    policy = CompressionPolicy({'matakuliah.compression.encodings': 'gzip'})
+    assert policy.encodings == ['gzip']
+    request = Request.blank('/', headers={'Accept-Encoding': 'br, gzip'})
+    assert policy.negotiate(request) == 'gzip'
+    request = Request.blank('/', headers={'Accept-Encoding': 'identity'})
+    assert policy.negotiate(request) is None
+    # no header at all: never compress
+    assert policy.negotiate(Request.blank('/')) is None
+
+
+def test_gzip_buffered_response(testapp, dbsession):
+    add_matakuliah(dbsession, 40)
+    before = _counter(testapp, 'matakuliah_compression_responses_total',
+                      ('gzip', 'buffered'))
+    plain = raw_get(testapp, '/api/matakuliah?limit=40')
+    res = raw_get(testapp, '/api/matakuliah?limit=40',
+                   {'Accept-Encoding': 'gzip'})
+    assert plain.content_encoding is None
+    assert res.content_encoding == 'gzip'
+    assert 'Accept-Encoding' in res.vary
+    assert res.content_length == len(res.body) < len(plain.body)
+    assert _data(gzip.decompress(res.body)) == _data(plain.body)
+    # compressed bytes differ, so the ETag is weak but still revalidates
+    assert res.headers['ETag'] == 'W/' + plain.headers['ETag']
+    not_modified = raw_get(testapp, '/api/matakuliah?limit=40', {
+        'Accept-Encoding': 'gzip', 'If-None-Match': res.headers['ETag'],
+    })
+    assert not_modified.status_code == 304
+    assert not_modified.headers['ETag'] == res.headers['ETag']
+
+    after = _counter(testapp, 'matakuliah_compression_responses_total',
+                     ('gzip', 'buffered'))
+    assert after == before + 1
+    saved = _counter(testapp, 'matakuliah_compression_saved_bytes_total',
+                     ('gzip',))
+    assert saved > 0
+
+
+def test_small_response_not_compressed(testapp, dbsession):
+    matakuliah, = add_matakuliah(dbsession, 1)
+    res = raw_get(testapp, f'/api/matakuliah/{matakuliah.id}',
+                  {'Accept-Encoding': 'gzip'})
+    assert res.status_code == 200
+    assert res.content_encoding is None
+    assert 'Accept-Encoding' in res.vary
+
+
+def test_streaming_response_compressed_incrementally(testapp, dbsession):
+    add_matakuliah(dbsession, 40)
+    plain = raw_get(testapp, '/api/matakuliah?stream=1')
+    res = raw_get(testapp, '/api/matakuliah?stream=1',
+                   {'Accept-Encoding': 'gzip'})
+    assert res.content_encoding == 'gzip'
+    assert res.content_length is None
+    chunks = list(res.app_iter)
+    assert len(chunks) > 1
+    # every chunk is sync-flushed, so a prefix already decompresses
+    assert zlib.decompressobj(31).decompress(chunks[0])
+    assert _data(gzip.decompress(b''.join(chunks))) == _data(plain.body)
+
+
+def test_already_encoded_response_untouched(testapp, dbsession):
+    add_matakuliah(dbsession, 40)
+    res = raw_get(testapp, '/api/matakuliah/export',
+                   {'Accept-Encoding': 'gzip'})
+    assert res.content_encoding == 'gzip'
+    # export gzips by itself; the tween must not compress a second time
+    assert gzip.decompress(res.body).startswith(b'id,kode_mk')
+
+
+@pytest.mark.parametrize('encoding', ['br', 'zstd'])
+def test_optional_encodings(testapp, dbsession, encoding):
+    if encoding not in ENCODERS:
+        pytest.skip(f'{encoding} library not installed')
+    add_matakuliah(dbsession, 40)
+    plain = raw_get(testapp, '/api/matakuliah?limit=40')
+    res = raw_get(testapp, '/api/matakuliah?limit=40',
+                   {'Accept-Encoding': f'gzip;q=0.5, {encoding}'})
+    assert res.content_encoding == encoding
+    if encoding == 'br':
+        import brotli
+        body = brotli.decompress(res.body)
+    else:
+        import zstandard
+        body = zstandard.ZstdDecompressor().decompressobj().decompress(res.body)
+    assert _data(body) == _data(plain.body)
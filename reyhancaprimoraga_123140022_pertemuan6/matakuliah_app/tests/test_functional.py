@@ -1,4 +1,7 @@
+import re
+
 from matakuliah_app import models
+from matakuliah_app.assets import fingerprint_path
 
 def test_my_view_success(testapp, dbsession):
     model = models.MyModel(name='one', value=55)
@@ -11,3 +14,22 @@ def test_my_view_success(testapp, dbsession):
 def test_notfound(testapp):
     res = testapp.get('/badurl', status=404)
     assert res.status_code == 404
+
+def test_static_assets_are_fingerprinted(testapp, dbsession):
+    res = testapp.get('/', status=200)
+    css = re.search(r'href="[^"]*(/static/theme\.[0-9a-f]{12}\.css)"',
+                    res.text).group(1)
+
+    res = testapp.get(css, status=200)
+    assert res.content_type == 'text/css'
+    assert res.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+
+    # the plain path keeps the short max-age, an unknown hash is not served
+    res = testapp.get('/static/theme.css', status=200)
+    assert res.headers['Cache-Control'] == 'max-age=3600'
+    testapp.get('/static/theme.000000000000.css', status=404)
+
+def test_fingerprint_path():
+    assert fingerprint_path('css/theme.css', 'abc') == 'css/theme.abc.css'
+    assert fingerprint_path('LICENSE', 'abc') == 'LICENSE.abc'
+    assert fingerprint_path('.hidden', 'abc') == '.hidden.abc'
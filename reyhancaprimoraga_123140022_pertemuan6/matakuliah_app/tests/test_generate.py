@@ -0,0 +1,40 @@
+from collections import Counter
+
+from sqlalchemy import func, select
+
+from matakuliah_app import models
+from matakuliah_app.scripts.generate_matakuliah import (
+    fill_matakuliah,
+    generate_matakuliah,
+)
+
+
+def test_generate_is_deterministic_and_unique():
+    rows = list(generate_matakuliah(5000, seed=3))
+    assert rows == list(generate_matakuliah(5000, seed=3))
+    assert rows != list(generate_matakuliah(5000, seed=4))
+    assert len({row['kode_mk'] for row in rows}) == 5000
+    assert all(row['kode_mk'][2] == str(row['semester']) for row in rows)
+
+
+def test_generate_distributions_are_skewed():
+    rows = list(generate_matakuliah(20000, seed=0))
+    semesters = Counter(row['semester'] for row in rows)
+    sks = Counter(row['sks'] for row in rows)
+    assert semesters[1] > 3 * semesters[8]
+    assert sks.most_common(1)[0][0] == 3
+    assert set(semesters) == set(range(1, 9))
+
+
+def test_fill_matakuliah_commits_in_chunks(commit_session):
+    tm, dbsession = commit_session
+    chunks = []
+    written, _ = fill_matakuliah(
+        tm, dbsession, 250, seed=1, chunk_size=100,
+        on_chunk=lambda written, seconds: chunks.append(written),
+    )
+    assert written == 250
+    assert chunks == [100, 200, 250]
+    with tm:
+        table = models.Matakuliah.__table__
+        assert dbsession.scalar(select(func.count()).select_from(table)) == 250
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
+from matakuliah_app import models
+from matakuliah_app.scripts.import_matakuliah import (
+    Checkpoint,
+    ImportFileError,
+    import_matakuliah,
+    read_csv,
+    read_ndjson,
+)
+
+
+def _kode_mks(tm, dbsession):
+    table = models.Matakuliah.__table__
+    with tm:
+        return list(dbsession.scalars(select(table.c.kode_mk).order_by(table.c.kode_mk)))
+
+
+def test_import_csv_in_chunks(commit_session, tmp_path):
+    tm, dbsession = commit_session
+    path = tmp_path / 'kurikulum.csv'
+    path.write_text(
+        'kode_mk,nama_mk,sks,semester\n'
+        'IF101,Algoritma,3,1\n'
+        'IF102,Struktur Data,x,2\n'
+        'IF103,Basis Data,3,3\n'
+        'IF101,Duplikat,3,1\n'
+        'IF104,Jaringan,2,4\n'
+    )
+    chunks = []
+    with open(path, newline='') as stream:
+        stats = import_matakuliah(
+            tm, dbsession, read_csv(stream), chunk_size=2,
+            on_chunk=lambda stats, rejected: chunks.append((stats, rejected)),
+        )
+
+    assert (stats['records'], stats['imported'], stats['rejected']) == (5, 3, 2)
+    assert len(chunks) == 3
+    # validation error (line 3) and an already committed kode_mk (line 5)
+    assert chunks[0][1] == [{'line': 3, 'errors': {'sks': 'Must be a positive integer'}}]
+    assert chunks[1][1] == [{'line': 5, 'errors': {'kode_mk': 'Already exists'}}]
+    assert _kode_mks(tm, dbsession) == ['IF101', 'IF103', 'IF104']
+
+
+def test_import_resume_and_update(commit_session, tmp_path):
+    tm, dbsession = commit_session
+    path = tmp_path / 'kurikulum.ndjson'
+    path.write_text('\n'.join(json.dumps({
+        'kode_mk': f'IF{i:03d}', 'nama_mk': f'MK {i}', 'sks': 3, 'semester': 1,
+    }) for i in range(1, 6)) + '\n')
+    checkpoint = Checkpoint(str(tmp_path / 'kurikulum.checkpoint'), str(path))
+    checkpoint.save(records=3, imported=3, rejected=0)
+
+    with open(path) as stream:
+        stats = import_matakuliah(
+            tm, dbsession, read_ndjson(stream), chunk_size=10,
+            on_conflict='update', start=checkpoint.load(),
+        )
+    # the first three committed records are skipped, not re-imported
+    assert (stats['records'], stats['imported']) == (5, 5)
+    assert _kode_mks(tm, dbsession) == ['IF004', 'IF005']
+
+    path.write_text('{}\n')
+    with pytest.raises(ImportFileError):
+        checkpoint.load()
@@ -0,0 +1,505 @@
+import csv
+import gzip
+import io
+import json
+
+from sqlalchemy import event, select, text
+
+from matakuliah_app import models
+from matakuliah_app.filters import build_criteria, order_by_clauses
+from matakuliah_app.pagination import decode_cursor, encode_cursor
+
+from .conftest import add_matakuliah, raw_get
+
+
+def test_cursor_roundtrip():
+    token = encode_cursor({'id': 42})
+    assert '=' not in token
+    assert decode_cursor(token) == {'id': 42}
+
+
+def test_list_keyset_pagination(testapp, dbsession):
+    add_matakuliah(dbsession, 5)
+
+    res = testapp.get('/api/matakuliah', params={'limit': 2}, status=200)
+    data = json.loads(res.text)['data']
+    assert [m['kode_mk'] for m in data['matakuliahs']] == ['IF001', 'IF002']
+    assert data['limit'] == 2
+
+    kode_mks = [m['kode_mk'] for m in data['matakuliahs']]
+    while data['next_cursor']:
+        res = testapp.get('/api/matakuliah', params={
+            'limit': 2, 'after': data['next_cursor']
+        }, status=200)
+        data = json.loads(res.text)['data']
+        kode_mks.extend(m['kode_mk'] for m in data['matakuliahs'])
+    assert kode_mks == ['IF001', 'IF002', 'IF003', 'IF004', 'IF005']
+
+
+def test_list_limit_capped_to_max_page_size(testapp, dbsession):
+    add_matakuliah(dbsession, 3)
+
+    res = testapp.get('/api/matakuliah', params={'limit': 10**6}, status=200)
+    assert json.loads(res.text)['data']['limit'] == 500
+
+
+def test_list_invalid_pagination_params(testapp):
+    testapp.get('/api/matakuliah', params={'limit': 0}, status=400)
+    testapp.get('/api/matakuliah', params={'after': 'not-a-cursor'}, status=400)
+
+
+def test_list_cursor_with_non_scalar_sort_key(testapp):
+    for key in ([1], {'x': 1}, True):
+        cursor = encode_cursor({'s': 'nama_mk', 'k': key, 'id': 1})
+        testapp.get('/api/matakuliah', params={
+            'sort': 'nama_mk', 'after': cursor,
+        }, status=400)
+
+
+def _add_mixed_matakuliah(dbsession):
+    for kode_mk, sks, semester in [
+        ('IF201', 3, 2), ('IF101', 2, 1), ('IF102', 4, 1),
+        ('MA101', 3, 1), ('IF103', 3, 1),
+    ]:
+        dbsession.add(models.Matakuliah(
+            kode_mk=kode_mk, nama_mk=kode_mk, sks=sks, semester=semester
+        ))
+    dbsession.flush()
+
+
+def test_list_filter_and_sort_with_keyset(testapp, dbsession):
+    _add_mixed_matakuliah(dbsession)
+    params = {
+        'semester': 1, 'kode_mk_prefix': 'IF', 'sks_min': 3,
+        'sort': '-kode_mk', 'limit': 1,
+    }
+
+    kode_mks = []
+    while True:
+        data = testapp.get('/api/matakuliah', params=params).json['data']
+        kode_mks.extend(m['kode_mk'] for m in data['matakuliahs'])
+        if not data['next_cursor']:
+            break
+        params['after'] = data['next_cursor']
+    assert kode_mks == ['IF103', 'IF102']
+
+    # a cursor is only valid for the sort it was issued for
+    testapp.get('/api/matakuliah', params={
+        'sort': 'kode_mk', 'after': params['after'],
+    }, status=400)
+
+
+def test_list_invalid_filter_params(testapp):
+    testapp.get('/api/matakuliah', params={'sks_min': 'x'}, status=400)
+    testapp.get('/api/matakuliah', params={'sort': 'password'}, status=400)
+
+
+def test_filtered_list_uses_index(dbsession):
+    table = models.Matakuliah.__table__
+    stmt = (
+        select(table)
+        .where(*build_criteria(table, {'semester': 1, 'kode_mk_prefix': 'IF'}))
+        .order_by(*order_by_clauses(table, ('kode_mk', False)))
+    )
+    compiled = stmt.compile(
+        dialect=dbsession.get_bind().dialect,
+        compile_kwargs={'literal_binds': True},
+    )
+    plan = ' '.join(
+        row[-1] for row in dbsession.execute(text(f'EXPLAIN QUERY PLAN {compiled}'))
+    )
+    assert 'ix_matakuliah_semester_kode_mk' in plan
+    assert 'SCAN matakuliah' not in plan.replace('USING INDEX', '')
+
+
+def test_list_sparse_fieldset(testapp, dbsession):
+    _add_mixed_matakuliah(dbsession)
+
+    res = testapp.get('/api/matakuliah', params={
+        'fields': 'nama_mk,kode_mk', 'sort': 'sks', 'limit': 2,
+    })
+    data = res.json['data']
+    assert data['matakuliahs'] == [
+        {'nama_mk': 'IF101', 'kode_mk': 'IF101'},
+        {'nama_mk': 'IF201', 'kode_mk': 'IF201'},
+    ]
+    # the cursor still works although id / sks were not requested
+    res = testapp.get('/api/matakuliah', params={
+        'fields': 'kode_mk', 'sort': 'sks', 'after': data['next_cursor'],
+    })
+    assert [m['kode_mk'] for m in res.json['data']['matakuliahs']] == [
+        'MA101', 'IF103', 'IF102'
+    ]
+
+    res = testapp.get('/api/matakuliah', params={
+        'fields': 'kode_mk', 'stream': '1', 'semester': 2,
+    })
+    assert res.json['data']['matakuliahs'] == [{'kode_mk': 'IF201'}]
+
+
+def test_detail_sparse_fieldset(testapp, dbsession):
+    add_matakuliah(dbsession, 1)
+    matakuliah = dbsession.query(models.Matakuliah).one()
+
+    res = testapp.get(f'/api/matakuliah/{matakuliah.id}', params={'fields': 'sks'})
+    assert res.json['data']['matakuliah'] == {'sks': 3}
+    testapp.get('/api/matakuliah/999999', params={'fields': 'sks'}, status=404)
+    res = testapp.get(f'/api/matakuliah/{matakuliah.id}', params={
+        'fields': 'sks,secret'
+    }, status=400)
+    assert 'secret' in res.json['errors']['fields']
+    testapp.get('/api/matakuliah', params={'fields': ','}, status=400)
+
+
+def test_list_stream_mode(testapp, dbsession):
+    add_matakuliah(dbsession, 3)
+
+    res = testapp.get('/api/matakuliah', params={'stream': '1'}, status=200)
+    assert res.content_type == 'application/json'
+    body = json.loads(res.text)
+    assert body['success'] is True
+    assert body['data']['total'] == 3
+    assert [m['kode_mk'] for m in body['data']['matakuliahs']] == [
+        'IF001', 'IF002', 'IF003'
+    ]
+
+
+def test_list_stream_mode_empty(testapp):
+    res = testapp.get('/api/matakuliah', params={'stream': '1'}, status=200)
+    body = json.loads(res.text)
+    assert body['data'] == {'matakuliahs': [], 'total': 0}
+
+
+def test_json_renderer_compact_by_default(testapp, dbsession):
+    add_matakuliah(dbsession, 1)
+
+    res = testapp.get('/api/matakuliah/1', status=200)
+    assert res.content_type == 'application/json'
+    assert '\n' not in res.text
+    assert res.json['data']['matakuliah']['kode_mk'] == 'IF001'
+    assert 'render;dur=' in res.headers['Server-Timing']
+
+
+def test_json_renderer_pretty_on_request(testapp, dbsession):
+    add_matakuliah(dbsession, 1)
+
+    res = testapp.get('/api/matakuliah/1', params={'pretty': '1'}, status=200)
+    assert res.text.startswith('{\n  "code": 200')
+
+    res = testapp.get('/api/matakuliah/1', headers={
+        'Accept': 'application/json; indent=2'
+    }, status=200)
+    assert res.text.startswith('{\n  "code": 200')
+
+
+def test_json_render_time_recorded(testapp, app):
+    testapp.get('/api/matakuliah', status=200)
+
+    histogram = app.registry['metrics'].get('matakuliah_json_render_seconds')
+    assert sum(count for _, _, count in histogram.collect().values()) >= 1
+
+
+def test_create_validation_uses_shared_rules(testapp):
+    res = testapp.post_json('/api/matakuliah', {'kode_mk': 'IF001'}, status=400)
+    assert res.json['errors'] == {'missing_fields': ['nama_mk', 'sks', 'semester']}
+
+    res = testapp.post_json('/api/matakuliah', {
+        'kode_mk': 'IF001', 'nama_mk': 'A', 'sks': 0, 'semester': 'x'
+    }, status=400)
+    assert res.json['errors'] == {
+        'sks': 'Must be a positive integer',
+        'semester': 'Must be a positive integer',
+    }
+
+
+def test_bulk_create_all_succeed(testapp, dbsession):
+    items = [
+        {'kode_mk': f'BK{i}', 'nama_mk': f'Bulk {i}', 'sks': 2, 'semester': 1}
+        for i in range(3)
+    ]
+    res = testapp.post_json('/api/matakuliah/_bulk', items, status=201)
+    data = res.json['data']
+    assert data['created'] == 3
+    assert [r['status'] for r in data['results']] == [201, 201, 201]
+
+    ids = [r['id'] for r in data['results']]
+    rows = dbsession.query(models.Matakuliah).filter(
+        models.Matakuliah.id.in_(ids)
+    ).order_by(models.Matakuliah.id).all()
+    assert [m.kode_mk for m in rows] == ['BK0', 'BK1', 'BK2']
+
+
+def test_bulk_create_partial_failure(testapp, dbsession):
+    add_matakuliah(dbsession, 1)
+    body = '\n'.join([
+        json.dumps({'kode_mk': 'NEW1', 'nama_mk': 'Baru', 'sks': 3, 'semester': 2}),
+        json.dumps({'kode_mk': 'IF001', 'nama_mk': 'Lama', 'sks': 3, 'semester': 1}),
+        '{not json',
+        json.dumps({'kode_mk': 'NEW1', 'nama_mk': 'Dobel', 'sks': 3, 'semester': 2}),
+        json.dumps({'kode_mk': 'NEW2', 'sks': 3}),
+    ])
+    res = testapp.post('/api/matakuliah/_bulk', body, headers={
+        'Content-Type': 'application/x-ndjson'
+    }, status=207)
+    data = res.json['data']
+    assert data['created'] == 1
+    assert data['failed'] == 4
+    assert [r['status'] for r in data['results']] == [201, 409, 400, 409, 400]
+
+
+def test_bulk_create_rejects_non_array(testapp):
+    testapp.post_json('/api/matakuliah/_bulk', {'kode_mk': 'X'}, status=400)
+
+
+def _semesters(dbsession):
+    table = models.Matakuliah.__table__
+    rows = dbsession.execute(table.select().order_by(table.c.id)).mappings()
+    return {row['kode_mk']: row['semester'] for row in rows}
+
+
+def test_bulk_update_by_filter(testapp, dbsession):
+    add_matakuliah(dbsession, 2)
+    dbsession.add(models.Matakuliah(
+        kode_mk='IF900', nama_mk='Lain', sks=2, semester=3
+    ))
+    dbsession.flush()
+
+    res = testapp.patch_json('/api/matakuliah/_bulk', {
+        'filter': {'semester': 1}, 'set': {'semester': 2}, 'returning': True
+    }, status=200)
+    data = res.json['data']
+    assert data['updated'] == 2
+    assert [m['kode_mk'] for m in data['matakuliahs']] == ['IF001', 'IF002']
+    assert _semesters(dbsession) == {'IF001': 2, 'IF002': 2, 'IF900': 3}
+
+
+def test_bulk_update_rejects_bad_requests(testapp):
+    testapp.patch_json('/api/matakuliah/_bulk', {
+        'set': {'semester': 2}
+    }, status=400)
+    testapp.patch_json('/api/matakuliah/_bulk', {
+        'ids': [1], 'set': {'kode_mk': 'X'}
+    }, status=400)
+    testapp.patch_json('/api/matakuliah/_bulk', {
+        'filter': {'semester': 1}, 'set': {'sks': -1}
+    }, status=400)
+    testapp.patch_json('/api/matakuliah/_bulk', {
+        'filter': {'unknown': 1}, 'set': {'sks': 2}
+    }, status=400)
+    # JSON floats are not truncated to a different filter value
+    testapp.patch_json('/api/matakuliah/_bulk', {
+        'filter': {'sks': 2.9}, 'set': {'semester': 2}
+    }, status=400)
+    testapp.patch_json('/api/matakuliah/_bulk', {
+        'filter': {'semester': [1]}, 'set': {'sks': 2}
+    }, status=400)
+
+
+def test_bulk_delete_by_ids(testapp, dbsession):
+    add_matakuliah(dbsession, 3)
+    ids = [m.id for m in dbsession.query(models.Matakuliah).filter(
+        models.Matakuliah.kode_mk.in_(['IF001', 'IF003'])
+    )]
+
+    res = testapp.delete_json('/api/matakuliah/_bulk', {'ids': ids}, status=200)
+    assert res.json['data'] == {'deleted': 2}
+    assert _semesters(dbsession) == {'IF002': 1}
+
+
+def test_conditional_get_returns_304(testapp, dbsession):
+    add_matakuliah(dbsession, 1)
+
+    for url in ('/api/matakuliah', '/api/matakuliah/1'):
+        res = testapp.get(url, status=200)
+        etag = res.headers['ETag']
+        res = testapp.get(url, headers={'If-None-Match': etag}, status=304)
+        assert res.headers['ETag'] == etag
+        assert not res.body
+
+    list_etag = testapp.get('/api/matakuliah').headers['ETag']
+    assert testapp.get('/api/matakuliah?limit=1').headers['ETag'] != list_etag
+    assert testapp.get('/api/matakuliah?pretty=1').headers['ETag'] != list_etag
+
+
+def test_table_version_bumped_on_commit(app):
+    session = app.registry['dbsession_factory']()
+    try:
+        before = models.get_table_version(session, 'matakuliah')
+        session.add(models.Matakuliah(
+            kode_mk='VER1', nama_mk='Versi', sks=1, semester=1
+        ))
+        session.commit()
+        assert models.get_table_version(session, 'matakuliah') == before + 1
+
+        table = models.Matakuliah.__table__
+        session.execute(table.delete().where(table.c.kode_mk == 'VER1'))
+        session.commit()
+        assert models.get_table_version(session, 'matakuliah') == before + 2
+
+        # pure reads never bump the counter
+        session.query(models.Matakuliah).all()
+        session.commit()
+        assert models.get_table_version(session, 'matakuliah') == before + 2
+    finally:
+        session.close()
+
+
+def _count_statements(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if 'matakuliah ' in statement or statement.endswith('matakuliah'):
+            statements.append(statement.split()[0].upper())
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    return statements, lambda: event.remove(
+        engine, 'before_cursor_execute', before_cursor_execute
+    )
+
+
+def test_patch_and_delete_single_statement(testapp, dbsession, dbengine):
+    add_matakuliah(dbsession, 2)
+    first, second = dbsession.query(models.Matakuliah).order_by(models.Matakuliah.id)
+    dbsession.info.pop('changed_keys')
+
+    statements, stop = _count_statements(dbengine)
+    try:
+        res = testapp.patch_json(f'/api/matakuliah/{first.id}', {'sks': 6})
+        assert res.json['data']['matakuliah']['sks'] == 6
+        res = testapp.delete(f'/api/matakuliah/{second.id}')
+        assert res.json['data']['deleted_matakuliah']['kode_mk'] == 'IF002'
+    finally:
+        stop()
+    assert statements == ['UPDATE', 'DELETE']
+    # only the touched rows are invalidated, not the whole table
+    assert dbsession.info['changed_keys'] == {
+        'matakuliah': {str(first.id), str(second.id)}
+    }
+
+    testapp.patch_json('/api/matakuliah/999999', {'sks': 2}, status=404)
+    testapp.delete('/api/matakuliah/999999', status=404)
+
+
+def test_patch_validation_and_conflict(testapp, dbsession):
+    add_matakuliah(dbsession, 2)
+    first = dbsession.query(models.Matakuliah).filter_by(kode_mk='IF001').one()
+    url = f'/api/matakuliah/{first.id}'
+
+    res = testapp.patch_json(url, {'sks': 0}, status=400)
+    assert res.json['errors'] == {'sks': 'Must be a positive integer'}
+    testapp.patch_json(url, {'id': 5}, status=400)
+    testapp.patch_json(url, {'kode_mk': 'IF002'}, status=409)
+
+
+def test_patch_and_delete_fallback_without_returning(
+        testapp, dbsession, dbengine, monkeypatch):
+    monkeypatch.setattr(dbengine.dialect, 'update_returning', False)
+    monkeypatch.setattr(dbengine.dialect, 'delete_returning', False)
+    add_matakuliah(dbsession, 1)
+    matakuliah = dbsession.query(models.Matakuliah).one()
+    url = f'/api/matakuliah/{matakuliah.id}'
+
+    res = testapp.patch_json(url, {'nama_mk': 'Baru'})
+    assert res.json['data']['matakuliah']['nama_mk'] == 'Baru'
+    res = testapp.delete(url)
+    assert res.json['data']['deleted_matakuliah']['nama_mk'] == 'Baru'
+    testapp.delete(url, status=404)
+
+
+def test_upsert_by_kode_inserts_then_updates(testapp, dbsession, dbengine):
+    add_matakuliah(dbsession, 1)
+    existing = dbsession.query(models.Matakuliah).one()
+    dbsession.info.pop('changed_keys', None)
+
+    statements, stop = _count_statements(dbengine)
+    try:
+        res = testapp.put_json('/api/matakuliah/by-kode/IF001', {
+            'nama_mk': 'Algoritma', 'sks': 4, 'semester': 2,
+        })
+        assert res.json['data']['matakuliah']['id'] == existing.id
+        assert res.json['data']['matakuliah']['sks'] == 4
+        res = testapp.put_json('/api/matakuliah/by-kode/IF900', {
+            'kode_mk': 'IF900', 'nama_mk': 'Baru', 'sks': 2, 'semester': 1,
+        })
+        new_id = res.json['data']['matakuliah']['id']
+    finally:
+        stop()
+    # one INSERT ... ON CONFLICT per request, no SELECT beforehand
+    assert statements == ['INSERT', 'INSERT']
+    assert dbsession.info['changed_keys'] == {'matakuliah': {existing.id, new_id}}
+    assert dbsession.query(models.Matakuliah).count() == 2
+
+
+def test_upsert_by_kode_validation(testapp, dbsession):
+    res = testapp.put_json('/api/matakuliah/by-kode/IF001', {
+        'kode_mk': 'IF002', 'nama_mk': 'X', 'sks': 3, 'semester': 1,
+    }, status=400)
+    assert 'kode_mk' in res.json['errors']
+    res = testapp.put_json('/api/matakuliah/by-kode/IF001', {
+        'nama_mk': 'X', 'sks': 0, 'semester': 1,
+    }, status=400)
+    assert 'sks' in res.json['errors']
+
+
+def test_bulk_upsert_by_kode(testapp, dbsession, dbengine):
+    add_matakuliah(dbsession, 2)
+    testapp.app.registry.settings['matakuliah.bulk_batch_size'] = '2'
+    items = [
+        {'kode_mk': f'IF{i:03d}', 'nama_mk': f'Sync {i}', 'sks': 2, 'semester': 5}
+        for i in range(1, 5)
+    ]
+    items += [{'kode_mk': 'IF001', 'nama_mk': 'Dup', 'sks': 2, 'semester': 5},
+              {'kode_mk': 'IF009'}]
+
+    statements, stop = _count_statements(dbengine)
+    try:
+        res = testapp.put_json('/api/matakuliah/by-kode', items, status=207)
+    finally:
+        stop()
+        del testapp.app.registry.settings['matakuliah.bulk_batch_size']
+    data = res.json['data']
+    assert (data['upserted'], data['failed']) == (4, 2)
+    assert [r['status'] for r in data['results']] == [200, 200, 200, 200, 409, 400]
+    # 4 valid rows in batches of 2
+    assert statements == ['INSERT', 'INSERT']
+
+    rows = dbsession.execute(
+        select(models.Matakuliah.kode_mk, models.Matakuliah.nama_mk)
+        .order_by(models.Matakuliah.kode_mk)
+    ).all()
+    assert [tuple(r) for r in rows] == [
+        ('IF001', 'Sync 1'), ('IF002', 'Sync 2'),
+        ('IF003', 'Sync 3'), ('IF004', 'Sync 4'),
+    ]
+
+
+def test_export_csv(testapp, dbsession):
+    add_matakuliah(dbsession, 3)
+    res = raw_get(testapp, '/api/matakuliah/export?sort=-kode_mk&fields=kode_mk,nama_mk')
+    assert res.status_code == 200
+    assert res.content_type == 'text/csv'
+    assert 'matakuliah.csv' in res.headers['Content-Disposition']
+    # streamed with chunked transfer, not buffered
+    assert res.content_length is None
+    assert res.content_encoding is None
+    rows = list(csv.reader(io.StringIO(res.text)))
+    assert rows[0] == ['kode_mk', 'nama_mk']
+    assert [r[0] for r in rows[1:]] == ['IF003', 'IF002', 'IF001']
+
+
+def test_export_ndjson_gzip(testapp, dbsession):
+    add_matakuliah(dbsession, 3)
+    res = raw_get(testapp, '/api/matakuliah/export?format=ndjson',
+                   headers={'Accept-Encoding': 'gzip, deflate'})
+    assert res.content_encoding == 'gzip'
+    assert res.content_length is None
+    lines = gzip.decompress(res.body).decode('utf-8').splitlines()
+    assert [json.loads(line)['kode_mk'] for line in lines] == ['IF001', 'IF002', 'IF003']
+
+
+def test_export_invalid_format(testapp):
+    res = testapp.get('/api/matakuliah/export', params={'format': 'xml'}, status=400)
+    assert 'Unknown format' in res.json['errors']['detail']
+    # empty table still yields a valid CSV with a header row
+    res = testapp.get('/api/matakuliah/export', status=200)
+    assert res.text == 'id,kode_mk,nama_mk,sks,semester\n'
@@ -0,0 +1,77 @@
+import threading
+
+from matakuliah_app.metrics import MetricsRegistry, render_text
+
+
+def _sample(text, line_prefix):
+    for line in text.splitlines():
+        if line.startswith(line_prefix + ' '):
+            return float(line.rsplit(' ', 1)[1])
+    return None
+
+
+def test_render_text_format():
+    metrics = MetricsRegistry()
+    metrics.counter('jobs_total', 'Jobs "done"\nso far',
+                    labelnames=('queue',)).inc(3, labels=('a"b',))
+    gauge = metrics.gauge('workers', 'Busy workers')
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    hist = metrics.histogram('size_bytes', 'Sizes', buckets=(10, 100))
+    for value in (5, 50, 500):
+        hist.observe(value)
+    metrics.register_collector(lambda: [
+        ('cache_entries', 'gauge', 'Entries', {(('kind', 'lru'),): 7}),
+    ])
+
+    text = render_text(metrics)
+    assert '# HELP jobs_total Jobs "done"\\nso far' in text
+    assert '# TYPE jobs_total counter' in text
+    assert 'jobs_total{queue="a\\"b"} 3' in text
+    assert 'workers 1' in text
+    assert 'size_bytes_bucket{le="10"} 1' in text
+    assert 'size_bytes_bucket{le="100"} 2' in text
+    assert 'size_bytes_bucket{le="+Inf"} 3' in text
+    assert 'size_bytes_sum 555.0' in text
+    assert 'size_bytes_count 3' in text
+    assert '# TYPE cache_entries gauge' in text
+    assert 'cache_entries{kind="lru"} 7' in text
+
+
+def test_gauge_sums_thread_shards():
+    gauge = MetricsRegistry().gauge('in_progress', 'In progress')
+
+    def work():
+        for _ in range(1000):
+            gauge.inc()
+        for _ in range(400):
+            gauge.dec()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert gauge.collect() == {(): 2400}
+
+
+def test_request_metrics_endpoint(testapp, dbsession):
+    testapp.get('/api/matakuliah', status=200)
+    testapp.get('/api/matakuliah/999', status=404)
+    testapp.get('/no-such-page', status=404)
+
+    res = testapp.get('/metrics', status=200)
+    assert res.headers['Content-Type'] == 'text/plain; version=0.0.4; charset=utf-8'
+    assert res.headers['Cache-Control'] == 'no-store'
+    text = res.text
+
+    collection = 'route="matakuliah_collection",method="GET"'
+    detail = 'route="matakuliah_detail",method="GET"'
+    assert _sample(text, f'matakuliah_http_requests_total{{{collection},status="200"}}') >= 1
+    assert _sample(text, f'matakuliah_http_requests_total{{{detail},status="404"}}') >= 1
+    assert _sample(text, 'matakuliah_http_requests_total{route="none",method="GET",status="404"}') >= 1
+    assert _sample(text, f'matakuliah_http_request_duration_seconds_count{{{collection}}}') >= 1
+    assert _sample(text, f'matakuliah_http_response_size_bytes_count{{{collection}}}') >= 1
+    # the scrape itself is the only request still in progress
+    assert _sample(text, 'matakuliah_http_requests_in_progress{method="GET"}') == 1
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import exc
+
+from matakuliah_app.metrics import MetricsRegistry, render_text
+from matakuliah_app.models import get_engine
+from matakuliah_app.models.pool import (
+    InstrumentedQueuePool,
+    _pool_collector,
+    pool_options,
+)
+
+
+def test_pool_options_profiles():
+    options = pool_options({'sqlalchemy.url': 'postgresql://u:p@db/matakuliah'})
+    assert options['pool_pre_ping'] is True
+    assert options['pool_recycle'] == 1800
+    assert options['poolclass'] is InstrumentedQueuePool
+
+    options = pool_options({
+        'sqlalchemy.url': 'sqlite:///matakuliah.sqlite',
+        'sqlalchemy.pool_size': '8',
+        'sqlalchemy.pool_pre_ping': 'false',
+    })
+    assert options['pool_size'] == 8
+    assert options['pool_pre_ping'] is False
+
+    # in-memory sqlite keeps SQLAlchemy's own pool and ignores INI options
+    # that only QueuePool accepts
+    assert pool_options({'sqlalchemy.url': 'sqlite://'}) == {}
+    engine = get_engine({
+        'sqlalchemy.url': 'sqlite://',
+        'sqlalchemy.max_overflow': '4',
+        'sqlalchemy.pool_timeout': '10',
+    })
+    assert not isinstance(engine.pool, InstrumentedQueuePool)
+    engine.dispose()
+
+
+def test_pool_metrics(tmp_path):
+    engine = get_engine({
+        'sqlalchemy.url': f'sqlite:///{tmp_path}/pool.sqlite',
+        'sqlalchemy.pool_size': '1',
+        'sqlalchemy.max_overflow': '1',
+        'sqlalchemy.pool_timeout': '0.01',
+    })
+    metrics = MetricsRegistry()
+    engine.pool.bind_metrics(metrics)
+    metrics.register_collector(_pool_collector(engine))
+
+    first = engine.connect()
+    second = engine.connect()  # overflow connection
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    text = render_text(metrics)
+    assert 'matakuliah_db_pool_checked_out 2' in text
+    assert 'matakuliah_db_pool_overflow 1' in text
+    assert 'matakuliah_db_pool_size 1' in text
+    assert 'matakuliah_db_pool_overflow_total 1' in text
+    assert 'matakuliah_db_pool_timeouts_total 1' in text
+    assert 'matakuliah_db_pool_wait_seconds_count 3' in text
+
+    first.close()
+    second.close()
+    text = render_text(metrics)
+    assert 'matakuliah_db_pool_checked_out 0' in text
+    # the overflow connection is discarded, the pooled one stays idle
+    assert 'matakuliah_db_pool_idle 1' in text
+
+    # engine.dispose() replaces the pool; metrics keep being recorded
+    engine.dispose()
+    engine.connect().close()
+    assert 'matakuliah_db_pool_wait_seconds_count 4' in render_text(metrics)
+    engine.dispose()
+
+
+def test_pool_metrics_endpoint(testapp):
+    # checks out a connection, so the wait histogram has a sample
+    testapp.get('/api/matakuliah', status=200)
+    text = testapp.get('/metrics', status=200).text
+    assert '# TYPE matakuliah_db_pool_checked_out gauge' in text
+    assert 'matakuliah_db_pool_wait_seconds_count' in text
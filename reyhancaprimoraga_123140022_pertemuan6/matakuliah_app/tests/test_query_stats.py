@@ -0,0 +1,55 @@
+import logging
+import re
+
+from pyramid.testing import DummyRequest
+
+from matakuliah_app.metrics import render_text
+from matakuliah_app.models.query_stats import QueryStats, redact_sql
+
+
+def _db_timing(response):
+    for value in response.headers['Server-Timing'].split(', '):
+        match = re.match(r'db;dur=([\d.]+);desc="(\d+) queries"$', value)
+        if match:
+            return float(match.group(1)), int(match.group(2))
+    return None
+
+
+def test_redact_sql_hides_inline_literals():
+    sql = """SELECT * FROM matakuliah
+             WHERE nama_mk = 'Basis ''Data''' AND sks > 3 AND t1.id = ?
+             LIMIT 10"""
+    assert redact_sql(sql) == (
+        "SELECT * FROM matakuliah WHERE nama_mk = '?' AND sks > ? "
+        "AND t1.id = ? LIMIT ?"
+    )
+
+
+def test_slow_statement_logged_with_route(caplog):
+    request = DummyRequest()
+    request.matched_route = type('Route', (), {'name': 'matakuliah_detail'})()
+    stats = QueryStats(request, slow_threshold=0.1)
+
+    with caplog.at_level(logging.WARNING, 'matakuliah_app.models.query_stats'):
+        stats.record("SELECT * FROM matakuliah WHERE kode_mk = 'IF123'", 0.05)
+        stats.record("SELECT * FROM matakuliah WHERE kode_mk = 'IF123'", 0.25)
+
+    assert (stats.count, stats.slow) == (2, 1)
+    assert abs(stats.duration - 0.3) < 1e-9
+    [record] = caplog.records
+    assert 'route=matakuliah_detail' in record.message
+    assert '250.0 ms' in record.message
+    assert 'IF123' not in record.message
+
+
+def test_server_timing_and_metrics(testapp, dbsession):
+    res = testapp.get('/api/matakuliah', status=200)
+    assert 'render;dur=' in res.headers['Server-Timing']
+    duration, count = _db_timing(res)
+    assert count >= 1
+    assert duration >= 0
+
+    text = render_text(testapp.app.registry['metrics'])
+    assert 'matakuliah_db_statements_per_request_count{route="matakuliah_collection"}' in text
+    assert 'matakuliah_db_request_duration_seconds_count{route="matakuliah_collection"}' in text
+    assert 'matakuliah_db_statement_duration_seconds_count' in text
@@ -0,0 +1,67 @@
+import pytest
+from pyramid.request import Request
+from sqlalchemy import event, update
+import webtest
+
+from matakuliah_app import models
+from matakuliah_app.models.readonly import ReadOnlySessionError, is_readonly_request
+
+
+def _is_readonly(app, method, path):
+    request = Request.blank(path, method=method)
+    request.registry = app.registry
+    return is_readonly_request(request)
+
+
+def test_readonly_routes(app):
+    assert _is_readonly(app, 'GET', '/api/matakuliah')
+    assert _is_readonly(app, 'GET', '/api/matakuliah/1')
+    assert _is_readonly(app, 'HEAD', '/api/matakuliah/1')
+    assert not _is_readonly(app, 'POST', '/api/matakuliah')
+    assert not _is_readonly(app, 'PUT', '/api/matakuliah/1')
+    assert not _is_readonly(app, 'GET', '/api/matakuliah/export')
+    assert not _is_readonly(app, 'GET', '/no-such-page')
+
+
+def test_readonly_get_does_not_commit(app, dbengine, commit_session):
+    tm, dbsession = commit_session
+    with tm:
+        dbsession.add(models.Matakuliah(
+            kode_mk='IF001', nama_mk='Matakuliah 1', sks=3, semester=1,
+        ))
+    with tm:
+        id = dbsession.query(models.Matakuliah).one().id
+
+    commits = []
+    on_commit = lambda connection: commits.append(connection)
+    event.listen(dbengine, 'commit', on_commit)
+    try:
+        # no tm.active / app.dbsession hooks: the real request path
+        testapp = webtest.TestApp(app, extra_environ={'HTTP_HOST': 'example.com'})
+        res = testapp.get('/api/matakuliah', status=200)
+        assert res.json['data']['total'] == 1
+        res = testapp.get(f'/api/matakuliah/{id}', status=200)
+        assert res.json['data']['matakuliah']['kode_mk'] == 'IF001'
+        testapp.get(f'/api/matakuliah/{id}',
+                    headers={'If-None-Match': res.headers['ETag']}, status=304)
+    finally:
+        event.remove(dbengine, 'commit', on_commit)
+    assert commits == []
+    assert dbengine.pool.checkedout() == 0
+
+
+def test_readonly_session_rejects_writes(app):
+    dbsession = app.registry['readonly_session_factory']()
+    try:
+        dbsession.add(models.Matakuliah(
+            kode_mk='IF002', nama_mk='Matakuliah 2', sks=3, semester=1,
+        ))
+        with pytest.raises(ReadOnlySessionError):
+            dbsession.flush()
+        dbsession.expunge_all()
+
+        table = models.Matakuliah.__table__
+        with pytest.raises(ReadOnlySessionError):
+            dbsession.execute(update(table).values(sks=4))
+    finally:
+        dbsession.close()
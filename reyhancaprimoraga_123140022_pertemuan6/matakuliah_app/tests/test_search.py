@@ -0,0 +1,55 @@
+from matakuliah_app import models
+from matakuliah_app.models.search import search_terms
+
+
+def _add_courses(dbsession, names):
+    for i, nama_mk in enumerate(names, 1):
+        dbsession.add(models.Matakuliah(
+            kode_mk=f'SR{i:03d}', nama_mk=nama_mk, sks=3, semester=1
+        ))
+    dbsession.flush()
+
+
+def test_search_terms_are_sanitized():
+    assert search_terms('Algo* "pemrog" OR NEAR(') == ['algo', 'pemrog', 'or', 'near']
+    assert search_terms('  -- ') == []
+
+
+def test_search_ranked_and_paginated(testapp, dbsession):
+    _add_courses(dbsession, [
+        'Struktur Data',
+        'Algoritma dan Pemrograman',
+        'Pemrograman Web',
+        'Pemrograman Pemrograman Lanjut',
+    ])
+
+    params = {'q': 'pemrog', 'limit': 2}
+    res = testapp.get('/api/matakuliah/search', params=params, status=200)
+    data = res.json['data']
+    assert data['total'] == 2
+    assert data['matakuliahs'][0]['nama_mk'] == 'Pemrograman Pemrograman Lanjut'
+    scores = [m['score'] for m in data['matakuliahs']]
+    assert scores == sorted(scores, reverse=True)
+
+    params['after'] = data['next_cursor']
+    data = testapp.get('/api/matakuliah/search', params=params).json['data']
+    assert data['total'] == 1
+    assert data['next_cursor'] is None
+
+
+def test_search_index_follows_updates(testapp, dbsession):
+    _add_courses(dbsession, ['Basis Data'])
+    matakuliah = dbsession.query(models.Matakuliah).one()
+    matakuliah.nama_mk = 'Kecerdasan Buatan'
+    dbsession.flush()
+
+    res = testapp.get('/api/matakuliah/search', params={'q': 'basis'})
+    assert res.json['data']['matakuliahs'] == []
+    res = testapp.get('/api/matakuliah/search', params={'q': 'kecerdasan buat'})
+    assert [m['id'] for m in res.json['data']['matakuliahs']] == [matakuliah.id]
+
+
+def test_search_requires_query(testapp):
+    res = testapp.get('/api/matakuliah/search', params={'q': '***'}, status=400)
+    assert res.json['errors'] == {'q': 'Must contain at least one word'}
+    testapp.get('/api/matakuliah/search', params={'q': 'a', 'after': 'x'}, status=400)
@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import text
+
+from matakuliah_app.models import get_engine
+from matakuliah_app.models.sqlite import sqlite_pragmas
+
+
+def _pragma(engine, name):
+    with engine.connect() as connection:
+        return connection.execute(text(f'PRAGMA {name}')).scalar()
+
+
+def test_pragmas_applied_on_connect(tmp_path):
+    engine = get_engine({
+        'sqlalchemy.url': f'sqlite:///{tmp_path}/wal.sqlite',
+        'matakuliah.sqlite.cache_size': '-2000',
+        'matakuliah.sqlite.mmap_size': '',
+    })
+    try:
+        assert _pragma(engine, 'journal_mode') == 'wal'
+        assert _pragma(engine, 'synchronous') == 1   # NORMAL
+        assert _pragma(engine, 'busy_timeout') == 5000
+        assert _pragma(engine, 'cache_size') == -2000
+        assert _pragma(engine, 'mmap_size') == 0     # empty: SQLite default
+        assert _pragma(engine, 'temp_store') == 2    # MEMORY
+    finally:
+        engine.dispose()
+
+
+def test_pragmas_disabled_or_invalid():
+    assert sqlite_pragmas({'matakuliah.sqlite.pragmas': 'false'}) == []
+    with pytest.raises(ValueError, match='matakuliah.sqlite.synchronous'):
+        sqlite_pragmas({'matakuliah.sqlite.synchronous': 'normal; DROP TABLE x'})
+    with pytest.raises(ValueError, match='matakuliah.sqlite.mmap_size'):
+        sqlite_pragmas({'matakuliah.sqlite.mmap_size': '256MB'})
+
+
+def test_memory_database_untouched():
+    engine = get_engine({'sqlalchemy.url': 'sqlite://'})
+    assert _pragma(engine, 'journal_mode') == 'memory'
+    assert _pragma(engine, 'temp_store') == 0
@@ -0,0 +1,68 @@
+import os
+
+import matakuliah_app
+from matakuliah_app import main
+from matakuliah_app.scripts.build_view_manifest import DEFAULT_OUTPUT, dumps_manifest
+from matakuliah_app.startup import (
+    StartupProfiler,
+    measure_cold_start,
+    record_view_manifest,
+)
+
+
+MANIFEST_SPEC = 'matakuliah_app:view_manifest.json'
+
+# Cold start budget (fresh interpreter: import + main()) in seconds.  Far
+# above the ~1s measured locally so slow CI machines do not flake, but low
+# enough to catch an accidental heavy import or a scan of a large tree.
+STARTUP_BUDGET = float(os.environ.get('MATAKULIAH_STARTUP_BUDGET', '3.0'))
+
+def _views(app):
+    views = []
+    for item in app.registry.introspector.get_category('views'):
+        intr = item['introspectable']
+        view = intr['callable']
+        name = getattr(view, '__qualname__', type(view).__qualname__)
+        views.append((f'{view.__module__}.{name}', intr['route_name'] or '',
+                      str(intr['request_methods'])))
+    return sorted(views)
+
+
+def test_profiler_nests_phases():
+    ticks = iter([0.0, 1.0, 1.5, 3.0])
+    profiler = StartupProfiler(clock=lambda: next(ticks))
+    with profiler.phase('include .models'):
+        with profiler.phase('engine'):
+            pass
+    assert profiler.phases == [[0, 'include .models', 3.0], [1, 'engine', 0.5]]
+    # nested phases are not counted twice
+    assert profiler.total == 3.0
+    assert 'engine' in profiler.report()
+
+
+def test_view_manifest_is_up_to_date():
+    # regenerate with: build_matakuliah_app_view_manifest
+    with open(DEFAULT_OUTPUT) as f:
+        assert f.read() == dumps_manifest(record_view_manifest(matakuliah_app))
+
+
+def test_manifest_registers_same_views_as_scan(app, app_settings, dbengine):
+    manifest_app = main(
+        {}, dbengine=dbengine,
+        **dict(app_settings, **{'matakuliah.views.manifest': MANIFEST_SPEC})
+    )
+    assert _views(manifest_app) == _views(app)
+
+    phases = [p['name'] for p in manifest_app.registry['startup_profile']['phases']]
+    assert 'view manifest' in phases and 'scan' not in phases
+    for name in ('include .models', 'mappers', 'commit'):
+        assert name in phases
+
+
+def test_cold_start_within_budget(app_settings):
+    settings = dict(app_settings, **{
+        'sqlalchemy.url': 'sqlite://',
+        'matakuliah.views.manifest': MANIFEST_SPEC,
+    })
+    report = measure_cold_start(settings)
+    assert report['seconds'] < STARTUP_BUDGET, report